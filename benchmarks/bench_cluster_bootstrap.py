@@ -0,0 +1,142 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Time the bring-up of a local Redis cluster by shard count.
+
+Each round starts ``--shards`` cluster-enabled redis-server processes
+on 127.0.0.1 and times how long it takes to assign the hash slots and
+verify that every shard reports the cluster state as ok. The legacy
+round runs ``redis-cli --cluster create`` and checks the cluster after
+the fixed 5 s sleeps of the previous implementation.
+
+    python benchmarks/bench_cluster_bootstrap.py --shards 3 16 64
+"""
+
+import argparse
+import shutil
+import subprocess
+import tempfile
+import time
+
+from tabulate import tabulate
+
+from smartsim._core.launcher.util.shell import execute_cmd
+from smartsim._core.utils.redis import (
+    _cluster_ok,
+    check_cluster_status,
+    create_cluster,
+    ping_db,
+)
+from smartsim.error import SSInternalError
+
+HOST = "127.0.0.1"
+
+
+def start_shards(redis_server, ports, path):
+    procs = [
+        subprocess.Popen(
+            [redis_server, "--port", str(port), "--bind", HOST]
+            + ["--cluster-enabled", "yes"]
+            + ["--cluster-config-file", f"nodes-{port}.conf"]
+            + ["--save", "", "--appendonly", "no"],
+            cwd=path,
+            stdout=subprocess.DEVNULL,
+        )
+        for port in ports
+    ]
+    while not all(ping_db(HOST, port) for port in ports):
+        time.sleep(0.05)
+    return procs
+
+
+def legacy_bootstrap(redis_cli, ports):
+    cmd = [redis_cli, "--cluster", "create"]
+    cmd += [f"{HOST}:{port}" for port in ports]
+    cmd += ["--cluster-replicas", "0"]
+    returncode, _, err = execute_cmd(cmd, proc_input="yes")
+    if returncode != 0:
+        raise SSInternalError(err)
+    for _ in range(10):
+        time.sleep(5)
+        if all(_cluster_ok(HOST, port) for port in ports):
+            return
+    raise SSInternalError("Cluster setup could not be verified")
+
+
+def bootstrap(ports):
+    create_cluster([HOST], ports)
+    check_cluster_status([HOST], ports)
+
+
+def bring_up(redis_server, ports, setup):
+    with tempfile.TemporaryDirectory() as path:
+        procs = start_shards(redis_server, ports, path)
+        try:
+            start = time.perf_counter()
+            setup(ports)
+            return time.perf_counter() - start
+        finally:
+            for proc in procs:
+                proc.terminate()
+                proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--shards", type=int, nargs="+", default=[3, 16, 64])
+    parser.add_argument("--port", type=int, default=7000)
+    parser.add_argument("--redis-server", default=shutil.which("redis-server"))
+    parser.add_argument("--redis-cli", default=shutil.which("redis-cli"))
+    args = parser.parse_args()
+    if not args.redis_server:
+        parser.error("redis-server not found, pass --redis-server")
+
+    rounds = [("current", bootstrap)]
+    if args.redis_cli:
+        rounds.insert(
+            0, ("legacy", lambda ports: legacy_bootstrap(args.redis_cli, ports))
+        )
+
+    results = []
+    for shards in args.shards:
+        ports = list(range(args.port, args.port + shards))
+        row = [shards]
+        for _, setup in rounds:
+            row.append(bring_up(args.redis_server, ports, setup))
+        if len(rounds) > 1:
+            row.append(row[1] / row[2])
+        results.append(row)
+
+    headers = ["Shards"] + [f"{name} (s)" for name, _ in rounds]
+    if len(rounds) > 1:
+        headers.append("Speedup")
+    print(tabulate(results, headers, tablefmt="github", floatfmt=".3f"))
+
+
+if __name__ == "__main__":
+    main()
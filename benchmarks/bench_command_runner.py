@@ -0,0 +1,88 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Time scheduler queries through ``execute_cmd`` as the driver grows.
+
+Each round inflates the driver's resident memory by ``--sizes`` MiB
+of touched ballast and then runs ``--queries`` short ``true`` commands,
+once forking from the driver and once through the persistent command
+runner started before the ballast was allocated.
+
+    python benchmarks/bench_command_runner.py --sizes 0 512 2048
+"""
+
+import argparse
+import time
+
+from tabulate import tabulate
+
+from smartsim._core.launcher.util import shell
+from smartsim._core.launcher.util.commandRunner import CommandRunner
+
+PAGE = 4096
+
+
+def allocate(size):
+    ballast = bytearray(size * 1024 * 1024)
+    for i in range(0, len(ballast), PAGE):
+        ballast[i] = 1
+    return ballast
+
+
+def query_latency(queries):
+    start = time.perf_counter()
+    for _ in range(queries):
+        shell.execute_cmd(["true"])
+    return (time.perf_counter() - start) / queries * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 512, 2048])
+    parser.add_argument("--queries", type=int, default=100)
+    args = parser.parse_args()
+
+    runner = CommandRunner()
+    runner.start()
+    results = []
+    for size in args.sizes:
+        ballast = allocate(size)
+        shell.command_runner = None
+        direct = query_latency(args.queries)
+        shell.command_runner = runner
+        helper = query_latency(args.queries)
+        results.append([size, direct, helper, direct / helper])
+        del ballast
+    runner.stop()
+
+    headers = ["Ballast (MiB)", "Direct (ms)", "Runner (ms)", "Speedup"]
+    print(tabulate(results, headers, tablefmt="github", floatfmt=".3f"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Time launching a large ensemble through the Controller.
+
+Every member of a synthetic ensemble is launched with the local
+launcher for an increasing number of launch workers. By default
+``launcher.run`` is replaced by a call that sleeps for ``--latency``
+seconds, standing in for the submission of a step to a workload
+manager. With ``--processes`` members are really started as
+``true`` processes instead.
+
+    python benchmarks/bench_concurrent_launch.py --members 1000 --workers 1 4 16
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from tabulate import tabulate
+
+from smartsim._core.control import Controller
+from smartsim._core.control.manifest import Manifest
+from smartsim.entity import Ensemble
+from smartsim.settings import RunSettings
+
+
+def launch(members, workers, latency, processes, path):
+    os.environ["SMARTSIM_LAUNCH_WORKERS"] = str(workers)
+    controller = Controller(launcher="local")
+    launcher = controller._launcher
+    if not processes:
+
+        def run(step):
+            time.sleep(latency)
+            return step.name
+
+        launcher.run = run
+
+    ensemble = Ensemble("ens", {}, run_settings=RunSettings("true"), replicas=members)
+    ensemble.set_path(path)
+
+    start = time.perf_counter()
+    controller._launch(Manifest(ensemble))
+    elapsed = time.perf_counter() - start
+
+    if processes:
+        for step_map in launcher.step_mapping.mapping.values():
+            launcher.task_manager.remove_task(step_map.task_id)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--processes", action="store_true")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as path:
+        for workers in args.workers:
+            elapsed = launch(args.members, workers, args.latency, args.processes, path)
+            results.append([workers, elapsed, args.members / elapsed])
+
+    baseline = results[0][1]
+    for row in results:
+        row.append(baseline / row[1])
+    headers = ["Workers", "Launch time (s)", "Launches/s", "Speedup"]
+    print(tabulate(results, headers, tablefmt="github", floatfmt=".3f"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Time launching local tasks through ``LocalLauncher.run``.
+
+Each round starts ``--tasks`` short ``true`` processes one after
+another and reports the launch throughput. The legacy round waits
+a fixed 200 ms after each spawn to catch commands that fail
+immediately, as ``execute_async_cmd`` used to.
+
+    python benchmarks/bench_local_launch.py --tasks 50
+"""
+
+import argparse
+import tempfile
+import time
+
+from tabulate import tabulate
+
+from smartsim._core.launcher import LocalLauncher, taskManager
+from smartsim._core.launcher.util.shell import execute_async_cmd
+from smartsim.error import ShellError
+from smartsim.settings import RunSettings
+
+
+def legacy_execute_async_cmd(cmd_list, cwd, env=None, out=None, err=None):
+    popen_obj = execute_async_cmd(cmd_list, cwd, env=env, out=out, err=err)
+    time.sleep(0.2)
+    popen_obj.poll()
+    if not popen_obj.is_running() and popen_obj.returncode != 0:
+        raise ShellError("Command failed immediately", "", cmd_list)
+    return popen_obj
+
+
+def launch(tasks, path):
+    launcher = LocalLauncher()
+    settings = RunSettings("true")
+    steps = [launcher.create_step(f"task_{i}", path, settings) for i in range(tasks)]
+
+    start = time.perf_counter()
+    for step in steps:
+        launcher.run(step)
+    elapsed = time.perf_counter() - start
+
+    for step_map in launcher.step_mapping.mapping.values():
+        launcher.task_manager.remove_task(step_map.task_id)
+    launcher.task_manager.actively_monitoring = False
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=50)
+    args = parser.parse_args()
+
+    rounds = [("legacy", legacy_execute_async_cmd), ("current", execute_async_cmd)]
+    results = []
+    with tempfile.TemporaryDirectory() as path:
+        for name, spawn in rounds:
+            taskManager.execute_async_cmd = spawn
+            elapsed = launch(args.tasks, path)
+            results.append([name, args.tasks, elapsed, args.tasks / elapsed])
+        taskManager.execute_async_cmd = execute_async_cmd
+
+    baseline = results[0][2]
+    for row in results:
+        row.append(baseline / row[2])
+    headers = ["Spawn", "Tasks", "Launch time (s)", "Launches/s", "Speedup"]
+    print(tabulate(results, headers, tablefmt="github", floatfmt=".3f"))
+
+
+if __name__ == "__main__":
+    main()
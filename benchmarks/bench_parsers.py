@@ -0,0 +1,206 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Time the WLM status parsers on large synthetic command outputs.
+
+A corpus of sacct, qstat (PBS and Cobalt), bjobs and jslist output
+is generated for the requested number of jobs, with batch, extern
+and numbered step lines for sacct. Looking every id up in the
+mapping built by one pass of the parser is compared against scanning
+the output once per id, and both are checked to agree.
+
+    python benchmarks/bench_parsers.py --jobs 10000 --steps 4
+    python benchmarks/bench_parsers.py --jobs 10000 --write-corpus ./corpus
+"""
+
+import argparse
+import os
+import time
+
+from tabulate import tabulate
+
+from smartsim._core.launcher.cobalt import cobaltParser
+from smartsim._core.launcher.lsf import lsfParser
+from smartsim._core.launcher.pbs import pbsParser
+from smartsim._core.launcher.slurm import slurmParser
+
+SLURM_STATES = ("RUNNING", "COMPLETED", "FAILED", "PENDING", "CANCELLED")
+
+
+def generate_sacct(num_jobs, num_steps):
+    # output of sacct --noheader -p -b
+    lines = []
+    for job in range(100000, 100000 + num_jobs):
+        state = SLURM_STATES[job % len(SLURM_STATES)]
+        lines.append(f"{job}|{state}|0:0|")
+        lines.append(f"{job}.batch|{state}|0:0|")
+        lines.append(f"{job}.extern|{state}|0:0|")
+        for step in range(num_steps):
+            lines.append(f"{job}.{step}|{state}|{step % 2}:0|")
+    ids = [f"{job}.{num_steps - 1}" for job in range(100000, 100000 + num_jobs)]
+    ids += [str(job) for job in range(100000, 100000 + num_jobs, 2)]
+    return "\n".join(lines), ids
+
+
+def generate_qstat(num_jobs):
+    lines = [
+        "Job id            Name             User              Time Use S Queue",
+        "----------------  ---------------- ----------------  -------- - -----",
+    ]
+    for job in range(num_jobs):
+        lines.append(f"{job}.sdb  job_{job}  user  00:00:00 {'RQF'[job % 3]} queue")
+    return "\n".join(lines), [f"{job}.sdb" for job in range(num_jobs)]
+
+
+def generate_cobalt(num_jobs):
+    lines = ["JobId      State ", "====================="]
+    for job in range(num_jobs):
+        lines.append(f"{job}     {('running', 'queued')[job % 2]} ")
+    return "\n".join(lines), [str(job) for job in range(num_jobs)]
+
+
+def generate_bjobs(num_jobs):
+    lines = ["JOBID   USER    STAT  QUEUE      FROM_HOST   EXEC_HOST   JOB_NAME"]
+    for job in range(num_jobs):
+        lines.append(f"{job} user {('RUN', 'PEND')[job % 2]} batch login1 b1 job")
+    return "\n".join(lines), [str(job) for job in range(num_jobs)]
+
+
+def generate_jslist(num_jobs):
+    lines = [
+        "   parent                cpus      gpus      exit  ",
+        "ID   ID       nrs    per RS    per RS    status         status",
+        "=" * 79,
+    ]
+    for step in range(num_jobs):
+        state = ("Running", "Complete")[step % 2]
+        lines.append(
+            f"{step:>5}    1         1         1         1   {step % 2}  {state}"
+        )
+    return "\n".join(lines), [str(step) for step in range(num_jobs)]
+
+
+def scan_sacct(output, job_id):
+    # parse_sacct before the single pass parser
+    for line in output.split("\n"):
+        line = line.split("|")
+        if len(line) >= 3 and slurmParser.jobid_exact_match(line[0], job_id):
+            return (line[1], line[2].split(":")[0])
+    return ("PENDING", None)
+
+
+def scan_fields(min_fields, value, default):
+    # the per id scan of the qstat, bjobs and jslist parsers
+    def scan(output, job_id):
+        for line in output.split("\n"):
+            fields = line.split()
+            if len(fields) >= min_fields and fields[0] == job_id:
+                return value(fields)
+        return default
+
+    return scan
+
+
+PARSERS = {
+    "sacct": (slurmParser.parse_sacct_steps, scan_sacct, ("PENDING", None)),
+    "qstat (PBS)": (
+        pbsParser.parse_qstat_jobids,
+        scan_fields(5, lambda f: f[4], "NOTFOUND"),
+        "NOTFOUND",
+    ),
+    "qstat (Cobalt)": (
+        cobaltParser.parse_cobalt_step_statuses,
+        scan_fields(2, lambda f: f[1], "NOTFOUND"),
+        "NOTFOUND",
+    ),
+    "bjobs": (
+        lsfParser.parse_bjobs_jobids,
+        scan_fields(3, lambda f: f[2], "NOTFOUND"),
+        "NOTFOUND",
+    ),
+    "jslist": (
+        lsfParser.parse_jslist_stepids,
+        scan_fields(7, lambda f: (f[6], f[5]), ("NOTFOUND", None)),
+        ("NOTFOUND", None),
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--steps", type=int, default=4)
+    parser.add_argument(
+        "--scan-limit",
+        type=int,
+        default=200,
+        help="ids scanned per id, the scan time is extrapolated to all ids",
+    )
+    parser.add_argument("--write-corpus", help="directory to write the outputs to")
+    args = parser.parse_args()
+
+    corpus = {
+        "sacct": generate_sacct(args.jobs, args.steps),
+        "qstat (PBS)": generate_qstat(args.jobs),
+        "qstat (Cobalt)": generate_cobalt(args.jobs),
+        "bjobs": generate_bjobs(args.jobs),
+        "jslist": generate_jslist(args.jobs),
+    }
+
+    results = []
+    for name, (output, ids) in corpus.items():
+        parse, scan, default = PARSERS[name]
+        if args.write_corpus:
+            os.makedirs(args.write_corpus, exist_ok=True)
+            filename = name.replace(" ", "").replace("(", "_").replace(")", "")
+            with open(os.path.join(args.write_corpus, f"{filename}.txt"), "w") as f:
+                f.write(output)
+
+        start = time.perf_counter()
+        parsed = parse(output)
+        single_pass = [parsed.get(job_id, default) for job_id in ids]
+        single_pass_time = time.perf_counter() - start
+
+        subset = ids[:: max(len(ids) // args.scan_limit, 1)]
+        start = time.perf_counter()
+        scanned = [scan(output, job_id) for job_id in subset]
+        scan_time = (time.perf_counter() - start) * len(ids) / len(subset)
+
+        expected = dict(zip(subset, scanned))
+        if any(single_pass[ids.index(i)] != expected[i] for i in subset):
+            raise AssertionError(f"{name} single pass parser disagrees with scan")
+
+        lines = output.count("\n") + 1
+        results.append([name, lines, len(ids), scan_time, single_pass_time])
+
+    headers = ["Parser", "Lines", "Ids", "Scan per id (s, est.)", "Single pass (s)"]
+    print(tabulate(results, headers, tablefmt="github", floatfmt=".4f"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Time concurrent status requests with and without the query broker.
+
+A number of client threads, standing in for the JobManager thread,
+stops and user status calls, request the status of random job steps.
+Each WLM query sleeps for ``--latency`` seconds. The number of WLM
+commands run and the latency of the requests are compared between
+querying the WLM for every request and sharing queries through the
+QueryBroker.
+
+    python benchmarks/bench_query_broker.py --clients 1 8 32 --latency 0.1
+"""
+
+import argparse
+import random
+import statistics
+import threading
+import time
+
+from tabulate import tabulate
+
+from smartsim._core.launcher.queryBroker import QueryBroker
+
+
+class FakeWLM:
+    def __init__(self, latency):
+        self.latency = latency
+        self.commands = 0
+        self._lock = threading.Lock()
+
+    def query(self, step_ids):
+        with self._lock:
+            self.commands += 1
+        time.sleep(self.latency)
+        return ["RUNNING" for _ in step_ids]
+
+
+def run_clients(get, clients, requests, steps):
+    latencies = []
+    lock = threading.Lock()
+
+    def client(seed):
+        rng = random.Random(seed)
+        for _ in range(requests):
+            step_ids = rng.sample(steps, min(len(steps), 10))
+            start = time.perf_counter()
+            get(step_ids)
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return statistics.median(latencies), p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--ttl", type=float, default=0.5)
+    args = parser.parse_args()
+
+    steps = [str(step) for step in range(args.steps)]
+    results = []
+    for clients in args.clients:
+        direct = FakeWLM(args.latency)
+        direct_latency = run_clients(direct.query, clients, args.requests, steps)
+
+        shared = FakeWLM(args.latency)
+        broker = QueryBroker(shared.query, ttl=args.ttl)
+        broker_latency = run_clients(broker.get, clients, args.requests, steps)
+
+        results.append(
+            [
+                clients,
+                direct.commands,
+                *summarize(direct_latency),
+                shared.commands,
+                *summarize(broker_latency),
+            ]
+        )
+
+    headers = [
+        "Clients",
+        "Direct commands",
+        "Direct p50 (s)",
+        "Direct p99 (s)",
+        "Broker commands",
+        "Broker p50 (s)",
+        "Broker p99 (s)",
+    ]
+    print(tabulate(results, headers, tablefmt="github", floatfmt=".4f"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Compare the run history store against a dictionary per job.
+
+Runs of many entities are recorded both in the columnar RunHistory
+and in the four dictionaries per job previously held by each Job.
+The memory held by each, the time to record every run and the time
+to build the rows of ``Experiment.summary`` are reported.
+
+    python benchmarks/bench_run_history.py --entities 20000 --runs 5
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from tabulate import tabulate
+
+from smartsim._core.control.history import RunHistory
+
+
+class LegacyHistory:
+    # history of a single job before RunHistory
+    def __init__(self):
+        self.runs = 0
+        self.jids = dict()
+        self.statuses = dict()
+        self.returns = dict()
+        self.job_times = dict()
+
+    def record(self, job_id, status, returncode, job_time):
+        self.jids[self.runs] = job_id
+        self.statuses[self.runs] = status
+        self.returns[self.runs] = returncode
+        self.job_times[self.runs] = job_time
+
+
+def record_legacy(num_entities, num_runs):
+    histories = {}
+    for i in range(num_entities):
+        history = LegacyHistory()
+        for run in range(num_runs):
+            history.runs = run
+            history.record(f"{i}.{run}", "Completed", 0, float(i))
+        histories[f"member_{i}"] = history
+    return histories
+
+
+def legacy_rows(histories):
+    rows = []
+    for name, history in histories.items():
+        for run in range(history.runs + 1):
+            rows.append(
+                [
+                    name,
+                    "Model",
+                    history.jids[run],
+                    run,
+                    history.job_times[run],
+                    history.statuses[run],
+                    history.returns[run],
+                ]
+            )
+    return rows
+
+
+def record_store(num_entities, num_runs):
+    history = RunHistory()
+    for i in range(num_entities):
+        for run in range(num_runs):
+            history.record(
+                f"member_{i}", "Model", f"{i}.{run}", run, float(i), "Completed", 0
+            )
+    return history
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, memory / 2**20
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entities", type=int, default=20000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    legacy, legacy_record, legacy_memory = measure(
+        record_legacy, args.entities, args.runs
+    )
+    store, store_record, store_memory = measure(record_store, args.entities, args.runs)
+    members = [f"member_{i}" for i in range(0, args.entities, 10)]
+
+    results = [
+        [
+            "dict per job",
+            legacy_memory,
+            legacy_record,
+            timed(legacy_rows, legacy),
+            None,
+        ],
+        [
+            "RunHistory",
+            store_memory,
+            store_record,
+            timed(lambda: list(store.rows())),
+            timed(lambda: store.runtime_percentiles([50, 99], store.select(members))),
+        ],
+    ]
+    print(f"{args.entities} entities, {args.runs} runs each")
+    headers = [
+        "History",
+        "Memory (MiB)",
+        "Record (s)",
+        "Summary rows (s)",
+        "Filter + percentiles (s)",
+    ]
+    print(
+        tabulate(results, headers, tablefmt="github", floatfmt=".4f", missingval="n/a")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Time launching srun steps through the SlurmLauncher.
+
+Fake ``srun`` and ``sacct`` shims are written to a temporary directory
+placed first on the PATH. The shim ``srun`` registers the step name in
+a file and ``sacct`` reports every registered step. The time to submit
+the steps and the time until every step id has been resolved are
+compared between the rate limited launch pipeline and the previous
+launch path, which slept after every launch and polled sacct for the
+id of each step. The sleeps of the previous path are multiplied by
+``--sleep-scale`` to keep the benchmark short.
+
+    python benchmarks/bench_slurm_launch.py --steps 100 500 --rate 100
+"""
+
+import argparse
+import os
+import stat
+import tempfile
+import time
+
+from tabulate import tabulate
+
+SRUN = """#!/bin/bash
+while [ $# -gt 0 ]; do
+    if [ "$1" == "--job-name" ]; then
+        echo "$2" >> {registry}
+    fi
+    shift
+done
+sleep {runtime}
+"""
+
+SACCT = """#!/bin/bash
+n=0
+while read name; do
+    echo "$name|1000.$n|"
+    n=$((n+1))
+done < {registry}
+"""
+
+
+def write_shims(shim_dir, runtime):
+    registry = os.path.join(shim_dir, "registry")
+    open(registry, "w").close()
+    for name, script in (("srun", SRUN), ("sacct", SACCT)):
+        path = os.path.join(shim_dir, name)
+        with open(path, "w") as f:
+            f.write(script.format(registry=registry, runtime=runtime))
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    os.environ["PATH"] = shim_dir + os.pathsep + os.environ["PATH"]
+
+
+def create_steps(launcher, num_steps, cwd):
+    from smartsim.settings import SrunSettings
+
+    settings = SrunSettings("echo", alloc="1000")
+    return [
+        launcher.create_step(f"model_{i}-{time.time_ns()}", cwd, settings)
+        for i in range(num_steps)
+    ]
+
+
+def legacy_launcher(sleep_scale):
+    from smartsim._core.launcher.slurm import slurmLauncher
+    from smartsim._core.launcher.slurm.slurmParser import parse_step_id_from_sacct
+
+    class LegacySlurmLauncher(slurmLauncher.SlurmLauncher):
+        """Launch path before step ids were resolved in the background"""
+
+        def run(self, step):
+            cmd_list = step.get_launch_cmd()
+            task_id = self.task_manager.start_task(
+                cmd_list, step.cwd, output_files=step.get_launcher_output_files()
+            )
+            step_id = self._get_slurm_step_id(step)
+            self.step_mapping.add(step.name, step_id, task_id, True)
+            time.sleep(1 * sleep_scale)
+            return step_id
+
+        def _get_slurm_step_id(self, step, interval=2, trials=5):
+            time.sleep(interval * sleep_scale)
+            for _ in range(trials):
+                output, _ = slurmLauncher.sacct(
+                    ["--noheader", "-p", "--format=jobname,jobid"]
+                )
+                step_id = parse_step_id_from_sacct(output, step.name)
+                if step_id:
+                    return step_id
+                time.sleep(interval * sleep_scale)
+            return None
+
+    return LegacySlurmLauncher()
+
+
+def launch(launcher, steps):
+    start = time.perf_counter()
+    for step in steps:
+        launcher.run(step)
+    submitted = time.perf_counter() - start
+    while not all(launcher.step_mapping[step.name].managed for step in steps):
+        time.sleep(0.01)
+    resolved = time.perf_counter() - start
+    for step in steps:
+        launcher.task_manager.remove_task(launcher.step_mapping[step.name].task_id)
+    return submitted, resolved
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--steps", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--rate", type=float, default=100)
+    parser.add_argument("--runtime", type=float, default=5)
+    parser.add_argument("--sleep-scale", type=float, default=0.05)
+    args = parser.parse_args()
+
+    os.environ["SMARTSIM_WLM_LAUNCH_RATE"] = str(args.rate)
+    from smartsim._core.launcher.slurm.slurmLauncher import SlurmLauncher
+
+    results = []
+    with tempfile.TemporaryDirectory() as shim_dir:
+        write_shims(shim_dir, args.runtime)
+        for num_steps in args.steps:
+            row = [num_steps]
+            for launcher in (legacy_launcher(args.sleep_scale), SlurmLauncher()):
+                steps = create_steps(launcher, num_steps, shim_dir)
+                row.extend(launch(launcher, steps))
+            launcher.task_manager.actively_monitoring = False
+            results.append(row)
+
+    headers = [
+        "Steps",
+        "Legacy submit (s)",
+        "Legacy resolved (s)",
+        "Pipelined submit (s)",
+        "Pipelined resolved (s)",
+    ]
+    print(tabulate(results, headers, tablefmt="github", floatfmt=".3f"))
+    print(f"\nlegacy sleeps scaled by {args.sleep_scale}, launch rate {args.rate}/s")
+
+
+if __name__ == "__main__":
+    main()
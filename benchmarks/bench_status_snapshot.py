@@ -0,0 +1,117 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Time status queries of large ensembles through the Controller.
+
+Jobs are registered for synthetic ensembles of increasing size and
+the time to gather the status of every member and to check whether
+the ensemble finished is compared between one JobManager lookup per
+member and the bulk snapshot taken under a single lock acquisition.
+
+    python benchmarks/bench_status_snapshot.py --members 1000 10000 100000
+"""
+
+import argparse
+import time
+
+from tabulate import tabulate
+
+from smartsim._core.control import Controller
+from smartsim.entity import EntityList, Model
+from smartsim.settings import RunSettings
+
+
+class SyntheticEnsemble(EntityList):
+    def __init__(self, name, members):
+        super().__init__(name, ".", members=members)
+
+    def _initialize_entities(self, members):
+        settings = RunSettings("echo")
+        self.entities = [
+            Model(f"{self.name}_{i}", {}, ".", settings) for i in range(members)
+        ]
+
+
+def create_controller(ensemble):
+    controller = Controller(launcher="local")
+    for i, model in enumerate(ensemble.entities):
+        controller._jobs.add_job(f"{model.name}-step", str(i), model)
+    return controller
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--members", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = []
+    for members in args.members:
+        ensemble = SyntheticEnsemble("ensemble", members)
+        controller = create_controller(ensemble)
+        jobs = controller._jobs
+
+        per_member_status = timed(
+            lambda: [controller.get_entity_status(m) for m in ensemble], args.repeat
+        )
+        snapshot_status = timed(
+            lambda: controller.get_entity_list_status(ensemble), args.repeat
+        )
+        per_member_finished = timed(
+            lambda: all([jobs.is_finished(m) for m in ensemble]), args.repeat
+        )
+        snapshot_finished = timed(lambda: controller.finished(ensemble), args.repeat)
+        results.append(
+            [
+                members,
+                per_member_status,
+                snapshot_status,
+                per_member_finished,
+                snapshot_finished,
+            ]
+        )
+
+    headers = [
+        "Members",
+        "Status per member (s)",
+        "Status snapshot (s)",
+        "Finished per member (s)",
+        "Finished snapshot (s)",
+    ]
+    print(tabulate(results, headers, tablefmt="github", floatfmt=".5f"))
+
+
+if __name__ == "__main__":
+    main()
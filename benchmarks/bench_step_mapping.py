@@ -0,0 +1,104 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Time status sweep id resolution in StepMapping.
+
+A StepMapping is filled with synthetic managed and unmanaged steps
+and the time to resolve every step id to its task id and partition
+every step name is compared against a linear scan of the mapping.
+
+    python benchmarks/bench_step_mapping.py --steps 50000
+"""
+
+import argparse
+import time
+
+from tabulate import tabulate
+
+from smartsim._core.launcher.stepMapping import StepMapping
+
+
+def linear_get_task_id(mapping, step_id):
+    # resolution without the reverse index
+    for stepmap in mapping.mapping.values():
+        if stepmap.step_id == step_id:
+            return stepmap.task_id
+    return None
+
+
+def create_mapping(num_steps):
+    mapping = StepMapping()
+    for i in range(num_steps):
+        if i % 2:
+            mapping.add(f"step-{i}", step_id=f"1000.{i}", task_id=str(i))
+        else:
+            mapping.add(f"step-{i}", task_id=str(i), managed=False)
+    return mapping
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--steps", type=int, default=50000)
+    parser.add_argument("--linear-limit", type=int, default=2000)
+    args = parser.parse_args()
+
+    mapping = create_mapping(args.steps)
+    names = list(mapping.mapping.keys())
+    managed, _ = mapping.get_partitioned_ids(names)
+    step_ids = managed[1]
+
+    results = [
+        [
+            "partition (2x get_ids)",
+            timed(lambda: [mapping.get_ids(names, m) for m in (True, False)]),
+        ],
+        ["partition (get_partitioned_ids)", timed(mapping.get_partitioned_ids, names)],
+        ["resolve (get_task_ids)", timed(mapping.get_task_ids, step_ids)],
+    ]
+
+    # the linear scan is quadratic, time a subset and extrapolate
+    subset = step_ids[: args.linear_limit]
+    linear = timed(lambda: [linear_get_task_id(mapping, i) for i in subset])
+    results.append(
+        ["resolve (linear scan, est.)", linear * len(step_ids) / len(subset)]
+    )
+
+    print(f"{args.steps} steps, {len(step_ids)} managed")
+    print(
+        tabulate(results, ["Operation", "Time (s)"], tablefmt="github", floatfmt=".5f")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Compare the event driven and polling TaskManager monitors.
+
+For each task count, ``sleep`` processes are handed to a TaskManager
+and the time between each process exiting and its entry appearing in
+the task history is recorded along with the CPU time used by the
+monitor thread.
+
+    python benchmarks/bench_task_manager.py --sizes 100,1000,10000
+"""
+
+import argparse
+import resource
+import statistics
+import time
+from subprocess import DEVNULL
+
+import psutil
+from tabulate import tabulate
+
+from smartsim._core.launcher import taskManager
+from smartsim._core.launcher.taskManager import TaskManager
+
+
+class TimedTaskManager(TaskManager):
+    """TaskManager that records when tasks are added to the history"""
+
+    def __init__(self):
+        super().__init__()
+        self.recorded = {}
+        self.monitor_cpu = 0.0
+
+    def run(self):
+        super().run()
+        self.monitor_cpu = time.thread_time()
+
+    def add_task_history(self, task_id, returncode, out=None, err=None):
+        self.recorded[task_id] = time.monotonic()
+        super().add_task_history(task_id, returncode, out=out, err=err)
+
+
+def _spawn(cmd_list, cwd, env=None, out=DEVNULL, err=DEVNULL):
+    # launch without the startup check in execute_async_cmd so that
+    # only the monitor is measured
+    return psutil.Popen(cmd_list, cwd=cwd, stdout=out, stderr=err, env=env)
+
+
+def run_trial(num_tasks, duration, event_driven):
+    open_pidfd = taskManager._open_pidfd
+    if not event_driven:
+        taskManager._open_pidfd = lambda pid: None
+    try:
+        tm = TimedTaskManager()
+        tm.start()
+        expected_exit = {}
+        for _ in range(num_tasks):
+            launched = time.monotonic()
+            task_id = tm.start_task(
+                ["sleep", str(duration)], ".", out=DEVNULL, err=DEVNULL
+            )
+            expected_exit[task_id] = launched + duration
+
+        while tm.actively_monitoring:
+            time.sleep(0.1)
+    finally:
+        taskManager._open_pidfd = open_pidfd
+
+    latencies = [tm.recorded[pid] - expected_exit[pid] for pid in expected_exit]
+    latencies.sort()
+    return [
+        num_tasks,
+        "event" if event_driven else "polling",
+        statistics.mean(latencies),
+        latencies[int(0.99 * (len(latencies) - 1))],
+        tm.monitor_cpu,
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--duration", type=float, default=20.0)
+    args = parser.parse_args()
+
+    # each task may hold a pidfd
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    taskManager.execute_async_cmd = _spawn
+    results = []
+    for size in [int(size) for size in args.sizes.split(",")]:
+        for event_driven in (False, True):
+            results.append(run_trial(size, args.duration, event_driven))
+
+    headers = ["Tasks", "Monitor", "Mean latency (s)", "p99 latency (s)", "CPU (s)"]
+    print(tabulate(results, headers, tablefmt="github", floatfmt=".4f"))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import json
 import os
 import inspect
 import shutil
+import time
 import pytest
 import psutil
 import shutil
@@ -16,6 +17,7 @@ from smartsim.settings import (
     RunSettings,
 )
 from smartsim._core.config import CONFIG
+from smartsim._core.utils.redis import ping_db
 from smartsim.error import SSConfigError
 from subprocess import run
 
@@ -391,6 +393,22 @@ def dbutils():
 
 
 class DBUtils:
+    @staticmethod
+    def wait_for_shards(procs, ports, timeout=30):
+        """Wait for database shards started on localhost to answer
+
+        Fails the test if a shard exits or the shards do not
+        answer within ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while not all(ping_db("127.0.0.1", port) for port in ports):
+            for proc in procs:
+                if proc.poll() is not None:
+                    pytest.fail(f"Database shard exited with code {proc.returncode}")
+            if time.monotonic() > deadline:
+                pytest.fail(f"Database shards did not answer within {timeout}s")
+            time.sleep(0.05)
+
     @staticmethod
     def get_db_configs():
         config_settings = {
@@ -33,4 +33,5 @@ if sys.version_info < (3, 7):  # pragma: no cover
     sys.exit("Python 3.7 or greater must be used with SmartSim.")
 
 # Main API module
+from .async_experiment import AsyncExperiment
 from .experiment import Experiment
@@ -59,9 +59,57 @@ from ..utils.helpers import expand_exe_path
 #   - Default: info
 #
 # SMARTSIM_JM_INTERVAL
-#   - polling interval for communication with scheduler
+#   - maximum polling interval for communication with scheduler
 #   - default: 10 seconds
 #
+# SMARTSIM_JM_MIN_INTERVAL
+#   - polling interval right after launches and status changes
+#   - default: 1 second
+#
+# SMARTSIM_JM_BACKOFF
+#   - factor the polling interval grows by while no status changes
+#   - default: 2
+#
+# SMARTSIM_JM_QUERY_INTERVAL
+#   - minimum time between two queries of the scheduler
+#   - default: 1 second
+#
+# SMARTSIM_TM_HISTORY_SIZE
+#   - number of exited tasks whose output is held in memory
+#     and number of read task records kept by the TaskManager
+#   - default: 10000
+#
+# SMARTSIM_TM_HISTORY_AGE
+#   - seconds the record of an exited task that has not been
+#     read is kept by the TaskManager
+#   - default: 3600
+#
+# SMARTSIM_WLM_LAUNCH_RATE
+#   - maximum number of job steps submitted to the scheduler
+#     per second, 0 to disable the limit
+#   - default: 10
+#
+# SMARTSIM_WLM_QUERY_TTL
+#   - seconds the status of a job step queried from the scheduler
+#     is reused for other requests
+#   - default: 0.5
+#
+# SMARTSIM_STEP_ID_TIMEOUT
+#   - seconds the Slurm launcher looks for the id of a launched
+#     srun step before monitoring it through its srun process only
+#   - default: 60
+#
+# SMARTSIM_LAUNCH_WORKERS
+#   - number of job steps created and launched concurrently,
+#     0 to use the default of the launcher (8, 1 for LSF)
+#   - default: 0
+#
+# SMARTSIM_COMMAND_RUNNER
+#   - run scheduler commands (e.g. sacct, qstat) through a small
+#     helper process started with the launcher instead of forking
+#     the driver for every command
+#   - default: 0 (off)
+#
 
 
 # Testing Configuration Values
@@ -145,6 +193,46 @@ class Config:
     def jm_interval(self) -> int:
         return int(os.environ.get("SMARTSIM_JM_INTERVAL", 10))
 
+    @property
+    def jm_min_interval(self) -> float:
+        return float(os.environ.get("SMARTSIM_JM_MIN_INTERVAL", 1))
+
+    @property
+    def jm_backoff(self) -> float:
+        return float(os.environ.get("SMARTSIM_JM_BACKOFF", 2))
+
+    @property
+    def jm_query_interval(self) -> float:
+        return float(os.environ.get("SMARTSIM_JM_QUERY_INTERVAL", 1))
+
+    @property
+    def tm_history_size(self) -> int:
+        return int(os.environ.get("SMARTSIM_TM_HISTORY_SIZE", 10000))
+
+    @property
+    def tm_history_age(self) -> float:
+        return float(os.environ.get("SMARTSIM_TM_HISTORY_AGE", 3600))
+
+    @property
+    def wlm_launch_rate(self) -> float:
+        return float(os.environ.get("SMARTSIM_WLM_LAUNCH_RATE", 10))
+
+    @property
+    def wlm_query_ttl(self) -> float:
+        return float(os.environ.get("SMARTSIM_WLM_QUERY_TTL", 0.5))
+
+    @property
+    def step_id_timeout(self) -> float:
+        return float(os.environ.get("SMARTSIM_STEP_ID_TIMEOUT", 60))
+
+    @property
+    def launch_workers(self) -> int:
+        return int(os.environ.get("SMARTSIM_LAUNCH_WORKERS", 0))
+
+    @property
+    def command_runner(self) -> bool:
+        return bool(int(os.environ.get("SMARTSIM_COMMAND_RUNNER", 0)))
+
     @property
     def test_launcher(self) -> str:
         return os.environ.get("SMARTSIM_TEST_LAUNCHER", "local")
@@ -24,23 +24,34 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import itertools
 import os.path as osp
 import pickle
 import signal
 import threading
 import time
+from collections import deque
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 
 from smartredis import Client
 from smartredis.error import RedisConnectionError, RedisReplyError
 
-from ..._core.utils.redis import db_is_active, set_ml_model, set_script
+from ..._core.utils.redis import db_is_active, ping_db, set_ml_model, set_script
 from ...database import Orchestrator
 from ...entity import DBModel, DBNode, DBObject, DBScript, EntityList, SmartSimEntity
 from ...error import LauncherError, SmartSimError, SSInternalError, SSUnsupportedError
 from ...log import get_logger
-from ...status import STATUS_RUNNING, TERMINAL_STATUSES
+from ...status import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    STATUS_CANCELLED,
+    STATUS_FAILED,
+    STATUS_NEW,
+    TERMINAL_STATUSES,
+)
 from ..config import CONFIG
 from ..launcher import *
+from ..launcher.util.packing import read_status
 from ..utils import check_cluster_status, create_cluster
 from .jobmanager import JobManager
 
@@ -49,6 +60,10 @@ logger = get_logger(__name__)
 # job manager lock
 JM_LOCK = threading.RLock()
 
+# backoff between readiness probes of orchestrator shards, in seconds
+DB_PROBE_MIN_DELAY = 0.05
+DB_PROBE_MAX_DELAY = 1.0
+
 
 class Controller:
     """The controller module provides an interface between the
@@ -63,9 +78,11 @@ class Controller:
         :type launcher: str
         """
         self._jobs = JobManager(JM_LOCK)
+        # orchestrator saved by _save_orchestrator, for later step ids
+        self._saved_orchestrator = None
         self.init_launcher(launcher)
 
-    def start(self, manifest, block=True, kill_on_interrupt=True):
+    def start(self, manifest, block=True, kill_on_interrupt=True, max_concurrent=None):
         """Start the passed SmartSim entities
 
         This function should not be called directly, but rather
@@ -74,10 +91,8 @@ class Controller:
         The controller will start the job-manager thread upon
         execution of all jobs.
         """
-        self._jobs.kill_on_interrupt = kill_on_interrupt
-        # register custom signal handler for ^C (SIGINT)
-        signal.signal(signal.SIGINT, self._jobs.signal_interrupt)
-        self._launch(manifest)
+        self.set_interrupt_handler(kill_on_interrupt)
+        self._launch(manifest, max_concurrent)
 
         # start the job manager thread if not already started
         if not self._jobs.actively_monitoring:
@@ -89,6 +104,22 @@ class Controller:
             # it may be called seperately
             self.poll(5, True, kill_on_interrupt=kill_on_interrupt)
 
+    def set_interrupt_handler(self, kill_on_interrupt=True):
+        """Register the JobManager handler for ^C (SIGINT)
+
+        Signal handlers can only be set from the main thread, so
+        this is a no-op when the controller is driven from a worker
+        thread (e.g. by ``AsyncExperiment``) which is expected to
+        have registered the handler beforehand.
+
+        :param kill_on_interrupt: flag for killing jobs when SIGINT is received
+        :type kill_on_interrupt: bool, optional
+        """
+        self._jobs.kill_on_interrupt = kill_on_interrupt
+        if threading.current_thread() is threading.main_thread():
+            # register custom signal handler for ^C (SIGINT)
+            signal.signal(signal.SIGINT, self._jobs.signal_interrupt)
+
     @property
     def orchestrator_active(self):
         JM_LOCK.acquire()
@@ -111,7 +142,8 @@ class Controller:
         """
         self._jobs.kill_on_interrupt = kill_on_interrupt
         to_monitor = self._jobs.jobs
-        while len(to_monitor) > 0:
+        # pending members of launch windows are yet to be launched
+        while len(to_monitor) > 0 or len(self._jobs.pending) > 0:
             time.sleep(interval)
 
             # acquire lock to avoid "dictionary changed during iteration" error
@@ -136,7 +168,10 @@ class Controller:
             if isinstance(entity, Orchestrator):
                 raise TypeError("Finished() does not support Orchestrator instances")
             if isinstance(entity, EntityList):
-                return all([self.finished(ent) for ent in entity.entities])
+                if entity.batch and not entity.array:
+                    return self._jobs.is_finished(entity)
+                names = [ent.name for ent in entity.entities]
+                return self._jobs.are_finished(names)
             if not isinstance(entity, SmartSimEntity):
                 raise TypeError(
                     f"Argument was of type {type(entity)} not derived "
@@ -149,6 +184,72 @@ class Controller:
                 f"Entity {entity.name} has not been launched in this experiment"
             ) from None
 
+    def subscribe(self, entities=None, callback=None):
+        """Subscribe to the status changes of launched entities
+
+        :param entities: entities to receive status changes of,
+                         defaults to None (all entities)
+        :type entities: list[SmartSimEntity | EntityList], optional
+        :param callback: callable receiving each ``StatusEvent``, if not
+                         provided events are put in ``Subscription.events``
+        :type callback: callable, optional
+        :return: the subscription
+        :rtype: Subscription
+        """
+        entity_names = None
+        if entities is not None:
+            entity_names = []
+            for entity in entities:
+                entity_names.append(entity.name)
+                if isinstance(entity, EntityList):
+                    entity_names.extend(ent.name for ent in entity.entities)
+        return self._jobs.events.subscribe(entity_names, callback)
+
+    def wait(self, entities, return_when=ALL_COMPLETED, timeout=None):
+        """Block until launched entities complete
+
+        Waiting is driven by the status changes published by the
+        JobManager monitor thread rather than by polling.
+
+        :param entities: entities to wait for
+        :type entities: list[SmartSimEntity | EntityList]
+        :param return_when: ``FIRST_COMPLETED`` or ``ALL_COMPLETED``
+        :type return_when: str, optional
+        :param timeout: seconds to wait for, defaults to None (forever)
+        :type timeout: float, optional
+        :raises TypeError: if an Orchestrator is passed
+        :raises ValueError: if ``return_when`` is not supported
+        :return: the completed and not completed entities
+        :rtype: tuple[list[SmartSimEntity], list[SmartSimEntity]]
+        """
+        if return_when not in (FIRST_COMPLETED, ALL_COMPLETED):
+            raise ValueError(f"Unsupported return_when value: {return_when}")
+
+        jobs = []
+        for entity in entities:
+            if isinstance(entity, Orchestrator):
+                raise TypeError("wait() does not support Orchestrator instances")
+            if isinstance(entity, EntityList) and (not entity.batch or entity.array):
+                jobs.extend(entity.entities)
+            else:
+                jobs.append(entity)
+
+        def partition():
+            done, not_done = [], []
+            for job_entity in jobs:
+                status = self._jobs.get_status(job_entity)
+                (done if status in TERMINAL_STATUSES else not_done).append(job_entity)
+            return done, not_done
+
+        def is_done():
+            done, not_done = partition()
+            if return_when == FIRST_COMPLETED:
+                return len(done) > 0 or not not_done
+            return not not_done
+
+        self._jobs.events.wait_for(is_done, timeout=timeout)
+        return partition()
+
     def stop_entity(self, entity):
         """Stop an instance of an entity
 
@@ -158,6 +259,10 @@ class Controller:
         :param entity: entity to be stopped
         :type entity: SmartSimEntity
         """
+        if self._jobs.cancel_pending_job(entity.name):
+            return
+
+        events = []
         JM_LOCK.acquire()
         try:
             job = self._jobs[entity.name]
@@ -176,9 +281,12 @@ class Controller:
                     error=status.error,
                     output=status.output,
                 )
-                self._jobs.move_to_completed(job)
+                events = self._jobs.move_to_completed(job, publish=False)
+                self._jobs.wake()
         finally:
             JM_LOCK.release()
+        # callbacks run without the lock held
+        self._jobs.events.publish(events)
 
     def stop_entity_list(self, entity_list):
         """Stop an instance of an entity list
@@ -186,12 +294,22 @@ class Controller:
         :param entity_list: entity list to be stopped
         :type entity_list: EntityList
         """
-        if entity_list.batch:
+        if entity_list.batch and not entity_list.array:
             self.stop_entity(entity_list)
         else:
+            # cancel pending entities first so that no slot is refilled
+            for entity in entity_list.entities:
+                self._jobs.cancel_pending_job(entity.name)
             for entity in entity_list.entities:
                 self.stop_entity(entity)
 
+    def get_run_history(self):
+        """Return the history of every completed run of every job
+
+        :returns: RunHistory
+        """
+        return self._jobs.run_history
+
     def get_jobs(self):
         """Return a dictionary of completed job data
 
@@ -230,11 +348,33 @@ class Controller:
         """
         if not isinstance(entity_list, EntityList):
             raise TypeError(f"Argument was of type {type(entity_list)} not EntityList")
-        if entity_list.batch:
+        if entity_list.packed:
+            return self._get_packed_statuses(entity_list)
+        if entity_list.batch and not entity_list.array:
             return [self.get_entity_status(entity_list)]
+        names = [entity.name for entity in entity_list.entities]
+        return list(self._jobs.get_statuses(names).values())
+
+    def _get_packed_statuses(self, entity_list):
+        """Get the statuses of the members of a packed batch
+
+        Members report their status through the status files of the
+        packing worker. Members that have not started yet are new,
+        and members left unfinished by a finished batch are cancelled.
+
+        :param entity_list: entity list launched as a packed batch
+        :type entity_list: EntityList
+        :return: list of str statuses
+        :rtype: list
+        """
+        batch_status = self.get_entity_status(entity_list)
         statuses = []
         for entity in entity_list.entities:
-            statuses.append(self.get_entity_status(entity))
+            packed_status = read_status(osp.join(entity.path, entity.name + ".status"))
+            status = packed_status[0] if packed_status else STATUS_NEW
+            if batch_status in TERMINAL_STATUSES and status not in TERMINAL_STATUSES:
+                status = STATUS_CANCELLED
+            statuses.append(status)
         return statuses
 
     def init_launcher(self, launcher):
@@ -262,12 +402,14 @@ class Controller:
                 # create new instance of the launcher
                 self._launcher = launcher_map[launcher]()
                 self._jobs.set_launcher(self._launcher)
+                if hasattr(self._launcher, "step_id_callback"):
+                    self._launcher.step_id_callback = self._set_job_id
             else:
                 raise SSUnsupportedError("Launcher type not supported: " + launcher)
         else:
             raise TypeError("Must provide a 'launcher' argument")
 
-    def _launch(self, manifest):
+    def _launch(self, manifest, max_concurrent=None):
         """Main launching function of the controller
 
         Orchestrators are always launched first so that the
@@ -275,12 +417,14 @@ class Controller:
 
         :param manifest: Manifest of deployables to launch
         :type manifest: Manifest
+        :param max_concurrent: maximum number of running members of
+                               ensembles without their own limit,
+                               defaults to None (no limit)
+        :type max_concurrent: int, optional
         """
         orchestrator = manifest.db
         if orchestrator:
-            if orchestrator.num_shards > 1 and isinstance(
-                self._launcher, LocalLauncher
-            ):
+            if orchestrator.db_nodes > 1 and isinstance(self._launcher, LocalLauncher):
                 raise SmartSimError(
                     "Local launcher does not support multi-host orchestrators"
                 )
@@ -296,26 +440,178 @@ class Controller:
         if self.orchestrator_active:
             self._set_dbobjects(manifest)
 
-        # create all steps prior to launch
-        steps = []
+        entities = []
+        windows = []
         all_entity_lists = manifest.ensembles + manifest.ray_clusters
         for elist in all_entity_lists:
+            limit = None
+            if elist in manifest.ensembles:
+                limit = elist.max_concurrent or max_concurrent
             if elist.batch:
-                batch_step = self._create_batch_job_step(elist)
-                steps.append((batch_step, elist))
+                entities.append(elist)
+            elif limit and limit < len(elist.entities):
+                windows.append((elist.entities, limit))
             else:
                 # if ensemble is to be run as separate job steps, aka not in a batch
-                job_steps = [(self._create_job_step(e), e) for e in elist.entities]
-                steps.extend(job_steps)
+                entities.extend(elist.entities)
 
         # models themselves cannot be batch steps
-        for model in manifest.models:
-            job_step = self._create_job_step(model)
-            steps.append((job_step, model))
+        entities.extend(manifest.models)
+        self._launch_entities(entities)
+        for window_entities, limit in windows:
+            self._launch_window(window_entities, limit)
+
+    def _launch_window(self, entities, max_concurrent):
+        """Launch entities keeping at most ``max_concurrent`` of them running
+
+        Entities that do not fit are added to the JobManager as pending.
+        Every time a launched entity reaches a terminal status, the
+        next pending one is launched by a worker thread of the window,
+        so that publishers of status events never wait on the WLM.
+
+        :param entities: entities to launch in order
+        :type entities: list[SmartSimEntity]
+        :param max_concurrent: maximum number of running entities
+        :type max_concurrent: int
+        """
+        pending = deque(entities[max_concurrent:])
+        for entity in pending:
+            self._jobs.add_pending_job(entity)
+        launched = set(entity.name for entity in entities[:max_concurrent])
+        window_lock = threading.Lock()
+        worker = ThreadPoolExecutor(1, thread_name_prefix="Window")
+
+        def launch_next(event):
+            with window_lock:
+                if event.status not in TERMINAL_STATUSES:
+                    return
+                if event.entity.name not in launched:
+                    return
+                launched.discard(event.entity.name)
+                worker.submit(launch_pending)
+
+        def take_pending():
+            with window_lock:
+                while pending:
+                    entity = pending.popleft()
+                    # None if the entity was cancelled while pending
+                    job = self._jobs.take_pending_job(entity.name)
+                    if job is not None:
+                        launched.add(entity.name)
+                        return entity, job
+                if not launched:
+                    subscription.cancel()
+                    worker.shutdown(wait=False)
+                return None, None
+
+        def launch_pending():
+            # a failed launch frees its slot, so keep launching until
+            # one succeeds or no entity is pending
+            entity, job = take_pending()
+            while job is not None:
+                try:
+                    job_step = self._create_step(entity)
+                    job_id = self._run_step(job_step, entity)
+                    # the job leaves pending and is added to the jobs in
+                    # one step, unless it was cancelled while launching
+                    JM_LOCK.acquire()
+                    try:
+                        cancelled = self._jobs.pending.get(entity.name) is not job
+                        if not cancelled:
+                            self._add_launched_step(job_step, entity, job_id)
+                            # the JobManager thread may have exited meanwhile
+                            if not self._jobs.actively_monitoring:
+                                self._jobs.start()
+                    finally:
+                        JM_LOCK.release()
+                    if cancelled:
+                        self._launcher.stop(job_step.name)
+                    return
+                except Exception as e:
+                    logger.error(f"Failed to launch pending entity {entity.name}: {e}")
+                with window_lock:
+                    launched.discard(entity.name)
+                self._jobs.complete_pending_job(job, STATUS_FAILED)
+                entity, job = take_pending()
+
+        names = [entity.name for entity in entities]
+        subscription = self._jobs.events.subscribe(names, launch_next)
+        try:
+            self._launch_entities(entities[:max_concurrent])
+        except SmartSimError:
+            subscription.cancel()
+            with window_lock:
+                launched.clear()
+                cancelled = list(pending)
+                pending.clear()
+            worker.shutdown(wait=False)
+            for entity in cancelled:
+                self._jobs.cancel_pending_job(entity.name)
+            raise
+
+    def _launch_entities(self, entities):
+        """Create the job steps of entities and launch them
+
+        Steps are created and launched by a bounded pool of worker
+        threads, see ``_run_concurrently``. All steps are created
+        before any is launched and launched jobs are added to the
+        JobManager in the order of ``entities``.
+
+        :param entities: entities, and entity lists launched as a batch
+        :type entities: list[SmartSimEntity | EntityList]
+        :raises SmartSimError: if a launch fails
+        """
+        # create all steps prior to launch
+        steps = [
+            (job_step, entity)
+            for entity, job_step in self._run_concurrently(self._create_step, entities)
+        ]
+        launched = self._run_concurrently(lambda step: self._run_step(*step), steps)
+        for (job_step, entity), job_id in launched:
+            self._add_launched_step(job_step, entity, job_id)
+
+    def _run_concurrently(self, func, items):
+        """Call a function on items with a bounded pool of worker threads
+
+        The number of workers is set by the launcher or
+        ``SMARTSIM_LAUNCH_WORKERS``, capped by the ``max_launch_workers``
+        of launchers that need launches in order (e.g. LSF). Results are yielded in the order of
+        ``items`` together with their item. Once a call fails, calls not
+        started yet are cancelled and the first error is raised after
+        the results of the successful calls have been yielded.
+
+        :param func: function called with each item
+        :type func: callable
+        :param items: items to call the function with
+        :type items: list
+        :return: generator of (item, result) tuples
+        :rtype: generator
+        """
+        workers = CONFIG.launch_workers or self._launcher.launch_workers
+        if self._launcher.max_launch_workers:
+            workers = min(workers, self._launcher.max_launch_workers)
+        if workers <= 1 or len(items) <= 1:
+            for item in items:
+                yield item, func(item)
+            return
 
-        # launch steps
-        for job_step in steps:
-            self._launch_step(*job_step)
+        error = None
+        with ThreadPoolExecutor(workers, thread_name_prefix="Launch") as pool:
+            futures = [pool.submit(func, item) for item in items]
+            for item, future in zip(items, futures):
+                try:
+                    result = future.result()
+                except CancelledError:
+                    continue
+                except Exception as e:
+                    if error is None:
+                        error = e
+                        for pending in futures:
+                            pending.cancel()
+                    continue
+                yield item, result
+        if error is not None:
+            raise error
 
     def _launch_orchestrator(self, orchestrator):
         """Launch an Orchestrator instance
@@ -328,6 +624,13 @@ class Controller:
         :type orchestrator: Orchestrator
         """
         orchestrator.remove_stale_files()
+        self._saved_orchestrator = None
+        if orchestrator.array:
+            raise SSUnsupportedError("Orchestrator cannot be launched as a job array")
+        if orchestrator.packed:
+            raise SSUnsupportedError(
+                "Orchestrator cannot be launched as a packed batch"
+            )
 
         # if the orchestrator was launched as a batch workload
         if orchestrator.batch:
@@ -336,9 +639,7 @@ class Controller:
 
         # if orchestrator was run on existing allocation, locally, or in allocation
         else:
-            db_steps = [(self._create_job_step(db), db) for db in orchestrator]
-            for db_step in db_steps:
-                self._launch_step(*db_step)
+            self._launch_entities(orchestrator.entities)
 
         # wait for orchestrator to spin up
         self._orchestrator_launch_wait(orchestrator)
@@ -349,26 +650,22 @@ class Controller:
 
         # create the database cluster
         if orchestrator.num_shards > 2:
-            num_trials = 5
-            cluster_created = False
-            while not cluster_created:
-                try:
-                    create_cluster(orchestrator.hosts, orchestrator.ports)
-                    check_cluster_status(orchestrator.hosts, orchestrator.ports)
-                    logger.info(
-                        f"Database cluster created with {orchestrator.num_shards} shards"
-                    )
-                    cluster_created = True
-                except SSInternalError:
-                    if num_trials > 0:
-                        logger.debug(
-                            "Cluster creation failed, attempting again in five seconds..."
-                        )
-                        num_trials -= 1
-                        time.sleep(5)
-                    else:
-                        # surface SSInternalError as we have no way to recover
-                        raise
+            create_cluster(
+                orchestrator.hosts, orchestrator.ports, orchestrator.replicas
+            )
+            check_cluster_status(
+                orchestrator.hosts,
+                orchestrator.ports,
+                replicas=orchestrator.replicas,
+            )
+            logger.info(
+                f"Database cluster created with {orchestrator.num_shards} shards"
+            )
+            if orchestrator.replicas:
+                logger.info(
+                    f"Database cluster has {orchestrator.replicas} "
+                    "replicas per primary shard"
+                )
         self._save_orchestrator(orchestrator)
         logger.debug(f"Orchestrator launched on nodes: {orchestrator.hosts}")
 
@@ -381,9 +678,22 @@ class Controller:
         :type entity: SmartSimEntity
         :raises SmartSimError: if launch fails
         """
+        job_id = self._run_step(job_step, entity)
+        self._add_launched_step(job_step, entity, job_id)
+
+    def _run_step(self, job_step, entity):
+        """Run a job step with the launcher
 
+        :param job_step: a job step instance
+        :type job_step: Step
+        :param entity: entity instance
+        :type entity: SmartSimEntity
+        :raises SmartSimError: if launch fails
+        :return: id of the job step
+        :rtype: str
+        """
         try:
-            job_id = self._launcher.run(job_step)
+            return self._launcher.run(job_step)
         except LauncherError as e:
             msg = f"An error occurred when launching {entity.name} \n"
             msg += "Check error and output files for details.\n"
@@ -391,26 +701,61 @@ class Controller:
             logger.error(msg)
             raise SmartSimError(f"Job step {entity.name} failed to launch") from e
 
+    def _add_launched_step(self, job_step, entity, job_id):
+        """Add the jobs of a launched job step to the job manager
+
+        :param job_step: a job step instance
+        :type job_step: Step
+        :param entity: entity instance
+        :type entity: SmartSimEntity
+        :param job_id: id of the job step
+        :type job_id: str
+        """
         # a job step is a task if it is not managed by a workload manager (i.e. Slurm)
         # but is rather started, monitored, and exited through the Popen interface
         # in the taskmanager
         is_task = not job_step.managed
 
+        if isinstance(entity, EntityList) and entity.array:
+            # every task of a job array is monitored as a job of its own
+            members = {member.name: member for member in entity.entities}
+            for step_name, entity_name, task_id in job_step.get_array_tasks(job_id):
+                self._add_job(step_name, task_id, members[entity_name], is_task)
+        else:
+            self._add_job(job_step.name, job_id, entity, is_task)
+
+    def _add_job(self, step_name, job_id, entity, is_task):
+        """Add a launched job to the job manager
+
+        :param step_name: name of the job step
+        :type step_name: str
+        :param job_id: id of the job step
+        :type job_id: str
+        :param entity: entity launched by the job step
+        :type entity: SmartSimEntity | EntityList
+        :param is_task: whether the job is monitored through the task manager
+        :type is_task: bool
+        """
         if self._jobs.query_restart(entity.name):
             logger.debug(f"Restarting {entity.name}")
-            self._jobs.restart_job(job_step.name, job_id, entity.name, is_task)
+            self._jobs.restart_job(step_name, job_id, entity.name, is_task)
         else:
             logger.debug(f"Launching {entity.name}")
-            self._jobs.add_job(job_step.name, job_id, entity, is_task)
+            self._jobs.add_job(step_name, job_id, entity, is_task)
 
     def _create_batch_job_step(self, entity_list):
         """Use launcher to create batch job step
 
         :param entity_list: EntityList to launch as batch
         :type entity_list: EntityList
+        :raises SSUnsupportedError: if the batch is both an array and packed
         :return: job step instance
         :rtype: Step
         """
+        if entity_list.array and entity_list.packed:
+            raise SSUnsupportedError(
+                f"{entity_list.name} cannot be both a job array and a packed batch"
+            )
         batch_step = self._launcher.create_step(
             entity_list.name, entity_list.path, entity_list.batch_settings
         )
@@ -421,6 +766,18 @@ class Controller:
             batch_step.add_to_batch(step)
         return batch_step
 
+    def _create_step(self, entity):
+        """Create the job step of an entity or the batch step of an entity list
+
+        :param entity: entity or entity list launched as a batch
+        :type entity: SmartSimEntity | EntityList
+        :return: the job step
+        :rtype: Step
+        """
+        if isinstance(entity, EntityList):
+            return self._create_batch_job_step(entity)
+        return self._create_job_step(entity)
+
     def _create_job_step(self, entity):
         """Create job steps for all entities with the launcher
 
@@ -478,18 +835,52 @@ class Controller:
         """
 
         dat_file = "/".join((orchestrator.path, "smartsim_db.dat"))
-        db_jobs = self._jobs.db_jobs
-        orc_data = {"db": orchestrator, "db_jobs": db_jobs}
-        steps = []
-        for db_job in db_jobs.values():
-            steps.append(self._launcher.step_mapping[db_job.name])
-        orc_data["steps"] = steps
-        with open(dat_file, "wb") as pickle_file:
-            pickle.dump(orc_data, pickle_file)
+        JM_LOCK.acquire()
+        try:
+            db_jobs = self._jobs.db_jobs
+            orc_data = {"db": orchestrator, "db_jobs": db_jobs}
+            steps = []
+            for db_job in db_jobs.values():
+                steps.append(self._launcher.step_mapping[db_job.name])
+            orc_data["steps"] = steps
+            with open(dat_file, "wb") as pickle_file:
+                pickle.dump(orc_data, pickle_file)
+            self._saved_orchestrator = orchestrator
+        finally:
+            JM_LOCK.release()
+
+    def _set_job_id(self, step_name, step_id):
+        """Set the id of a job once the launcher knows it
+
+        Launchers that resolve step ids in the background (e.g. Slurm)
+        may report the id of a database step after the orchestrator
+        was saved, in which case it is saved again so that the saved
+        steps can be stopped and monitored once reloaded.
+
+        :param step_name: name of the job step
+        :type step_name: str
+        :param step_id: job step id reported by the launcher
+        :type step_id: str
+        """
+        self._jobs.set_job_id(step_name, step_id)
+        JM_LOCK.acquire()
+        try:
+            orchestrator = self._saved_orchestrator
+            db_steps = [db_job.name for db_job in self._jobs.db_jobs.values()]
+            if orchestrator is not None and step_name in db_steps:
+                self._save_orchestrator(orchestrator)
+        finally:
+            JM_LOCK.release()
 
     def _orchestrator_launch_wait(self, orchestrator):
         """Wait for the orchestrator instances to run
 
+        Readiness is decided by probing each shard with PING as soon
+        as its address is written to its rendezvous file by the
+        database node. Probes run in parallel and are retried with exponential
+        backoff. The WLM status of the database nodes is checked every
+        ``CONFIG.jm_interval`` seconds to catch failed launches.
+
         In the case where the orchestrator is launched as a batch
         through a WLM, we wait for the orchestrator to exit the
         queue before proceeding so new launched entities can
@@ -504,37 +895,70 @@ class Controller:
             logger.info("While queued, SmartSim will wait for Orchestrator to run")
             logger.info("CTRL+C interrupt to abort and cancel launch")
 
-        ready = False
-        while not ready:
-            try:
-                time.sleep(CONFIG.jm_interval)
-                # manually trigger job update if JM not running
-                if not self._jobs.actively_monitoring:
-                    self._jobs.check_jobs()
-
-                # _jobs.get_status acquires JM lock for main thread, no need for locking
-                statuses = self.get_entity_list_status(orchestrator)
-                if all([stat == STATUS_RUNNING for stat in statuses]):
-                    ready = True
-                    # TODO remove in favor of by node status check
-                    time.sleep(CONFIG.jm_interval)
-                elif any([stat in TERMINAL_STATUSES for stat in statuses]):
-                    self.stop_entity_list(orchestrator)
-                    msg = "Orchestrator failed during startup"
-                    msg += f" See {orchestrator.path} for details"
-                    raise SmartSimError(msg)
-                else:
-                    logger.debug("Waiting for orchestrator instances to spin up...")
-            except KeyboardInterrupt:
-
-                logger.info("Orchestrator launch cancelled - requesting to stop")
-                self.stop_entity_list(orchestrator)
-
-                # re-raise keyboard interrupt so the job manager will display
-                # any running and un-killed jobs as this method is only called
-                # during launch and we handle all keyboard interrupts during
-                # launch explicitly
-                raise
+        # addresses of the shards that have not answered yet, per db node
+        waiting = {}
+        delay = DB_PROBE_MIN_DELAY
+        next_status_check = time.time() + CONFIG.jm_interval
+        try:
+            with ThreadPoolExecutor(thread_name_prefix="DBProbe") as pool:
+                while True:
+                    for dbnode in orchestrator.entities:
+                        if dbnode.name not in waiting:
+                            hosts = dbnode._try_parse_db_hosts()
+                            if hosts:
+                                waiting[dbnode.name] = list(
+                                    itertools.product(hosts, dbnode.ports)
+                                )
+                                delay = DB_PROBE_MIN_DELAY
+
+                    addresses = [
+                        address for shards in waiting.values() for address in shards
+                    ]
+                    answered = pool.map(lambda address: ping_db(*address), addresses)
+                    ready = {address for address, ok in zip(addresses, answered) if ok}
+                    for name, shards in waiting.items():
+                        waiting[name] = [addr for addr in shards if addr not in ready]
+                    if len(waiting) == len(orchestrator.entities) and not any(
+                        waiting.values()
+                    ):
+                        break
+
+                    if time.time() >= next_status_check:
+                        next_status_check = time.time() + CONFIG.jm_interval
+                        self._check_orchestrator_failed(orchestrator)
+                        logger.debug("Waiting for orchestrator instances to spin up...")
+
+                    time.sleep(delay)
+                    delay = min(delay * 2, DB_PROBE_MAX_DELAY)
+        except KeyboardInterrupt:
+
+            logger.info("Orchestrator launch cancelled - requesting to stop")
+            self.stop_entity_list(orchestrator)
+
+            # re-raise keyboard interrupt so the job manager will display
+            # any running and un-killed jobs as this method is only called
+            # during launch and we handle all keyboard interrupts during
+            # launch explicitly
+            raise
+
+    def _check_orchestrator_failed(self, orchestrator):
+        """Stop the orchestrator if any of its instances failed
+
+        :param orchestrator: orchestrator instance
+        :type orchestrator: Orchestrator
+        :raises SmartSimError: if an instance is in a terminal state
+        """
+        # manually trigger job update if JM not running
+        if not self._jobs.actively_monitoring:
+            self._jobs.check_jobs()
+
+        # _jobs.get_status acquires JM lock for main thread, no need for locking
+        statuses = self.get_entity_list_status(orchestrator)
+        if any([stat in TERMINAL_STATUSES for stat in statuses]):
+            self.stop_entity_list(orchestrator)
+            msg = "Orchestrator failed during startup"
+            msg += f" See {orchestrator.path} for details"
+            raise SmartSimError(msg)
 
     def reload_saved_db(self, checkpoint_file):
         JM_LOCK.acquire()
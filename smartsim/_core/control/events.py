@@ -0,0 +1,152 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from collections import namedtuple
+from queue import Queue
+from threading import Condition
+
+from ...log import get_logger
+
+logger = get_logger(__name__)
+
+# entity whose job changed status, the new and previous status and
+# the time (time.time()) the change was observed
+StatusEvent = namedtuple(
+    "StatusEvent", ["entity", "status", "previous_status", "timestamp"]
+)
+
+
+class Subscription:
+    """Subscription to the status changes of launched entities
+
+    Events are passed to ``callback`` if one is provided, otherwise
+    they are put in the thread-safe ``events`` queue.
+
+    Callbacks run on the thread that observed the status change,
+    usually the JobManager monitor thread, and should return quickly.
+    """
+
+    def __init__(self, registry, entity_names=None, callback=None):
+        """Initialize a subscription
+
+        :param registry: registry the subscription belongs to
+        :type registry: StatusEvents
+        :param entity_names: names of the entities to receive events of,
+                             defaults to None (all entities)
+        :type entity_names: set[str], optional
+        :param callback: callable receiving each ``StatusEvent``
+        :type callback: callable, optional
+        """
+        self.entity_names = entity_names
+        self.callback = callback
+        self.events = Queue() if callback is None else None
+        self._registry = registry
+
+    def matches(self, event):
+        if self.entity_names is None:
+            return True
+        return event.entity.name in self.entity_names
+
+    def deliver(self, event):
+        if self.callback is None:
+            self.events.put(event)
+            return
+        try:
+            self.callback(event)
+        except Exception as e:
+            logger.error(f"Status callback for {event.entity.name} failed: {e}")
+
+    def cancel(self):
+        """Stop receiving events"""
+        self._registry.unsubscribe(self)
+
+
+class StatusEvents:
+    """Registry of subscriptions to status changes
+
+    The JobManager publishes a ``StatusEvent`` every time it observes
+    the status of a job change. Threads can also block until the
+    statuses of jobs satisfy a condition through ``wait_for``.
+    """
+
+    def __init__(self):
+        self._cond = Condition()
+        # replaced, never mutated, so it can be iterated without the lock
+        self._subscriptions = ()
+
+    def subscribe(self, entity_names=None, callback=None):
+        """Subscribe to the status changes of entities
+
+        :param entity_names: names of the entities, defaults to None (all)
+        :type entity_names: Iterable[str], optional
+        :param callback: callable receiving each ``StatusEvent``
+        :type callback: callable, optional
+        :return: the subscription
+        :rtype: Subscription
+        """
+        if entity_names is not None:
+            entity_names = set(entity_names)
+        subscription = Subscription(self, entity_names, callback)
+        with self._cond:
+            self._subscriptions = self._subscriptions + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._cond:
+            self._subscriptions = tuple(
+                sub for sub in self._subscriptions if sub is not subscription
+            )
+
+    def publish(self, events):
+        """Deliver events to subscribers and wake waiting threads
+
+        :param events: status changes to publish
+        :type events: list[StatusEvent]
+        """
+        if not events:
+            return
+        for event in events:
+            for subscription in self._subscriptions:
+                if subscription.matches(event):
+                    subscription.deliver(event)
+        with self._cond:
+            self._cond.notify_all()
+
+    def wait_for(self, predicate, timeout=None):
+        """Block until ``predicate`` is true or the timeout expires
+
+        The predicate is evaluated every time events are published.
+
+        :param predicate: callable returning True when done waiting
+        :type predicate: callable
+        :param timeout: seconds to wait for, defaults to None (forever)
+        :type timeout: float, optional
+        :return: the last value returned by ``predicate``
+        :rtype: bool
+        """
+        with self._cond:
+            return self._cond.wait_for(predicate, timeout)
@@ -0,0 +1,300 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import csv
+import math
+from array import array
+
+from ...status import STATUS_FAILED
+
+FIELDS = ("name", "entity_type", "job_id", "run", "time", "status", "returncode")
+
+
+class _Interner:
+    """Map repeated strings to small integer codes"""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def intern(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def lookup(self, values):
+        """Return the codes of the values that have been interned"""
+        return {self.codes[value] for value in values if value in self.codes}
+
+
+class RunHistory:
+    """Append-only history of the runs of all jobs of an experiment
+
+    Each completed run of a job is a row of the history. Rows are
+    stored column by column in typed arrays; entity names, entity
+    types and statuses are interned so that, apart from its job id,
+    a row costs a few machine words.
+
+    Rows are only ever appended, so readers may iterate the first
+    ``len(history)`` rows while new runs are being recorded.
+    """
+
+    def __init__(self):
+        self._strings = {
+            field: _Interner() for field in ("name", "entity_type", "status")
+        }
+        self._columns = {
+            "name": array("l"),
+            "entity_type": array("l"),
+            # job ids are unique per run, interning them would not save memory
+            "job_id": [],
+            "run": array("l"),
+            "time": array("d"),
+            "status": array("l"),
+            # NaN when the returncode is unknown
+            "returncode": array("d"),
+        }
+        self._size = 0
+
+    def record(self, name, entity_type, job_id, run, job_time, status, returncode):
+        """Record a completed run of a job
+
+        :param name: name of the entity of the job
+        :type name: str
+        :param entity_type: type of the entity of the job
+        :type entity_type: str
+        :param job_id: id of the job step of the run
+        :type job_id: str
+        :param run: index of the run of the job
+        :type run: int
+        :param job_time: runtime of the job in seconds
+        :type job_time: float
+        :param status: final status of the run
+        :type status: str
+        :param returncode: returncode of the run
+        :type returncode: int | None
+        :return: index of the row
+        :rtype: int
+        """
+        columns = self._columns
+        strings = self._strings
+        columns["name"].append(strings["name"].intern(name))
+        columns["entity_type"].append(strings["entity_type"].intern(entity_type))
+        columns["job_id"].append(str(job_id))
+        columns["run"].append(run)
+        columns["time"].append(job_time)
+        columns["status"].append(strings["status"].intern(status))
+        columns["returncode"].append(
+            math.nan if returncode is None else float(returncode)
+        )
+        # publish the row once all columns hold it
+        self._size += 1
+        return self._size - 1
+
+    def get(self, row, field):
+        """Return the value of a field of a row
+
+        :param row: index of the row
+        :type row: int
+        :param field: one of ``FIELDS``
+        :type field: str
+        :return: value of the field
+        """
+        value = self._columns[field][row]
+        if field in self._strings:
+            return self._strings[field].values[value]
+        if field == "returncode":
+            return None if math.isnan(value) else int(value)
+        return value
+
+    def rows(self, rows=None):
+        """Iterate over rows as tuples ordered as ``FIELDS``
+
+        :param rows: indices of the rows, defaults to None (all rows)
+        :type rows: list[int], optional
+        """
+        if rows is None:
+            rows = range(self._size)
+        columns = self._columns
+        names = self._strings["name"].values
+        entity_types = self._strings["entity_type"].values
+        statuses = self._strings["status"].values
+        for row in rows:
+            returncode = columns["returncode"][row]
+            yield (
+                names[columns["name"][row]],
+                entity_types[columns["entity_type"][row]],
+                columns["job_id"][row],
+                columns["run"][row],
+                columns["time"][row],
+                statuses[columns["status"][row]],
+                None if math.isnan(returncode) else int(returncode),
+            )
+
+    def select(self, names=None, entity_types=None, statuses=None):
+        """Return the indices of the rows matching all given filters
+
+        :param names: entity names to keep, defaults to None (all)
+        :type names: list[str], optional
+        :param entity_types: entity types to keep, defaults to None (all)
+        :type entity_types: list[str], optional
+        :param statuses: statuses to keep, defaults to None (all)
+        :type statuses: list[str], optional
+        :return: indices of the matching rows
+        :rtype: list[int]
+        """
+        rows = range(self._size)
+        filters = (("name", names), ("entity_type", entity_types), ("status", statuses))
+        for field, values in filters:
+            if values is None:
+                continue
+            if isinstance(values, str):
+                values = [values]
+            codes = self._strings[field].lookup(values)
+            column = self._columns[field]
+            rows = [row for row in rows if column[row] in codes]
+        return list(rows)
+
+    def count_by(self, field, rows=None):
+        """Count the rows per value of a field
+
+        .. highlight:: python
+        .. code-block:: python
+
+            # failures per member of an ensemble
+            failed = history.select(names=member_names, statuses=[STATUS_FAILED])
+            history.count_by("name", failed)
+
+        :param field: one of ``FIELDS``
+        :type field: str
+        :param rows: indices of the rows, defaults to None (all rows)
+        :type rows: list[int], optional
+        :return: mapping of value to number of rows
+        :rtype: dict
+        """
+        column = self._columns[field]
+        if rows is None:
+            rows = range(self._size)
+        counts = {}
+        for row in rows:
+            code = column[row]
+            counts[code] = counts.get(code, 0) + 1
+        if field in self._strings:
+            values = self._strings[field].values
+            return {values[code]: count for code, count in counts.items()}
+        return counts
+
+    def failures(self, names=None):
+        """Return the number of failed runs of entities
+
+        :param names: entity names, defaults to None (all)
+        :type names: list[str], optional
+        :return: number of failed runs
+        :rtype: int
+        """
+        return len(self.select(names=names, statuses=[STATUS_FAILED]))
+
+    def runtime_percentiles(self, percentiles, rows=None):
+        """Return percentiles of the runtime of runs
+
+        Percentiles are linearly interpolated between the
+        closest ranks.
+
+        :param percentiles: percentiles to compute, between 0 and 100
+        :type percentiles: list[float]
+        :param rows: indices of the rows, defaults to None (all rows)
+        :type rows: list[int], optional
+        :return: runtime at each percentile, None if there are no rows
+        :rtype: list[float | None]
+        """
+        column = self._columns["time"]
+        if rows is None:
+            rows = range(self._size)
+        times = sorted(column[row] for row in rows)
+        results = []
+        for percentile in percentiles:
+            if not times:
+                results.append(None)
+                continue
+            rank = (len(times) - 1) * percentile / 100
+            low = math.floor(rank)
+            high = min(low + 1, len(times) - 1)
+            results.append(times[low] + (times[high] - times[low]) * (rank - low))
+        return results
+
+    def to_csv(self, path, rows=None):
+        """Write rows to a CSV file with a header of ``FIELDS``
+
+        :param path: path of the CSV file
+        :type path: str
+        :param rows: indices of the rows, defaults to None (all rows)
+        :type rows: list[int], optional
+        """
+        with open(path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(FIELDS)
+            writer.writerows(self.rows(rows))
+
+    def to_numpy(self):
+        """Return the history as a NumPy structured array
+
+        String fields are returned as unicode columns and unknown
+        returncodes as NaN.
+
+        :return: array with one record per row and a field per column
+        :rtype: numpy.ndarray
+        """
+        import numpy as np
+
+        size = self._size
+        dtypes = []
+        data = {}
+        for field in FIELDS:
+            # copy the rows so that the arrays can keep growing
+            column = self._columns[field][:size]
+            if field == "job_id":
+                data[field] = np.array(column + [""])[:size]
+                dtypes.append((field, data[field].dtype))
+                continue
+            kind = "f" if column.typecode == "d" else "i"
+            values = np.frombuffer(column, dtype=f"{kind}{column.itemsize}")
+            if field in self._strings:
+                # the empty string keeps the dtype a unicode one
+                values = np.array(self._strings[field].values + [""])[values]
+            data[field] = values
+            dtypes.append((field, values.dtype))
+
+        records = np.empty(size, dtype=dtypes)
+        for field in FIELDS:
+            records[field] = data[field]
+        return records
+
+    def __len__(self):
+        return self._size
@@ -27,6 +27,7 @@
 import time
 
 from ...status import STATUS_NEW
+from .history import RunHistory
 
 
 class Job:
@@ -36,7 +37,7 @@ class Job:
     the controller class.
     """
 
-    def __init__(self, job_name, job_id, entity, launcher, is_task):
+    def __init__(self, job_name, job_id, entity, launcher, is_task, run_history=None):
         """Initialize a Job.
 
         :param job_name: Name of the job step
@@ -49,6 +50,9 @@ class Job:
         :type launcher: str
         :param is_task: process monitored by TaskManager (True) or the WLM (True)
         :type is_task: bool
+        :param run_history: history to record the runs of the job in,
+                            defaults to None (a history of this job only)
+        :type run_history: RunHistory, optional
         """
         self.name = job_name
         self.jid = job_id
@@ -62,7 +66,7 @@ class Job:
         self.launched_with = launcher
         self.is_task = is_task
         self.start_time = time.time()
-        self.history = History()
+        self.history = History(entity.name, entity.type, run_history)
 
     @property
     def ename(self):
@@ -146,27 +150,56 @@ class Job:
 class History:
     """History of a job instance. Holds various attributes based
     on the previous launches of a job.
+
+    The runs are recorded as rows of the experiment ``RunHistory``,
+    the history of a job only keeps the indices of its rows.
     """
 
-    def __init__(self, runs=0):
+    def __init__(self, name, entity_type, run_history=None, runs=0):
         """Init a history object for a job
 
+        :param name: name of the entity of the job
+        :type name: str
+        :param entity_type: type of the entity of the job
+        :type entity_type: str
+        :param run_history: history to record runs in, defaults to None
+        :type run_history: RunHistory, optional
         :param runs: number of runs so far, defaults to 0
         :type runs: int, optional
         """
+        self.name = name
+        self.entity_type = entity_type
+        self.run_history = run_history if run_history is not None else RunHistory()
         self.runs = runs
-        self.jids = dict()
-        self.statuses = dict()
-        self.returns = dict()
-        self.job_times = dict()
+        self._rows = []
 
     def record(self, job_id, status, returncode, job_time):
         """record the history of a job"""
-        self.jids[self.runs] = job_id
-        self.statuses[self.runs] = status
-        self.returns[self.runs] = returncode
-        self.job_times[self.runs] = job_time
+        row = self.run_history.record(
+            self.name, self.entity_type, job_id, self.runs, job_time, status, returncode
+        )
+        self._rows.append(row)
 
     def new_run(self):
         """increment run total"""
         self.runs += 1
+
+    def _by_run(self, field):
+        get = self.run_history.get
+        return {get(row, "run"): get(row, field) for row in self._rows}
+
+    @property
+    def jids(self):
+        return self._by_run("job_id")
+
+    @property
+    def statuses(self):
+        return self._by_run("status")
+
+    @property
+    def returns(self):
+        return self._by_run("returncode")
+
+    @property
+    def job_times(self):
+        return self._by_run("time")
@@ -32,11 +32,12 @@ from ...database import Orchestrator
 from ...entity import DBNode
 from ...error import SmartSimError
 from ...log import get_logger
-from ...status import TERMINAL_STATUSES
-from ..config import CONFIG
-from ..launcher import LocalLauncher
+from ...status import STATUS_CANCELLED, STATUS_PENDING, TERMINAL_STATUSES
 from ..utils.network import get_ip_from_host
+from .events import StatusEvent, StatusEvents
+from .history import RunHistory
 from .job import Job
+from .polling import PollingPolicy
 
 logger = get_logger(__name__)
 
@@ -52,6 +53,10 @@ class JobManager:
     The JobManager and Controller share a single instance of a launcher
     object that allows both the Controller and launcher access to the
     wlm to query information about jobs that the user requests.
+
+    How often jobs are checked is decided by a ``PollingPolicy``
+    created for the launcher in use. Every status change observed
+    is published to the subscribers of ``events``.
     """
 
     def __init__(self, lock, launcher=None):
@@ -64,17 +69,40 @@ class JobManager:
         self.jobs = {}
         self.db_jobs = {}
 
+        # jobs of entities waiting for a launch slot, see add_pending_job
+        self.pending = {}
+        # names of the pending entities being launched
+        self._launching = set()
+
         # completed jobs
         self.completed = {}
 
+        # every completed run of every job
+        self.run_history = RunHistory()
+
+        # every job added to the job manager by entity name. Jobs are
+        # never removed so the index can be read without the lock
+        self._job_index = {}
+
+        # jobs by the name of their current job step, and the ids
+        # reported by the launcher for steps whose job is not added yet
+        self._step_index = {}
+        self._early_job_ids = {}
+
+        # status subscriptions and the last status published per entity
+        self.events = StatusEvents()
+        self._published = {}
+
         self.actively_monitoring = False  # on/off flag
         self._launcher = launcher  # reference to launcher
         self._lock = lock  # thread lock
+        self.polling = PollingPolicy.from_launcher(launcher)
 
         self.kill_on_interrupt = True  # flag for killing jobs on SIGINT
 
     def start(self):
         """Start a thread for the job manager"""
+        self.actively_monitoring = True
         self.monitor = Thread(name="JobManager", daemon=True, target=self.run)
         self.monitor.start()
 
@@ -84,9 +112,10 @@ class JobManager:
         by the user will be responsible for returning statuses
         that progress the state of the job.
 
-        The interval of the checks is controlled by
-        smartsim.constats.TM_INTERVAL and should be set to values
-        above 20 for congested, multi-user systems
+        The interval of the checks is controlled by the polling
+        policy of the JobManager. The maximum interval is set by
+        SMARTSIM_JM_INTERVAL and should be set to values above 20
+        for congested, multi-user systems
 
         The job manager thread will exit when no jobs are left
         or when the main thread dies
@@ -111,17 +140,32 @@ class JobManager:
                         logger.info(job)
                         self.move_to_completed(job)
 
-            # if no more jobs left to actively monitor
-            if not self():
-                self.actively_monitoring = False
-                logger.debug("Sleeping, no jobs to monitor")
-
-    def move_to_completed(self, job):
+            # if no more jobs left to actively monitor, checked under
+            # the lock so that jobs added meanwhile restart the thread
+            self._lock.acquire()
+            try:
+                if not self():
+                    self.actively_monitoring = False
+                    logger.debug("Sleeping, no jobs to monitor")
+                    break
+            finally:
+                self._lock.release()
+
+    def move_to_completed(self, job, publish=True):
         """Move job to completed queue so that its no longer
            actively monitored by the job manager
 
+        Callers holding the JobManager lock should pass
+        ``publish=False`` and publish the returned events once
+        they have released it, so that callbacks never run under
+        the lock.
+
         :param job: job instance we are transitioning
         :type job: Job
+        :param publish: publish the status event of the job, defaults to True
+        :type publish: bool, optional
+        :return: the events left to publish
+        :rtype: list[StatusEvent]
         """
         self._lock.acquire()
         try:
@@ -133,8 +177,16 @@ class JobManager:
                 del self.db_jobs[job.ename]
             elif job.ename in self.jobs.keys():
                 del self.jobs[job.ename]
+
+            # publish statuses set outside of check_jobs (e.g. on stop)
+            event = self._create_status_event(job)
         finally:
             self._lock.release()
+        events = [event] if event else []
+        if not publish:
+            return events
+        self.events.publish(events)
+        return []
 
     def __getitem__(self, entity_name):
         """Return the job associated with the name of the entity
@@ -151,6 +203,8 @@ class JobManager:
                 return self.db_jobs[entity_name]
             if entity_name in self.jobs.keys():
                 return self.jobs[entity_name]
+            if entity_name in self.pending.keys():
+                return self.pending[entity_name]
             if entity_name in self.completed.keys():
                 return self.completed[entity_name]
             raise KeyError
@@ -179,30 +233,125 @@ class JobManager:
         :type is_task: bool
         """
         launcher = str(self._launcher)
-        # all operations here should be atomic
-        job = Job(job_name, job_id, entity, launcher, is_task)
-        if isinstance(entity, (DBNode, Orchestrator)):
-            self.db_jobs[entity.name] = job
-        else:
-            self.jobs[entity.name] = job
+        self._lock.acquire()
+        try:
+            job_id = self._early_job_ids.pop(job_name, job_id)
+            # a launched pending job leaves pending in the same step
+            self.pending.pop(entity.name, None)
+            self._launching.discard(entity.name)
+            job = Job(job_name, job_id, entity, launcher, is_task, self.run_history)
+            if isinstance(entity, (DBNode, Orchestrator)):
+                self.db_jobs[entity.name] = job
+            else:
+                self.jobs[entity.name] = job
+            self._job_index[entity.name] = job
+            self._step_index[job_name] = job
+        finally:
+            self._lock.release()
+        self.polling.notify()
 
-    def is_finished(self, entity):
-        """Detect if a job has completed
+    def add_pending_job(self, entity):
+        """Add the job of an entity that waits for a launch slot
 
-        :param entity: entity to check
+        Pending jobs are not monitored. They report ``STATUS_PENDING``
+        until the entity is launched (``take_pending_job``) or the job
+        is cancelled (``cancel_pending_job``).
+
+        :param entity: entity waiting to be launched
         :type entity: SmartSimEntity
-        :return: True if finished
+        """
+        self._lock.acquire()
+        try:
+            launcher = str(self._launcher)
+            job = Job(None, None, entity, launcher, True, self.run_history)
+            job.status = STATUS_PENDING
+            self.pending[entity.name] = job
+            self._job_index[entity.name] = job
+            event = self._create_status_event(job)
+        finally:
+            self._lock.release()
+        self.events.publish([event] if event else [])
+
+    def take_pending_job(self, entity_name):
+        """Take the pending job of an entity about to be launched
+
+        The job stays pending until the launched job is added with
+        ``add_job`` or the job is completed with ``complete_pending_job``,
+        so that an entity is always listed in ``pending`` or ``jobs``.
+
+        :param entity_name: name of the entity
+        :type entity_name: str
+        :return: the pending job, None if the entity is not pending
+                 or is already being launched
+        :rtype: Job | None
+        """
+        self._lock.acquire()
+        try:
+            job = self.pending.get(entity_name)
+            if job is None or entity_name in self._launching:
+                return None
+            self._launching.add(entity_name)
+            return job
+        finally:
+            self._lock.release()
+
+    def complete_pending_job(self, job, status=STATUS_CANCELLED):
+        """Complete a pending job, e.g. one that failed to launch
+
+        :param job: the pending job
+        :type job: Job
+        :param status: final status of the job, defaults to cancelled
+        :type status: str, optional
+        :return: True if the job was still pending
         :rtype: bool
         """
         self._lock.acquire()
         try:
-            job = self[entity.name]  # locked operation
-            if entity.name in self.completed:
-                if job.status in TERMINAL_STATUSES:
-                    return True
-            return False
+            if self.pending.get(job.ename) is not job:
+                return False
+            del self.pending[job.ename]
+            self._launching.discard(job.ename)
+            job.set_status(status, None, None)
+            self.completed[job.ename] = job
+            event = self._create_status_event(job)
         finally:
             self._lock.release()
+        self.events.publish([event] if event else [])
+        return True
+
+    def cancel_pending_job(self, entity_name):
+        """Cancel the pending job of an entity
+
+        Entities cancelled while being launched are stopped by their
+        launcher once launched.
+
+        :param entity_name: name of the entity
+        :type entity_name: str
+        :return: True if the entity was pending
+        :rtype: bool
+        """
+        self._lock.acquire()
+        try:
+            job = self.pending.get(entity_name)
+        finally:
+            self._lock.release()
+        if job is None:
+            return False
+        return self.complete_pending_job(job)
+
+    def is_finished(self, entity):
+        """Detect if a job has completed
+
+        :param entity: entity to check
+        :type entity: SmartSimEntity
+        :return: True if finished
+        :rtype: bool
+        """
+        job = self._get_indexed_job(entity.name)  # raises KeyError
+        if entity.name in self.completed:
+            if job.status in TERMINAL_STATUSES:
+                return True
+        return False
 
     def check_jobs(self):
         """Update all jobs in jobmanager
@@ -210,16 +359,36 @@ class JobManager:
         Update all jobs returncode, status, error and output
         through one call to the launcher.
 
+        The JobManager lock is only held to take a snapshot of the
+        active jobs and to apply the updates, not while the launcher
+        queries the WLM, so that status requests are not blocked
+        by slow WLM commands.
         """
         self._lock.acquire()
         try:
             jobs = self().values()
             job_name_map = dict([(job.name, job.ename) for job in jobs])
+        finally:
+            self._lock.release()
 
-            # returns (job step name, StepInfo) tuples
-            statuses = self._launcher.get_step_update(job_name_map.keys())
+        # returns (job step name, StepInfo) tuples
+        statuses = self._launcher.get_step_update(list(job_name_map.keys()))
+
+        events = []
+        self._lock.acquire()
+        try:
+            changed = False
+            completions = 0
+            active_jobs = self()
             for job_name, status in statuses:
-                job = self[job_name_map[job_name]]
+                job = active_jobs.get(job_name_map[job_name])
+                # skip jobs stopped or restarted while the launcher was queried
+                if job is None or job.name != job_name:
+                    continue
+                if status.status != job.status:
+                    changed = True
+                    if status.status in TERMINAL_STATUSES:
+                        completions += 1
                 # uses abstract step interface
                 job.set_status(
                     status.status,
@@ -228,29 +397,118 @@ class JobManager:
                     error=status.error,
                     output=status.output,
                 )
+                event = self._create_status_event(job)
+                if event:
+                    events.append(event)
+            self.polling.record_query(changed, completions)
         finally:
             self._lock.release()
 
+        # callbacks run without the lock held
+        self.events.publish(events)
+
+    def _create_status_event(self, job):
+        """Create an event if the status of a job has not been published
+
+        :param job: job to check
+        :type job: Job
+        :return: event for the new status or None
+        :rtype: StatusEvent | None
+        """
+        previous = self._published.get(job.ename)
+        if job.status == previous:
+            return None
+        self._published[job.ename] = job.status
+        return StatusEvent(job.entity, job.status, previous, time.time())
+
     def get_status(self, entity):
         """Return the status of a job.
 
+        Statuses are read without taking the JobManager lock so
+        that status requests do not contend with the monitor thread.
+
         :param entity: SmartSimEntity or EntityList instance
         :type entity: SmartSimEntity | EntityList
         :returns: tuple of status
         """
-        self._lock.acquire()
         try:
-            if entity.name in self.completed:
-                return self.completed[entity.name].status
-
-            job = self[entity.name]  # locked
+            job = self._get_indexed_job(entity.name)
         except KeyError:
             raise SmartSimError(
                 f"Entity {entity.name} has not been launched in this Experiment"
             ) from None
+        return job.status
+
+    def get_statuses(self, entity_names):
+        """Return a snapshot of the statuses of many jobs
+
+        The statuses are read under a single acquisition of the
+        JobManager lock, so they reflect the same poll of the launcher.
+
+        :param entity_names: names of the entities of the jobs
+        :type entity_names: list[str]
+        :raises SmartSimError: if an entity has not been launched
+        :returns: mapping of entity name to job status
+        :rtype: dict[str, str]
+        """
+        statuses = {}
+        self._lock.acquire()
+        try:
+            index = self._job_index
+            for name in entity_names:
+                job = index.get(name)
+                if job is None:
+                    try:
+                        job = self[name]
+                    except KeyError:
+                        raise SmartSimError(
+                            f"Entity {name} has not been launched in this Experiment"
+                        ) from None
+                statuses[name] = job.status
         finally:
             self._lock.release()
-        return job.status
+        return statuses
+
+    def are_finished(self, entity_names):
+        """Detect if the jobs of many entities have all completed
+
+        :param entity_names: names of the entities of the jobs
+        :type entity_names: list[str]
+        :raises KeyError: if an entity has not been launched
+        :return: True if all are finished
+        :rtype: bool
+        """
+        finished = True
+        self._lock.acquire()
+        try:
+            index = self._job_index
+            completed = self.completed
+            for name in entity_names:
+                job = index.get(name)
+                if job is None:
+                    job = self[name]  # raises KeyError
+                if name not in completed or job.status not in TERMINAL_STATUSES:
+                    finished = False
+        finally:
+            self._lock.release()
+        return finished
+
+    def _get_indexed_job(self, entity_name):
+        """Return the job of an entity from the job index
+
+        Falls back to a locked lookup for jobs that were not added
+        through the JobManager (e.g. reconnected database jobs).
+
+        :param entity_name: name of the entity of the job
+        :type entity_name: str
+        :raises KeyError: if the entity has no job
+        :return: the job of the entity
+        :rtype: Job
+        """
+        job = self._job_index.get(entity_name)
+        if job is None:
+            job = self[entity_name]  # locked
+        return job
 
     def set_launcher(self, launcher):
         """Set the launcher of the job manager to a specific launcher instance
@@ -259,6 +517,30 @@ class JobManager:
         :type launcher: Launcher instance
         """
         self._launcher = launcher
+        self.polling = PollingPolicy.from_launcher(launcher)
+        if hasattr(launcher, "step_id_callback"):
+            launcher.step_id_callback = self.set_job_id
+
+    def set_job_id(self, job_name, job_id):
+        """Set the id of an active job once the launcher knows it
+
+        Ids reported before the job is added to the JobManager are
+        kept until ``add_job`` or ``restart_job`` is called for the step.
+
+        :param job_name: name of the job step
+        :type job_name: str
+        :param job_id: job step id reported by the launcher
+        :type job_id: str
+        """
+        self._lock.acquire()
+        try:
+            job = self._step_index.get(job_name)
+            if job is not None and job.name == job_name:
+                job.jid = job_id
+            else:
+                self._early_job_ids[job_name] = job_id
+        finally:
+            self._lock.release()
 
     def query_restart(self, entity_name):
         """See if the job just started should be restarted or not.
@@ -290,14 +572,23 @@ class JobManager:
         try:
             job = self.completed[entity_name]
             del self.completed[entity_name]
+            self._step_index.pop(job.name, None)
+            job_id = self._early_job_ids.pop(job_name, job_id)
             job.reset(job_name, job_id, is_task)
+            self._step_index[job_name] = job
 
             if isinstance(job.entity, (DBNode, Orchestrator)):
                 self.db_jobs[entity_name] = job
             else:
                 self.jobs[entity_name] = job
+            self._job_index[entity_name] = job
+            # the new run starts from STATUS_NEW, so that its statuses are
+            # published even if they match the last status of the previous run
+            event = self._create_status_event(job)
+            self.polling.notify()
         finally:
             self._lock.release()
+        self.events.publish([event] if event else [])
 
     def get_db_host_addresses(self):
         """Retrieve the list of hosts for the database
@@ -336,6 +627,9 @@ class JobManager:
         """Custom handler for whenever SIGINT is received"""
         if self.actively_monitoring and len(self) > 0:
             if self.kill_on_interrupt:
+                # cancel pending jobs first so that no slot is refilled
+                for entity_name in list(self.pending):
+                    self.cancel_pending_job(entity_name)
                 for _, job in self().items():
                     if job.status not in TERMINAL_STATUSES:
                         self._launcher.stop(job.name)
@@ -352,15 +646,15 @@ class JobManager:
                             f"Job {job_name} with {job.launched_with} id: {job.jid}"
                         )
 
+    def wake(self):
+        """Wake the job manager thread to check jobs early"""
+        self.polling.notify()
+
     def _thread_sleep(self):
-        """Sleep the job manager for a specific constant
-        set for the launcher type.
+        """Sleep the job manager until the next check is due
+        according to the polling policy.
         """
-        local_jm_interval = 2
-        if isinstance(self._launcher, (LocalLauncher)):
-            time.sleep(local_jm_interval)
-        else:
-            time.sleep(CONFIG.jm_interval)
+        self.polling.wait()
 
     def __len__(self):
         # number of active jobs
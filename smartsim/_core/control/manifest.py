@@ -171,6 +171,10 @@ class Manifest:
                 s += f"Members: {len(ensemble)}\n"
                 s += f"Batch Launch: {ensemble.batch}\n"
                 if ensemble.batch:
+                    if ensemble.array:
+                        s += "Job Array: True\n"
+                    if ensemble.packed:
+                        s += "Packed: True\n"
                     s += f"{str(ensemble.batch_settings)}\n"
             s += "\n"
         if self.models:
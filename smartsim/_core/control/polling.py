@@ -0,0 +1,160 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import time
+from threading import Event
+
+from ..config import CONFIG
+from ..launcher import LocalLauncher
+
+# the local launcher does not query a WLM and unmanaged tasks are
+# recorded by the event driven TaskManager, so updates are cheap
+LOCAL_MIN_INTERVAL = 0.1
+LOCAL_MAX_INTERVAL = 2
+
+
+class PollingPolicy:
+    """Decide how long the JobManager waits between status checks
+
+    The interval starts at ``min_interval`` and is multiplied by
+    ``backoff`` after every check in which no job changed status,
+    up to ``max_interval``. Launches and status changes reset the
+    interval to ``min_interval``.
+
+    Regardless of the interval, checks are never made closer than
+    ``query_interval`` apart so that the rate of WLM queries
+    (e.g. sacct, qstat) stays bounded.
+
+    The policy also counts the number of checks made and how late
+    completions were detected. As the WLM does not report when a
+    job finished, the delay of a completion is the time since the
+    previous check, an upper bound on how late it was detected.
+    """
+
+    def __init__(self, min_interval, max_interval, backoff=2.0, query_interval=0.0):
+        """Initialize a polling policy
+
+        :param min_interval: interval after launches and status changes
+        :type min_interval: float
+        :param max_interval: ceiling of the interval
+        :type max_interval: float
+        :param backoff: interval multiplier while nothing changes
+        :type backoff: float, optional
+        :param query_interval: minimum time between two checks
+        :type query_interval: float, optional
+        """
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max_interval
+        self.backoff = max(backoff, 1.0)
+        self.query_interval = query_interval
+        self.interval = self.min_interval
+
+        self._wakeup = Event()
+        self._last_query = None
+
+        self.num_queries = 0
+        self.num_completions = 0
+        self.total_detection_delay = 0.0
+        self.max_detection_delay = 0.0
+
+    @classmethod
+    def from_launcher(cls, launcher):
+        """Create the policy for a launcher from the SmartSim config
+
+        :param launcher: launcher the JobManager queries
+        :type launcher: Launcher
+        :return: polling policy
+        :rtype: PollingPolicy
+        """
+        if isinstance(launcher, LocalLauncher):
+            return cls(LOCAL_MIN_INTERVAL, LOCAL_MAX_INTERVAL, CONFIG.jm_backoff)
+        return cls(
+            CONFIG.jm_min_interval,
+            CONFIG.jm_interval,
+            CONFIG.jm_backoff,
+            CONFIG.jm_query_interval,
+        )
+
+    def wait(self):
+        """Wait until the next status check is due
+
+        Returns early if ``notify`` is called, but never before
+        ``query_interval`` has passed since the previous check.
+        """
+        if self._wakeup.wait(self.interval):
+            self.interval = self.min_interval
+        self._wakeup.clear()
+
+        if self._last_query is not None:
+            delay = self._last_query + self.query_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+    def notify(self):
+        """Wake the waiting JobManager, e.g. after a launch or stop"""
+        self.interval = self.min_interval
+        self._wakeup.set()
+
+    def record_query(self, changed, completions=0):
+        """Record a status check and adjust the interval
+
+        :param changed: whether any job changed status
+        :type changed: bool
+        :param completions: number of jobs seen finished for the first time
+        :type completions: int, optional
+        """
+        now = time.monotonic()
+        if completions and self._last_query is not None:
+            delay = now - self._last_query
+            self.num_completions += completions
+            self.total_detection_delay += delay * completions
+            self.max_detection_delay = max(self.max_detection_delay, delay)
+        self._last_query = now
+        self.num_queries += 1
+
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+
+    @property
+    def stats(self):
+        """Counters of the status checks made
+
+        :return: number of queries and completions, mean and max
+                 completion detection delay in seconds
+        :rtype: dict
+        """
+        mean_delay = 0.0
+        if self.num_completions:
+            mean_delay = self.total_detection_delay / self.num_completions
+        return {
+            "queries": self.num_queries,
+            "completions": self.num_completions,
+            "mean_detection_delay": mean_delay,
+            "max_detection_delay": self.max_detection_delay,
+        }
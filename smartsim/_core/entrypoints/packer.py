@@ -0,0 +1,127 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import argparse
+import json
+import os
+import re
+import signal
+import sys
+
+from smartsim._core.launcher.util.packing import Packer
+from smartsim.log import get_logger
+
+logger = get_logger(__name__)
+
+"""
+Packing entrypoint script
+
+Runs the members of a batch ensemble on free nodes of the
+allocation of the batch as earlier members finish.
+"""
+
+PACKER = None
+
+SIGNALS = [signal.SIGINT, signal.SIGQUIT, signal.SIGTERM, signal.SIGABRT]
+
+
+def handle_signal(signo, frame):
+    if PACKER:
+        PACKER.stop()
+    sys.exit(1)
+
+
+def get_allocation():
+    """Get the number of nodes and tasks per node of the allocation
+
+    :return: number of nodes and tasks per node, None where unknown
+    :rtype: tuple[int | None, int | None]
+    """
+    if "SLURM_JOB_NUM_NODES" in os.environ:
+        nodes = int(os.environ["SLURM_JOB_NUM_NODES"])
+        # e.g. 36(x2),24
+        cpus = re.match(r"\d+", os.environ.get("SLURM_JOB_CPUS_PER_NODE", ""))
+        return nodes, int(cpus.group()) if cpus else None
+
+    if "PBS_NODEFILE" in os.environ:
+        # one line per task slot of every node
+        with open(os.environ["PBS_NODEFILE"]) as f:
+            hosts = [line.strip() for line in f if line.strip()]
+        nodes = len(set(hosts))
+        return nodes, len(hosts) // nodes if nodes else None
+
+    if "LSB_MCPU_HOSTS" in os.environ:
+        # e.g. batch1 1 node1 42 node2 42
+        fields = os.environ["LSB_MCPU_HOSTS"].split()
+        slots = [int(count) for count in fields[1::2]]
+        # the launch node of the batch is listed first with a single slot
+        if len(slots) > 1 and slots[0] == 1 and slots[1] > 1:
+            slots = slots[1:]
+        return len(slots), min(slots) if slots else None
+
+    if "COBALT_PARTSIZE" in os.environ:
+        return int(os.environ["COBALT_PARTSIZE"]), None
+
+    return None, None
+
+
+def main(task_file, nodes, tasks_per_node):
+    global PACKER
+
+    with open(task_file) as f:
+        tasks = json.load(f)
+
+    alloc_nodes, alloc_tasks_per_node = get_allocation()
+    nodes = nodes or alloc_nodes or 1
+    tasks_per_node = tasks_per_node or alloc_tasks_per_node
+    logger.debug(
+        f"Packing {len(tasks)} tasks on {nodes} nodes "
+        f"with {tasks_per_node or 'unknown'} tasks per node"
+    )
+
+    PACKER = Packer(tasks, nodes, tasks_per_node)
+    failed = PACKER.run()
+    if failed:
+        logger.warning(f"{failed} of {len(tasks)} tasks failed")
+
+
+if __name__ == "__main__":
+
+    os.environ["PYTHONUNBUFFERED"] = "1"
+
+    parser = argparse.ArgumentParser(
+        prefix_chars="+", description="SmartSim Batch Packer"
+    )
+    parser.add_argument("+tasks", type=str, help="Task file of the batch")
+    parser.add_argument("+nodes", type=int, help="Nodes in the allocation")
+    parser.add_argument("+tasks_per_node", type=int, help="Tasks that fit on a node")
+    args = parser.parse_args()
+
+    for sig in SIGNALS:
+        signal.signal(sig, handle_signal)
+
+    main(args.tasks, args.nodes, args.tasks_per_node)
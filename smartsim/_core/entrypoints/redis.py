@@ -27,12 +27,14 @@
 import argparse
 import os
 import signal
-from subprocess import PIPE, STDOUT
+from functools import partial
+from subprocess import STDOUT
 from typing import List
 
 import psutil
 
 from smartsim._core.utils.network import current_ip
+from smartsim._core.utils.rendezvous import write_rendezvous_file
 from smartsim.error import SSInternalError
 from smartsim.log import get_logger
 
@@ -42,7 +44,7 @@ logger = get_logger(__name__)
 Redis/KeyDB entrypoint script
 """
 
-DBPID = None
+DBPIDS = []
 
 # kill is not catchable
 SIGNALS = [signal.SIGINT, signal.SIGQUIT, signal.SIGTERM, signal.SIGABRT]
@@ -52,42 +54,79 @@ def handle_signal(signo, frame):
     cleanup()
 
 
-def main(network_interface: str, command: List[str]):
-    global DBPID
-
+def get_cpu_sets(num_shards):
+    """Split the CPUs available to this process between shards
+
+    :param num_shards: number of shards started by this process
+    :type num_shards: int
+    :return: CPUs of each shard, None if there are not enough CPUs
+    :rtype: list[list[int]] | None
+    """
+    cpus = sorted(os.sched_getaffinity(0))
+    cpus_per_shard = len(cpus) // num_shards
+    if cpus_per_shard == 0:
+        logger.warning(f"Cannot pin {num_shards} shards to {len(cpus)} CPUs")
+        return None
+    return [
+        cpus[shard * cpus_per_shard : (shard + 1) * cpus_per_shard]
+        for shard in range(num_shards)
+    ]
+
+
+def main(
+    network_interface: str,
+    commands: List[List[str]],
+    rendezvous_files: List[str] = None,
+    pin_cpus: bool = False,
+):
     try:
 
         ip_address = current_ip(network_interface)
-        cmd = command + [f"--bind {ip_address}"]
+        cmds = [command + [f"--bind {ip_address}"] for command in commands]
+        cpu_sets = get_cpu_sets(len(cmds)) if pin_cpus else None
 
         print("-" * 10, "  Running  Command  ", "-" * 10, "\n", flush=True)
-        print(f"COMMAND: {' '.join(cmd)}\n", flush=True)
+        for cmd in cmds:
+            print(f"COMMAND: {' '.join(cmd)}\n", flush=True)
         print(f"IPADDRESS: {ip_address}\n", flush=True)
         print(f"NETWORK: {network_interface}\n", flush=True)
         print("-" * 30, "\n\n", flush=True)
 
         print("-" * 10, "  Output  ", "-" * 10, "\n\n", flush=True)
 
-        p = psutil.Popen(cmd, stdout=PIPE, stderr=STDOUT)
-        DBPID = p.pid
-
-        for line in iter(p.stdout.readline, b""):
-            print(line.decode("utf-8").rstrip(), flush=True)
+        # the output of all database processes goes to our stdout
+        processes = []
+        for shard, cmd in enumerate(cmds):
+            preexec_fn = None
+            if cpu_sets:
+                # pinned before exec so that every thread of the
+                # database process inherits the CPU set
+                preexec_fn = partial(os.sched_setaffinity, 0, cpu_sets[shard])
+            p = psutil.Popen(cmd, stderr=STDOUT, preexec_fn=preexec_fn)
+            DBPIDS.append(p.pid)
+            processes.append(p)
+
+            # report the address once the database process is started
+            if rendezvous_files:
+                port = int(cmd[cmd.index("--port") + 1])
+                write_rendezvous_file(rendezvous_files[shard], ip_address, port, p.pid)
+
+        for p in processes:
+            p.wait()
     except Exception as e:
         cleanup()
         raise SSInternalError("Database process starter raised an exception") from e
 
 
 def cleanup():
-    global DBPID
     try:
-        logger.debug("Cleaning up database instance")
-        # attempt to stop the database process
-        db_proc = psutil.Process(DBPID)
-        db_proc.terminate()
-
-    except psutil.NoSuchProcess:
-        logger.warning("Couldn't find database process to kill.")
+        logger.debug("Cleaning up database instances")
+        # attempt to stop the database processes
+        for pid in DBPIDS:
+            try:
+                psutil.Process(pid).terminate()
+            except psutil.NoSuchProcess:
+                logger.warning("Couldn't find database process to kill.")
 
     except OSError as e:
         logger.warning(f"Failed to clean up database gracefully: {str(e)}")
@@ -103,7 +142,23 @@ if __name__ == "__main__":
     parser.add_argument(
         "+ifname", type=str, help="Network Interface name", default="lo"
     )
-    parser.add_argument("+command", nargs="+", help="Command to run")
+    parser.add_argument(
+        "+command",
+        nargs="+",
+        action="append",
+        help="Command to run, repeat to run several database processes",
+    )
+    parser.add_argument(
+        "+rendezvous",
+        type=str,
+        action="append",
+        help="File to report the address of each database process to",
+    )
+    parser.add_argument(
+        "+pin_cpus",
+        action="store_true",
+        help="Split the available CPUs between the database processes",
+    )
     args = parser.parse_args()
 
     # make sure to register the cleanup before the start
@@ -112,4 +167,4 @@ if __name__ == "__main__":
     for sig in SIGNALS:
         signal.signal(sig, handle_signal)
 
-    main(args.ifname, args.command)
+    main(args.ifname, args.command, args.rendezvous, args.pin_cpus)
@@ -36,7 +36,11 @@ from ..launcher import WLMLauncher
 from ..pbs.pbsCommands import qdel, qstat
 from ..step import AprunStep, CobaltBatchStep, LocalStep, MpirunStep
 from ..stepInfo import CobaltStepInfo
-from .cobaltParser import parse_cobalt_step_id, parse_cobalt_step_status, parse_qsub_out
+from .cobaltParser import (
+    parse_cobalt_step_id,
+    parse_cobalt_step_statuses,
+    parse_qsub_out,
+)
 
 logger = get_logger(__name__)
 
@@ -102,6 +106,7 @@ class CobaltLauncher(WLMLauncher):
         if not step_id and step.managed:
             step_id = self._get_cobalt_step_id(step)
         self.step_mapping.add(step.name, step_id, task_id, step.managed)
+        self.step_queries.invalidate([step_id])
         return step_id
 
     def stop(self, step_name):
@@ -117,6 +122,7 @@ class CobaltLauncher(WLMLauncher):
             qdel_rc, _, err = qdel([str(stepmap.step_id)])
             if qdel_rc != 0:
                 logger.warning(f"Unable to cancel job step {step_name}\n {err}")
+            self.step_queries.invalidate([stepmap.step_id])
             if stepmap.task_id:
                 self.task_manager.remove_task(stepmap.task_id)
         else:
@@ -156,9 +162,8 @@ class CobaltLauncher(WLMLauncher):
         args.extend(step_ids)
         qstat_out, _ = qstat(args)
 
-        stats = [
-            parse_cobalt_step_status(qstat_out, str(step_id)) for step_id in step_ids
-        ]
+        statuses = parse_cobalt_step_statuses(qstat_out)
+        stats = [statuses.get(str(step_id), "NOTFOUND") for step_id in step_ids]
         # create CobaltStepInfo objects to return
         updates = []
         for stat, _ in zip(stats, step_ids):
@@ -26,14 +26,23 @@
 
 
 def parse_cobalt_step_status(output, step_id):
-    status = "NOTFOUND"
+    return parse_cobalt_step_statuses(output).get(step_id, "NOTFOUND")
+
+
+def parse_cobalt_step_statuses(output):
+    """Parse the status of every step of a cobalt qstat command
+
+    :param output: output of qstat
+    :type output: str
+    :return: mapping of step id to status
+    :rtype: dict[str, str]
+    """
+    statuses = {}
     for line in output.split("\n"):
         fields = line.split()
         if len(fields) >= 2:
-            if fields[0] == step_id:
-                status = fields[1]
-                break
-    return status
+            statuses.setdefault(fields[0], fields[1])
+    return statuses
 
 
 def parse_cobalt_step_id(output, step_name):
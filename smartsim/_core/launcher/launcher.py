@@ -27,9 +27,12 @@
 import abc
 
 from ...error import AllocationError, LauncherError, SSUnsupportedError
+from ..config import CONFIG
+from .queryBroker import QueryBroker
 from .stepInfo import UnmanagedStepInfo
 from .stepMapping import StepMapping
 from .taskManager import TaskManager
+from .util.shell import start_command_runner
 
 
 class Launcher(abc.ABC):  # pragma: no cover
@@ -41,6 +44,12 @@ class Launcher(abc.ABC):  # pragma: no cover
     be fully compatible.
     """
 
+    # number of job steps the controller may launch concurrently
+    launch_workers = 1
+    # upper bound on launch_workers that SMARTSIM_LAUNCH_WORKERS can not
+    # override, for launchers whose step ids depend on the launch order
+    max_launch_workers = None
+
     def __init__(self):
         pass
 
@@ -71,10 +80,20 @@ class WLMLauncher(Launcher):  # cov-wlm
     implemented methods that are alike across all WLM launchers.
     """
 
+    launch_workers = 8
+
     def __init__(self):
         super().__init__()
         self.task_manager = TaskManager()
         self.step_mapping = StepMapping()
+        # called with (step name, step id) for steps whose id is
+        # only known after they have been launched
+        self.step_id_callback = None
+        self.step_queries = QueryBroker(
+            self._get_managed_step_update, CONFIG.wlm_query_ttl
+        )
+        if CONFIG.command_runner:
+            start_command_runner()
 
     # every launcher utilizing this interface must have a map
     # of supported RunSettings types (see slurmLauncher.py for ex)
@@ -104,6 +123,17 @@ class WLMLauncher(Launcher):  # cov-wlm
         except AllocationError as e:
             raise LauncherError("Step creation failed") from e
 
+    def _add_array_tasks(self, step, step_id):
+        """Map the tasks of a submitted job array to their ids
+
+        :param step: a batch step
+        :type step: Step
+        :param step_id: id of the submitted batch
+        :type step_id: str
+        """
+        for step_name, _, task_step_id in step.get_array_tasks(step_id):
+            self.step_mapping.add(step_name, task_step_id, None, True)
+
     # these methods are implemented in WLM launchers and
     # don't need to be covered here.
 
@@ -125,18 +155,19 @@ class WLMLauncher(Launcher):  # cov-wlm
         :rtype: list[(str, StepInfo)]
         """
         updates = []
+        managed, unmanaged = self.step_mapping.get_partitioned_ids(step_names)
 
         # get updates of jobs managed by workload manager (PBS, Slurm, etc)
         # this is primarily batch jobs.
-        s_names, step_ids = self.step_mapping.get_ids(step_names, managed=True)
+        s_names, step_ids = managed
         if len(step_ids) > 0:
-            s_statuses = self._get_managed_step_update(step_ids)
+            s_statuses = self.step_queries.get(step_ids)
             _updates = [(name, stat) for name, stat in zip(s_names, s_statuses)]
             updates.extend(_updates)
 
         # get updates of unmanaged jobs (Aprun, mpirun, etc)
         # usually jobs started and monitored through the Popen interface
-        t_names, task_ids = self.step_mapping.get_ids(step_names, managed=False)
+        t_names, task_ids = unmanaged
         if len(task_ids) > 0:
             t_statuses = self._get_unmanaged_step_update(task_ids)
             _updates = [(name, stat) for name, stat in zip(t_names, t_statuses)]
@@ -38,6 +38,10 @@ logger = get_logger(__name__)
 class LocalLauncher:
     """Launcher used for spawning proceses on a localhost machine."""
 
+    # number of job steps the controller may launch concurrently
+    launch_workers = 8
+    max_launch_workers = None
+
     def __init__(self):
         self.task_manager = TaskManager()
         self.step_mapping = StepMapping()
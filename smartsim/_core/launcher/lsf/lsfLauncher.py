@@ -25,6 +25,10 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import time
+from collections import OrderedDict
+from threading import RLock
+
+import psutil
 
 from ....error import LauncherError
 from ....log import get_logger
@@ -33,16 +37,21 @@ from ....status import STATUS_CANCELLED, STATUS_COMPLETED
 from ..launcher import WLMLauncher
 from ..step import BsubBatchStep, JsrunStep, LocalStep, MpirunStep
 from ..stepInfo import LSFBatchStepInfo, LSFJsrunStepInfo
+from ..stepMapping import StepMap
 from .lsfCommands import bjobs, bkill, jskill, jslist
 from .lsfParser import (
-    parse_bjobs_jobid,
+    parse_bjobs_jobids,
     parse_bsub,
-    parse_jslist_stepid,
+    parse_jslist_stepids,
     parse_max_step_id_from_jslist,
 )
 
 logger = get_logger(__name__)
 
+# seconds after which a jsrun step still missing from jslist
+# is monitored through its jsrun process only
+STEP_ID_TIMEOUT = 10
+
 
 class LSFLauncher(WLMLauncher):
     """This class encapsulates the functionality needed
@@ -53,9 +62,27 @@ class LSFLauncher(WLMLauncher):
     in this case LSF. Unmanaged jobs are held in the TaskManager
     and are managed through references to their launching process ID
     i.e. a psutil.Popen object
+
+    jslist does not list the names of jsrun steps. Steps are
+    monitored through their jsrun process until the next status
+    update, which reads the ids of every step launched since the
+    previous one from a single jslist snapshot (see
+    ``_get_lsf_step_ids``).
     """
 
-    # init in WLMLauncher, launcher.py
+    # jsrun step ids are given to steps in the order they are
+    # launched, so launches cannot overlap, whatever the value
+    # of SMARTSIM_LAUNCH_WORKERS
+    launch_workers = 1
+    max_launch_workers = 1
+
+    def __init__(self):
+        super().__init__()
+        # step name : (allocation, deadline) of jsrun steps without an id
+        self._pending_steps = OrderedDict()
+        # highest jsrun step id given to a step
+        self._last_step_id = None
+        self._step_id_lock = RLock()
 
     # RunSettings types supported by this launcher
     supported_rs = {
@@ -80,6 +107,7 @@ class LSFLauncher(WLMLauncher):
         cmd_list = step.get_launch_cmd()
         step_id = None
         task_id = None
+        managed = step.managed
         if isinstance(step, BsubBatchStep):
             # wait for batch step to submit successfully
             rc, out, err = self.task_manager.start_and_wait(cmd_list, step.cwd)
@@ -88,11 +116,22 @@ class LSFLauncher(WLMLauncher):
             if out:
                 step_id = parse_bsub(out)
                 logger.debug(f"Gleaned batch job id: {step_id} for {step.name}")
+                self._add_array_tasks(step, step_id)
         elif isinstance(step, JsrunStep):
-            self.task_manager.start_task(cmd_list, step.cwd)
-            time.sleep(1)
-            step_id = self._get_lsf_step_id(step)
-            logger.debug(f"Gleaned jsrun step id: {step_id} for {step.name}")
+            with self._step_id_lock:
+                if self._last_step_id is None:
+                    # steps listed before the first launch are not ours
+                    output, _ = jslist([])
+                    self._last_step_id = int(parse_max_step_id_from_jslist(output) or 0)
+                task_id = self.task_manager.start_task(
+                    cmd_list, step.cwd, output_files=step.get_launcher_output_files()
+                )
+                # monitor the jsrun process until jslist reports the step id
+                self.step_mapping.add(step.name, None, task_id, False)
+                deadline = time.monotonic() + STEP_ID_TIMEOUT
+                self._pending_steps[step.name] = (step.alloc, deadline)
+            # the step id may already have been found by a status update
+            return None
         else:  # isinstance(step, MpirunStep) or isinstance(step, LocalStep)
             out, err = step.get_output_files()
             # mpirun and local launch don't direct output for us
@@ -102,7 +141,8 @@ class LSFLauncher(WLMLauncher):
                 cmd_list, step.cwd, out=output, err=error
             )
 
-        self.step_mapping.add(step.name, step_id, task_id, step.managed)
+        self.step_mapping.add(step.name, step_id, task_id, managed)
+        self.step_queries.invalidate([step_id])
         return step_id
 
     def stop(self, step_name):
@@ -113,6 +153,8 @@ class LSFLauncher(WLMLauncher):
         :return: update for job due to cancel
         :rtype: StepInfo
         """
+        with self._step_id_lock:
+            self._pending_steps.pop(step_name, None)
         stepmap = self.step_mapping[step_name]
         if stepmap.managed:
             if "." in stepmap.step_id:
@@ -121,6 +163,7 @@ class LSFLauncher(WLMLauncher):
                 rc, _, err = bkill([str(stepmap.step_id)])
             if rc != 0:
                 logger.warning(f"Unable to cancel job step {step_name}\n {err}")
+            self.step_queries.invalidate([stepmap.step_id])
             if stepmap.task_id:
                 self.task_manager.remove_task(stepmap.task_id)
         else:
@@ -130,46 +173,138 @@ class LSFLauncher(WLMLauncher):
         step_info.status = STATUS_CANCELLED  # set status to cancelled instead of failed
         return step_info
 
-    def _get_lsf_step_id(self, step, interval=2, trials=5):
-        """Get the step_id of last launched step from jslist"""
-        time.sleep(interval)
-        step_id = "unassigned"
-        while trials > 0:
-            output, _ = jslist([])
-            step_id = parse_max_step_id_from_jslist(output)
-            if step_id:
-                break
-            else:
-                time.sleep(interval)
-                trials -= 1
-        if not step_id:
-            raise LauncherError("Could not find id of launched job step")
-        return f"{step.alloc}.{step_id}"
+    def get_step_update(self, step_names):
+        """Get update for a list of job steps
+
+        The ids of jsrun steps launched since the previous update
+        are read from jslist first.
+
+        :param step_names: list of job steps to get updates for
+        :type step_names: list[str]
+        :return: list of name, job update tuples
+        :rtype: list[(str, StepInfo)]
+        """
+        if self._pending_steps:
+            self._get_lsf_step_ids()
+        return super().get_step_update(step_names)
+
+    def _get_lsf_step_ids(self):
+        """Give ids to the jsrun steps launched since the last snapshot
+
+        jsrun step ids increase with every launch, so the running
+        steps listed by one jslist snapshot above the last id given
+        out belong to the pending steps whose jsrun process is alive,
+        in launch order. Pending steps whose jsrun process has exited
+        may never have been listed, so they are not given an id and
+        stay monitored through their jsrun process.
+        """
+        with self._step_id_lock:
+            alive_before = self._get_live_pending_steps()
+            try:
+                output, _ = jslist([])
+            except LauncherError as e:
+                logger.debug(f"Failed to query jsrun step ids: {e}")
+                return
+            alive = self._get_live_pending_steps()
+            for step_name in list(self._pending_steps):
+                if step_name not in alive:
+                    del self._pending_steps[step_name]
+                    logger.debug(
+                        f"jsrun process of {step_name} exited before its step id "
+                        "was found, monitoring its jsrun process instead"
+                    )
+            if alive != alive_before:
+                # steps that exited during the snapshot may be listed as
+                # running, which would shift the ids of the steps after them
+                return
+
+            new_ids = sorted(
+                int(step_id)
+                for step_id, (status, _) in parse_jslist_stepids(output).items()
+                if step_id.isdigit()
+                and int(step_id) > self._last_step_id
+                and status == "Running"
+            )
+            pending = list(self._pending_steps.items())
+            for (step_name, (alloc, _)), jsrun_id in zip(pending, new_ids):
+                del self._pending_steps[step_name]
+                self._last_step_id = jsrun_id
+                self._set_step_id(step_name, f"{alloc}.{jsrun_id}")
+
+            now = time.monotonic()
+            for step_name, (_, deadline) in pending[len(new_ids) :]:
+                if now > deadline:
+                    del self._pending_steps[step_name]
+                    logger.warning(
+                        f"Could not find id of launched job step {step_name}, "
+                        "monitoring its jsrun process instead"
+                    )
+
+    def _get_live_pending_steps(self):
+        """Get the names of the pending steps whose jsrun process is alive
+
+        :return: names of the live pending steps
+        :rtype: set[str]
+        """
+        alive = set()
+        for step_name in self._pending_steps:
+            task_id = self.step_mapping[step_name].task_id
+            try:
+                task = self.task_manager[task_id]
+                if task.is_alive and task.status != psutil.STATUS_ZOMBIE:
+                    alive.add(step_name)
+            except (KeyError, psutil.NoSuchProcess):
+                pass
+        return alive
+
+    def _set_step_id(self, step_name, step_id):
+        """Monitor a jsrun step through LSF once its id is known
+
+        :param step_name: name of the step
+        :type step_name: str
+        :param step_id: id of the step
+        :type step_id: str
+        """
+        logger.debug(f"Gleaned jsrun step id: {step_id} for {step_name}")
+        stepmap = self.step_mapping[step_name]
+        self.step_mapping[step_name] = StepMap(step_id, stepmap.task_id, True)
+        self.step_queries.invalidate([step_id])
+        if self.step_id_callback:
+            self.step_id_callback(step_name, step_id)
 
     def _get_managed_step_update(self, step_ids):
         """Get step updates for WLM managed jobs
 
+        Runs at most one jslist and one bjobs command for all steps.
+
         :param step_ids: list of job step ids
         :type step_ids: list[str]
         :return: list of updates for managed jobs
         :rtype: list[StepInfo]
         """
-        updates = []
-
-        for step_id in step_ids:
+        # Batch jobs have integer step id,
+        # Jsrun processes have {alloc}.{task_id}
+        jsrun_ids = [step_id for step_id in step_ids if "." in str(step_id)]
+        batch_ids = [str(step_id) for step_id in step_ids if "." not in str(step_id)]
 
-            # Batch jobs have integer step id,
-            # Jsrun processes have {alloc}.{task_id}
+        jsrun_steps = {}
+        if jsrun_ids:
+            jslist_out, _ = jslist([])
+            jsrun_steps = parse_jslist_stepids(jslist_out)
+        batch_jobs = {}
+        if batch_ids:
             # Include recently finished jobs
+            bjobs_out, _ = bjobs(["-a"] + batch_ids)
+            batch_jobs = parse_bjobs_jobids(bjobs_out)
+
+        updates = []
+        for step_id in step_ids:
             if "." in str(step_id):
                 jsrun_step_id = step_id.rpartition(".")[-1]
-                jslist_out, _ = jslist([])
-                stat, return_code = parse_jslist_stepid(jslist_out, jsrun_step_id)
+                stat, return_code = jsrun_steps.get(jsrun_step_id, ("NOTFOUND", None))
                 info = LSFJsrunStepInfo(stat, return_code)
             else:
-                bjobs_args = ["-a"] + step_ids
-                bjobs_out, _ = bjobs(bjobs_args)
-                stat = parse_bjobs_jobid(bjobs_out, str(step_id))
+                stat = batch_jobs.get(str(step_id), "NOTFOUND")
                 # create LSFBatchStepInfo objects to return
                 info = LSFBatchStepInfo(stat, None)
                 # account for case where job history is not logged by LSF
@@ -25,6 +25,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import json
+import re
 
 
 def parse_bsub(output):
@@ -82,18 +83,23 @@ def parse_jslist_stepid(output, step_id):
     :return: status and return code
     :rtype: (str, str)
     """
-    result = ("NOTFOUND", None)
+    return parse_jslist_stepids(output).get(step_id, ("NOTFOUND", None))
 
+
+def parse_jslist_stepids(output):
+    """Parse the status of every step of the jslist command
+
+    :param output: output of the jslist command
+    :type output: str
+    :return: mapping of step id to status and return code
+    :rtype: dict[str, (str, str)]
+    """
+    results = {}
     for line in output.split("\n"):
         fields = line.split()
         if len(fields) >= 7:
-            if fields[0] == step_id:
-                stat = fields[6]
-                return_code = fields[5]
-                result = (stat, return_code)
-                break
-
-    return result
+            results.setdefault(fields[0], (fields[6], fields[5]))
+    return results
 
 
 def parse_bjobs_jobid(output, job_id):
@@ -107,15 +113,29 @@ def parse_bjobs_jobid(output, job_id):
     :return: status
     :rtype: str
     """
-    result = "NOTFOUND"
+    return parse_bjobs_jobids(output).get(job_id, "NOTFOUND")
+
+
+def parse_bjobs_jobids(output):
+    """Parse the status of every job of the bjobs command
+
+    :param output: output of the bjobs command
+    :type output: str
+    :return: mapping of job id to status
+    :rtype: dict[str, str]
+    """
+    results = {}
     for line in output.split("\n"):
         fields = line.split()
         if len(fields) >= 3:
-            if fields[0] == job_id:
-                stat = fields[2]
-                result = stat
-                break
-    return result
+            results.setdefault(fields[0], fields[2])
+            # elements of a job array are listed under the id of the
+            # array with their index in the job name, e.g. name[3]
+            for field in fields[3:]:
+                index = re.search(r"\[(\d+)\]$", field)
+                if index:
+                    results.setdefault(f"{fields[0]}[{index.group(1)}]", fields[2])
+    return results
 
 
 def parse_bjobs_nodes(output):
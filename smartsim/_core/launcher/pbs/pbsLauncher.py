@@ -34,7 +34,7 @@ from ..launcher import WLMLauncher
 from ..step import AprunStep, LocalStep, MpirunStep, QsubBatchStep
 from ..stepInfo import PBSStepInfo
 from .pbsCommands import qdel, qstat
-from .pbsParser import parse_qstat_jobid, parse_step_id_from_qstat
+from .pbsParser import parse_qstat_jobids, parse_step_id_from_qstat
 
 logger = get_logger(__name__)
 
@@ -95,7 +95,10 @@ class PBSLauncher(WLMLauncher):
         # if batch submission did not successfully retrieve job ID
         if not step_id and step.managed:
             step_id = self._get_pbs_step_id(step)
+        if isinstance(step, QsubBatchStep):
+            self._add_array_tasks(step, step_id)
         self.step_mapping.add(step.name, step_id, task_id, step.managed)
+        self.step_queries.invalidate([step_id])
 
         return step_id
 
@@ -112,6 +115,7 @@ class PBSLauncher(WLMLauncher):
             qdel_rc, _, err = qdel([str(stepmap.step_id)])
             if qdel_rc != 0:
                 logger.warning(f"Unable to cancel job step {step_name}\n {err}")
+            self.step_queries.invalidate([stepmap.step_id])
             if stepmap.task_id:
                 self.task_manager.remove_task(stepmap.task_id)
         else:
@@ -152,7 +156,8 @@ class PBSLauncher(WLMLauncher):
         updates = []
 
         qstat_out, _ = qstat(step_ids)
-        stats = [parse_qstat_jobid(qstat_out, str(step_id)) for step_id in step_ids]
+        qstat_jobs = parse_qstat_jobids(qstat_out)
+        stats = [qstat_jobs.get(str(step_id), "NOTFOUND") for step_id in step_ids]
         # create PBSStepInfo objects to return
 
         for stat, _ in zip(stats, step_ids):
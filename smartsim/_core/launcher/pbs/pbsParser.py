@@ -71,15 +71,23 @@ def parse_qstat_jobid(output, job_id):
     :return: status
     :rtype: str
     """
-    result = "NOTFOUND"
+    return parse_qstat_jobids(output).get(job_id, "NOTFOUND")
+
+
+def parse_qstat_jobids(output):
+    """Parse the status of every job of the qstat command
+
+    :param output: output of the qstat command
+    :type output: str
+    :return: mapping of job id to status
+    :rtype: dict[str, str]
+    """
+    results = {}
     for line in output.split("\n"):
         fields = line.split()
         if len(fields) >= 5:
-            if fields[0] == job_id:
-                stat = fields[4]
-                result = stat
-                break
-    return result
+            results.setdefault(fields[0], fields[4])
+    return results
 
 
 def parse_qstat_nodes(output):
@@ -0,0 +1,171 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import time
+from threading import Condition
+
+
+class QueryBroker:
+    """Share the status queries of a WLM between callers
+
+    Step statuses are requested by the JobManager thread, by stops
+    and by users. Rather than every request running its own WLM
+    command (e.g. sacct, qstat), the broker
+
+      - serves statuses queried less than ``ttl`` seconds ago
+        from a cache
+      - runs a single query at a time. Requests made while a query
+        is running are merged and answered by the next query, as
+        the running one may have read the WLM before the request
+      - drops cached statuses of steps that are launched or stopped
+        (see ``invalidate``), and statuses too old to be served, such
+        as those of steps that have completed and are no longer queried
+
+    The number of queries and their latency are recorded in ``stats``.
+    """
+
+    def __init__(self, query, ttl=0.5):
+        """Initialize a query broker
+
+        :param query: function returning the statuses of a list of step ids
+        :type query: callable
+        :param ttl: seconds a queried status is served from the cache
+        :type ttl: float, optional
+        """
+        self._query = query
+        self.ttl = ttl
+
+        # step id : (start time of query, status)
+        self._cache = {}
+        # step ids requested for the next query
+        self._requested = set()
+        self._querying = False
+        self._cond = Condition()
+
+        self.num_requests = 0
+        self.num_cache_hits = 0
+        self.num_queries = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def get(self, step_ids):
+        """Get the status of steps
+
+        :param step_ids: ids of the steps
+        :type step_ids: list[str]
+        :return: status of every step
+        :rtype: list
+        """
+        with self._cond:
+            self.num_requests += 1
+            requested = time.monotonic()
+            if self._queried_since(step_ids, requested - self.ttl):
+                self.num_cache_hits += 1
+                return [self._cache[step_id][1] for step_id in step_ids]
+
+            while not self._queried_since(step_ids, requested):
+                self._requested.update(step_ids)
+                if self._querying:
+                    # answered by the next query
+                    self._cond.wait()
+                else:
+                    self._run_query()
+            return [self._cache[step_id][1] for step_id in step_ids]
+
+    def invalidate(self, step_ids):
+        """Drop the cached status of steps
+
+        :param step_ids: ids of the steps
+        :type step_ids: list[str]
+        """
+        with self._cond:
+            for step_id in step_ids:
+                self._cache.pop(step_id, None)
+
+    def _queried_since(self, step_ids, since):
+        for step_id in step_ids:
+            cached = self._cache.get(step_id)
+            if cached is None or cached[0] < since:
+                return False
+        return True
+
+    def _run_query(self):
+        """Query every requested step, called with the condition held"""
+        step_ids = list(self._requested)
+        self._requested.clear()
+        self._querying = True
+        self._cond.release()
+        try:
+            start = time.monotonic()
+            statuses = self._query(step_ids)
+            end = time.monotonic()
+        finally:
+            self._cond.acquire()
+            self._querying = False
+            self._cond.notify_all()
+
+        latency = end - start
+        self.num_queries += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self._evict(start - self.ttl)
+        for step_id, status in zip(step_ids, statuses):
+            # statuses are as old as the start of the query
+            self._cache[step_id] = (start, status)
+
+    def _evict(self, before):
+        """Drop cached statuses queried before a time
+
+        :param before: time.monotonic() value
+        :type before: float
+        """
+        expired = [
+            step_id
+            for step_id, (queried, _) in self._cache.items()
+            if queried < before and step_id not in self._requested
+        ]
+        for step_id in expired:
+            del self._cache[step_id]
+
+    @property
+    def stats(self):
+        """Counters of the requests and queries made
+
+        :return: number of requests, cache hits and queries,
+                 mean and max query latency in seconds
+        :rtype: dict
+        """
+        mean_latency = 0.0
+        if self.num_queries:
+            mean_latency = self.total_latency / self.num_queries
+        return {
+            "requests": self.num_requests,
+            "cache_hits": self.num_cache_hits,
+            "queries": self.num_queries,
+            "mean_latency": mean_latency,
+            "max_latency": self.max_latency,
+        }
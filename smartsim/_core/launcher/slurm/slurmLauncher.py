@@ -24,18 +24,21 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import time
 from shutil import which
 
 from ....error import LauncherError
 from ....log import get_logger
 from ....settings import *
 from ....status import STATUS_CANCELLED
+from ...config import CONFIG
 from ..launcher import WLMLauncher
 from ..step import LocalStep, MpirunStep, SbatchStep, SrunStep
 from ..stepInfo import SlurmStepInfo
+from ..stepMapping import StepMap
+from ..util.rateLimiter import RateLimiter
 from .slurmCommands import sacct, scancel, sstat
-from .slurmParser import parse_sacct, parse_sstat_nodes, parse_step_id_from_sacct
+from .slurmParser import parse_sacct_steps, parse_sstat_nodes
+from .stepIdResolver import StepIdResolver
 
 logger = get_logger(__name__)
 
@@ -49,9 +52,16 @@ class SlurmLauncher(WLMLauncher):
     in this case Slurm. Unmanaged jobs are held in the TaskManager
     and are managed through references to their launching process ID
     i.e. a psutil.Popen object
+
+    Steps are submitted back-to-back under a rate limit. The ids of
+    srun steps are resolved in the background (see ``StepIdResolver``)
+    and until then the steps are monitored through their srun process.
     """
 
-    # init in launcher.py (WLMLauncher)
+    def __init__(self):
+        super().__init__()
+        self._launch_limiter = RateLimiter(CONFIG.wlm_launch_rate)
+        self._step_ids = StepIdResolver(self._set_step_id, self._step_id_not_found)
 
     # RunSettings types supported by this launcher
     supported_rs = {
@@ -113,6 +123,10 @@ class SlurmLauncher(WLMLauncher):
         cmd_list = step.get_launch_cmd()
         step_id = None
         task_id = None
+        managed = step.managed
+
+        # give slurm a rest
+        self._launch_limiter.acquire()
 
         # Launch a batch step with Slurm
         if isinstance(step, SbatchStep):
@@ -123,11 +137,17 @@ class SlurmLauncher(WLMLauncher):
             if out:
                 step_id = out.strip()
                 logger.debug(f"Gleaned batch job id: {step_id} for {step.name}")
+                self._add_array_tasks(step, step_id)
 
         # Launch a in-allocation or on-allocation (if srun) command
         else:
             if isinstance(step, SrunStep):
-                task_id = self.task_manager.start_task(cmd_list, step.cwd)
+                task_id = self.task_manager.start_task(
+                    cmd_list, step.cwd, output_files=step.get_launcher_output_files()
+                )
+                # monitor the srun process until slurm reports the step id
+                managed = False
+                self._step_ids.add(step.name)
             else:
                 # Mpirun doesn't direct output for us like srun does
                 out, err = step.get_output_files()
@@ -137,14 +157,8 @@ class SlurmLauncher(WLMLauncher):
                     cmd_list, step.cwd, out=output, err=error
                 )
 
-        if not step_id and step.managed:
-            step_id = self._get_slurm_step_id(step)
-        self.step_mapping.add(step.name, step_id, task_id, step.managed)
-
-        # give slurm a rest
-        # TODO make this configurable
-        time.sleep(1)
-
+        self.step_mapping.add(step.name, step_id, task_id, managed)
+        self.step_queries.invalidate([step_id])
         return step_id
 
     def stop(self, step_name):
@@ -155,6 +169,7 @@ class SlurmLauncher(WLMLauncher):
         :return: update for job due to cancel
         :rtype: StepInfo
         """
+        self._step_ids.remove(step_name)
         stepmap = self.step_mapping[step_name]
         if stepmap.managed:
             step_id = str(stepmap.step_id)
@@ -166,6 +181,7 @@ class SlurmLauncher(WLMLauncher):
             scancel_rc, _, err = scancel([step_id])
             if scancel_rc != 0:
                 logger.warning(f"Unable to cancel job step {step_name}\n {err}")
+            self.step_queries.invalidate([stepmap.step_id])
             if stepmap.task_id:
                 self.task_manager.remove_task(stepmap.task_id)
         else:
@@ -175,30 +191,26 @@ class SlurmLauncher(WLMLauncher):
         step_info.status = STATUS_CANCELLED  # set status to cancelled instead of failed
         return step_info
 
-    def _get_slurm_step_id(self, step, interval=2, trials=5):
-        """Get the step_id of a step from sacct
-
-        Parses sacct output by looking for the step name
-        e.g. the following
+    def _set_step_id(self, step_name, step_id):
+        """Monitor a step through Slurm once its id is known
 
-        SmartSim|119225|
-        extern|119225.extern|
-        m1-119225.0|119225.0|
-        m2-119225.1|119225.1|
+        :param step_name: name of the step
+        :type step_name: str
+        :param step_id: id of the step
+        :type step_id: str
         """
-        time.sleep(interval)
-        step_id = "unassigned"
-        while trials > 0:
-            output, _ = sacct(["--noheader", "-p", "--format=jobname,jobid"])
-            step_id = parse_step_id_from_sacct(output, step.name)
-            if step_id:
-                break
-            else:
-                time.sleep(interval)
-                trials -= 1
-        if not step_id:
-            raise LauncherError("Could not find id of launched job step")
-        return step_id
+        stepmap = self.step_mapping.mapping.get(step_name)
+        if stepmap is not None:
+            self.step_mapping[step_name] = StepMap(step_id, stepmap.task_id, True)
+            self.step_queries.invalidate([step_id])
+            if self.step_id_callback:
+                self.step_id_callback(step_name, step_id)
+
+    def _step_id_not_found(self, step_name):
+        logger.warning(
+            f"Could not find id of launched job step {step_name}, "
+            "monitoring its srun process instead"
+        )
 
     def _get_managed_step_update(self, step_ids):
         """Get step updates for WLM managed jobs
@@ -211,14 +223,17 @@ class SlurmLauncher(WLMLauncher):
         step_str = _create_step_id_str(step_ids)
         sacct_out, _ = sacct(["--noheader", "-p", "-b", "--jobs", step_str])
         # (status, returncode)
-        stat_tuples = [parse_sacct(sacct_out, step_id) for step_id in step_ids]
+        sacct_steps = parse_sacct_steps(sacct_out)
+        stat_tuples = [
+            sacct_steps.get(step_id, ("PENDING", None)) for step_id in step_ids
+        ]
 
         # create SlurmStepInfo objects to return
         updates = []
-        for stat_tuple, step_id in zip(stat_tuples, step_ids):
+        task_ids = self.step_mapping.get_task_ids(step_ids)
+        for stat_tuple, task_id in zip(stat_tuples, task_ids):
             info = SlurmStepInfo(stat_tuple[0], stat_tuple[1])
 
-            task_id = self.step_mapping.get_task_id(step_id)
             if task_id:
                 # we still check the task manager for jobs that didn't ever
                 # become a fully managed job (e.g. error in slurm arguments)
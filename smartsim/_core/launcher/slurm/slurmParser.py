@@ -92,16 +92,32 @@ def parse_sacct(output, job_id):
     :return: status and returncode
     :rtype: tuple
     """
-    result = ("PENDING", None)
+    return parse_sacct_steps(output).get(job_id, ("PENDING", None))
+
+
+def parse_sacct_steps(output):
+    """Parse the status of every job and step of a sacct command
+
+    The output is read once. Step ids (with a '.') map to the status
+    of their own line and job ids map to the status of the first line
+    of the job or any of its steps, as ``jobid_exact_match`` would.
+
+    :param output: output of the sacct command
+    :type output: str
+    :return: mapping of job or step id to status and returncode
+    :rtype: dict[str, tuple]
+    """
+    results = {}
     for line in output.split("\n"):
         line = line.split("|")
         if len(line) >= 3:
-            if jobid_exact_match(line[0], job_id):
-                stat = line[1]
-                code = line[2].split(":")[0]
-                result = (stat, code)
-                break
-    return result
+            parsed_id = line[0]
+            stat = line[1]
+            code = line[2].split(":")[0]
+            if "." in parsed_id:
+                results.setdefault(parsed_id, (stat, code))
+            results.setdefault(parsed_id.split(".")[0], (stat, code))
+    return results
 
 
 def parse_sstat_nodes(output, job_id):
@@ -138,10 +154,25 @@ def parse_step_id_from_sacct(output, step_name):
     :return: the step_id
     :rtype: str
     """
-    step_id = None
+    return parse_step_ids_from_sacct(output, [step_name]).get(step_name)
+
+
+def parse_step_ids_from_sacct(output, step_names):
+    """Parse and return the step ids of many steps from a sacct command
+
+    :param output: output of sacct --noheader -p
+                   --format=jobname,jobid --job <alloc>
+    :type output: str
+    :param step_names: the names of the steps to query
+    :type step_names: list[str]
+    :return: mapping of step name to step id for the steps found
+    :rtype: dict[str, str]
+    """
+    step_names = set(step_names)
+    step_ids = {}
     for line in output.split("\n"):
         sacct_string = line.split("|")
         if len(sacct_string) >= 2:
-            if sacct_string[0] == step_name:
-                step_id = sacct_string[1]
-    return step_id
+            if sacct_string[0] in step_names:
+                step_ids[sacct_string[0]] = sacct_string[1]
+    return step_ids
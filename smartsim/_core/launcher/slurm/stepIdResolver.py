@@ -0,0 +1,136 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import time
+from collections import OrderedDict
+from threading import Condition, Thread
+
+from ....error import LauncherError
+from ....log import get_logger
+from ...config import CONFIG
+from .slurmCommands import sacct
+from .slurmParser import parse_step_ids_from_sacct
+
+logger = get_logger(__name__)
+
+
+class StepIdResolver:
+    """Resolve the Slurm ids of launched steps in the background
+
+    Slurm only reports the id of a step launched with srun through
+    sacct once the step has been registered. Rather than waiting on
+    every launch, step names are queued and a daemon thread looks all
+    pending names up with a single sacct call every ``interval``
+    seconds. ``on_resolved`` is called with the step name and id of
+    every step found, ``on_timeout`` with the name of the steps not
+    found within ``timeout`` seconds (``SMARTSIM_STEP_ID_TIMEOUT``).
+    """
+
+    def __init__(self, on_resolved, on_timeout, interval=1.0, timeout=None):
+        """Initialize a step id resolver
+
+        :param on_resolved: called with (step name, step id)
+        :type on_resolved: callable
+        :param on_timeout: called with the step name
+        :type on_timeout: callable
+        :param interval: seconds between two sacct queries
+        :type interval: float, optional
+        :param timeout: seconds after which a step is given up on,
+                        defaults to ``CONFIG.step_id_timeout``
+        :type timeout: float, optional
+        """
+        self.on_resolved = on_resolved
+        self.on_timeout = on_timeout
+        self.interval = interval
+        self.timeout = CONFIG.step_id_timeout if timeout is None else timeout
+        # step name : deadline
+        self._pending = OrderedDict()
+        self._cond = Condition()
+        self._running = False
+
+    def add(self, step_name):
+        """Queue a step whose id should be resolved
+
+        :param step_name: name of the step
+        :type step_name: str
+        """
+        with self._cond:
+            self._pending[step_name] = time.monotonic() + self.timeout
+            if not self._running:
+                self._running = True
+                Thread(name="StepIdResolver", daemon=True, target=self.run).start()
+
+    def remove(self, step_name):
+        """Stop resolving the id of a step
+
+        :param step_name: name of the step
+        :type step_name: str
+        """
+        with self._cond:
+            self._pending.pop(step_name, None)
+
+    def __contains__(self, step_name):
+        with self._cond:
+            return step_name in self._pending
+
+    def run(self):
+        """Resolve pending step ids until none are left"""
+        while True:
+            # let launches accumulate so they are resolved together
+            time.sleep(self.interval)
+            with self._cond:
+                if not self._pending:
+                    self._running = False
+                    return
+                step_names = list(self._pending)
+
+            try:
+                output, _ = sacct(["--noheader", "-p", "--format=jobname,jobid"])
+                step_ids = parse_step_ids_from_sacct(output, step_names)
+            except LauncherError as e:
+                logger.debug(f"Failed to query step ids: {e}")
+                step_ids = {}
+
+            now = time.monotonic()
+            resolved, expired = [], []
+            with self._cond:
+                for step_name in step_names:
+                    deadline = self._pending.get(step_name)
+                    if deadline is None:
+                        continue
+                    if step_name in step_ids:
+                        del self._pending[step_name]
+                        resolved.append(step_name)
+                    elif now > deadline:
+                        del self._pending[step_name]
+                        expired.append(step_name)
+
+            for step_name in resolved:
+                logger.debug(f"Gleaned step id {step_ids[step_name]} for {step_name}")
+                self.on_resolved(step_name, step_ids[step_name])
+            for step_name in expired:
+                self.on_timeout(step_name)
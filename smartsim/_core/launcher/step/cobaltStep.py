@@ -47,6 +47,8 @@ class CobaltBatchStep(Step):
         super().__init__(name, cwd)
         self.batch_settings = batch_settings
         self.step_cmds = []
+        # tasks of the packing worker if the batch is packed
+        self.packed_tasks = []
         self.managed = True
 
     def get_launch_cmd(self):
@@ -66,6 +68,7 @@ class CobaltBatchStep(Step):
         """
         launch_cmd = step.get_launch_cmd()
         self.step_cmds.append(launch_cmd)
+        self.packed_tasks.append(self.get_packed_task(step, launch_cmd))
         logger.debug(f"Added step command to batch for {step.name}")
 
     def _write_script(self):
@@ -92,11 +95,15 @@ class CobaltBatchStep(Step):
             for cmd in self.batch_settings._preamble:
                 f.write(f"{cmd}\n")
 
-            for i, cmd in enumerate(self.step_cmds):
+            if self.batch_settings.packed:
                 f.write("\n")
-                f.write(f"{' '.join((cmd))} &\n")
-                if i == len(self.step_cmds) - 1:
+                f.write(f"{self.write_packed_tasks(self.packed_tasks)}\n")
+            else:
+                for i, cmd in enumerate(self.step_cmds):
                     f.write("\n")
-                    f.write("wait\n")
+                    f.write(f"{' '.join((cmd))} &\n")
+                    if i == len(self.step_cmds) - 1:
+                        f.write("\n")
+                        f.write("wait\n")
         os.chmod(batch_script, stat.S_IXUSR | stat.S_IWUSR | stat.S_IRUSR)
         return batch_script
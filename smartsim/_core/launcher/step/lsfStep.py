@@ -48,6 +48,12 @@ class BsubBatchStep(Step):
         super().__init__(name, cwd)
         self.batch_settings = batch_settings
         self.step_cmds = []
+        # step name, entity name of every step added to the batch
+        self.batch_steps = []
+        # tasks of the packing worker if the batch is packed
+        self.packed_tasks = []
+        # member directory, launch command of every step, for job arrays
+        self.array_tasks = []
         self.managed = True
 
     def get_launch_cmd(self):
@@ -67,8 +73,27 @@ class BsubBatchStep(Step):
         """
         launch_cmd = step.get_launch_cmd()
         self.step_cmds.append(launch_cmd)
+        self.batch_steps.append((step.name, step.entity_name))
+        self.packed_tasks.append(self.get_packed_task(step, launch_cmd))
+        self.array_tasks.append((step.cwd, launch_cmd))
         logger.debug(f"Added step command to batch for {step.name}")
 
+    def get_array_tasks(self, step_id):
+        """Get the ids of the array tasks of a submitted job array
+
+        :param step_id: id of the submitted batch
+        :type step_id: str
+        :return: step name, entity name and id of every array task,
+                 empty if the batch is not a job array
+        :rtype: list[tuple[str, str, str]]
+        """
+        if not self.batch_settings.array:
+            return []
+        return [
+            (name, entity_name, f"{step_id}[{i + 1}]")
+            for i, (name, entity_name) in enumerate(self.batch_steps)
+        ]
+
     def _write_script(self):
         """Write the batch script
 
@@ -88,7 +113,13 @@ class BsubBatchStep(Step):
                 f.write(f"#BSUB -W {self.batch_settings.walltime}\n")
             if self.batch_settings.project:
                 f.write(f"#BSUB -P {self.batch_settings.project}\n")
-            f.write(f"#BSUB -J {self.name}\n")
+            if self.batch_settings.array:
+                array = self.batch_settings.format_array(len(self.step_cmds))
+                f.write(f"#BSUB -J {self.name}{array}\n")
+                # one output file per array task
+                output, error = output + ".%I", error + ".%I"
+            else:
+                f.write(f"#BSUB -J {self.name}\n")
             f.write(f"#BSUB -o {output}\n")
             f.write(f"#BSUB -e {error}\n")
 
@@ -96,6 +127,19 @@ class BsubBatchStep(Step):
             for opt in opts:
                 f.write(f"#BSUB {opt}\n")
 
+            if self.batch_settings.array:
+                f.write("\n")
+                for line in self.write_array_lookup(
+                    self.array_tasks, "LSB_JOBINDEX", first_index=1
+                ):
+                    f.write(f"{line}\n")
+                return batch_script
+
+            if self.batch_settings.packed:
+                f.write("\n")
+                f.write(f"{self.write_packed_tasks(self.packed_tasks)}\n")
+                return batch_script
+
             for i, cmd in enumerate(self.step_cmds):
                 f.write("\n")
                 f.write(f"{' '.join((cmd))} &\n")
@@ -44,6 +44,12 @@ class QsubBatchStep(Step):
         super().__init__(name, cwd)
         self.batch_settings = batch_settings
         self.step_cmds = []
+        # step name, entity name of every step added to the batch
+        self.batch_steps = []
+        # tasks of the packing worker if the batch is packed
+        self.packed_tasks = []
+        # member directory, launch command of every step, for job arrays
+        self.array_tasks = []
         self.managed = True
 
     def get_launch_cmd(self):
@@ -63,8 +69,27 @@ class QsubBatchStep(Step):
         """
         launch_cmd = step.get_launch_cmd()
         self.step_cmds.append(launch_cmd)
+        self.batch_steps.append((step.name, step.entity_name))
+        self.packed_tasks.append(self.get_packed_task(step, launch_cmd))
+        self.array_tasks.append((step.cwd, launch_cmd))
         logger.debug(f"Added step command to batch for {step.name}")
 
+    def get_array_tasks(self, step_id):
+        """Get the ids of the array tasks of a submitted job array
+
+        :param step_id: id of the submitted batch
+        :type step_id: str
+        :return: step name, entity name and id of every array task,
+                 empty if the batch is not a job array
+        :rtype: list[tuple[str, str, str]]
+        """
+        if not self.batch_settings.array:
+            return []
+        return [
+            (name, entity_name, step_id.replace("[]", f"[{i}]", 1))
+            for i, (name, entity_name) in enumerate(self.batch_steps)
+        ]
+
     def _write_script(self):
         """Write the batch script
 
@@ -83,10 +108,30 @@ class QsubBatchStep(Step):
             # add additional sbatch options
             for opt in self.batch_settings.format_batch_args():
                 f.write(f"#PBS {opt}\n")
+            # PBS rejects array ranges with a single index, so an
+            # array of one member is submitted as a plain job
+            is_array = self.batch_settings.array and len(self.array_tasks) > 1
+            if is_array:
+                array = self.batch_settings.format_array(len(self.array_tasks))
+                f.write(f"#PBS {array}\n")
 
             for cmd in self.batch_settings._preamble:
                 f.write(f"{cmd}\n")
 
+            if self.batch_settings.array:
+                f.write("\n")
+                if not is_array:
+                    f.write("PBS_ARRAY_INDEX=0\n")
+                lookup = self.write_array_lookup(self.array_tasks, "PBS_ARRAY_INDEX")
+                for line in lookup:
+                    f.write(f"{line}\n")
+                return batch_script
+
+            if self.batch_settings.packed:
+                f.write("\n")
+                f.write(f"{self.write_packed_tasks(self.packed_tasks)}\n")
+                return batch_script
+
             for i, cmd in enumerate(self.step_cmds):
                 f.write("\n")
                 f.write(f"{' '.join((cmd))} &\n")
@@ -49,6 +49,12 @@ class SbatchStep(Step):
         super().__init__(name, cwd)
         self.batch_settings = batch_settings
         self.step_cmds = []
+        # step name, entity name of every step added to the batch
+        self.batch_steps = []
+        # tasks of the packing worker if the batch is packed
+        self.packed_tasks = []
+        # member directory, launch command of every step, for job arrays
+        self.array_tasks = []
         self.managed = True
 
     def get_launch_cmd(self):
@@ -66,11 +72,29 @@ class SbatchStep(Step):
         :param step: a job step instance e.g. SrunStep
         :type step: Step
         """
-        launch_cmd = ["cd", step.cwd, ";"]
-        launch_cmd += step.get_launch_cmd()
-        self.step_cmds.append(launch_cmd)
+        launch_cmd = step.get_launch_cmd()
+        self.step_cmds.append(["cd", step.cwd, ";"] + launch_cmd)
+        self.batch_steps.append((step.name, step.entity_name))
+        self.packed_tasks.append(self.get_packed_task(step, launch_cmd))
+        self.array_tasks.append((step.cwd, launch_cmd))
         logger.debug(f"Added step command to batch for {step.name}")
 
+    def get_array_tasks(self, step_id):
+        """Get the ids of the array tasks of a submitted job array
+
+        :param step_id: id of the submitted batch
+        :type step_id: str
+        :return: step name, entity name and id of every array task,
+                 empty if the batch is not a job array
+        :rtype: list[tuple[str, str, str]]
+        """
+        if not self.batch_settings.array:
+            return []
+        return [
+            (name, entity_name, f"{step_id}_{i}")
+            for i, (name, entity_name) in enumerate(self.batch_steps)
+        ]
+
     def _write_script(self):
         """Write the batch script
 
@@ -79,6 +103,10 @@ class SbatchStep(Step):
         """
         batch_script = self.get_step_file(ending=".sh")
         output, error = self.get_output_files()
+        if self.batch_settings.array:
+            # one output file per array task
+            output = self.get_step_file(ending="-%a.out")
+            error = self.get_step_file(ending="-%a.err")
         with open(batch_script, "w") as f:
             f.write("#!/bin/bash\n\n")
             f.write(f"#SBATCH --output={output}\n")
@@ -88,10 +116,26 @@ class SbatchStep(Step):
             # add additional sbatch options
             for opt in self.batch_settings.format_batch_args():
                 f.write(f"#SBATCH {opt}\n")
+            if self.batch_settings.array:
+                array = self.batch_settings.format_array(len(self.step_cmds))
+                f.write(f"#SBATCH {array}\n")
 
             for cmd in self.batch_settings._preamble:
                 f.write(f"{cmd}\n")
 
+            if self.batch_settings.array:
+                f.write("\n")
+                for line in self.write_array_lookup(
+                    self.array_tasks, "SLURM_ARRAY_TASK_ID"
+                ):
+                    f.write(f"{line}\n")
+                return batch_script
+
+            if self.batch_settings.packed:
+                f.write("\n")
+                f.write(f"{self.write_packed_tasks(self.packed_tasks)}\n")
+                return batch_script
+
             for i, cmd in enumerate(self.step_cmds):
                 f.write("\n")
                 f.write(f"{' '.join((cmd))} &\n")
@@ -24,7 +24,11 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
+import os
 import os.path as osp
+import shlex
+import sys
 import time
 
 from ....log import get_logger
@@ -54,6 +58,15 @@ class Step:
         error = self.get_step_file(ending=".err")
         return output, error
 
+    def get_launcher_output_files(self):
+        """Return two paths to error and output files of the launch command
+
+        Used for launch commands (e.g. srun) that direct the output of
+        the application to the files of ``get_output_files`` themselves"""
+        output = self.get_step_file(ending=".launch.out")
+        error = self.get_step_file(ending=".launch.err")
+        return output, error
+
     def get_step_file(self, ending=".sh", script_name=None):
         """Get the name for a file/script created by the step class
 
@@ -63,6 +76,80 @@ class Step:
             return osp.join(self.cwd, script_name)
         return osp.join(self.cwd, self.entity_name + ending)
 
+    def write_array_lookup(self, array_tasks, index_var, first_index=0):
+        """Write the commands of the tasks of a job array to a lookup file
+
+        Line ``i`` of the lookup file changes to the member directory
+        of the array task with index ``first_index + i`` and runs its
+        command, with every argument quoted for the shell.
+
+        :param array_tasks: member directory and launch command of
+                            every array task
+        :type array_tasks: list[tuple[str, list[str]]]
+        :param index_var: environment variable holding the array index
+        :type index_var: str
+        :param first_index: index of the first array task
+        :type first_index: int, optional
+        :return: batch script lines running the command of the array task
+        :rtype: list[str]
+        """
+        lookup_file = self.get_step_file(ending=".array")
+        with open(lookup_file, "w") as f:
+            for cwd, cmd in array_tasks:
+                args = " ".join(shlex.quote(str(arg)) for arg in cmd)
+                f.write(f"cd {shlex.quote(cwd)} && {args}\n")
+        return [
+            f"line=$((${index_var} - {first_index} + 1))",
+            f'eval "$(sed -n "${{line}}p" {lookup_file})"',
+        ]
+
+    @staticmethod
+    def get_packed_task(step, launch_cmd):
+        """Get a job step added to a batch as a task of the packing worker
+
+        :param step: job step added to the batch
+        :type step: Step
+        :param launch_cmd: launch command of the job step
+        :type launch_cmd: list[str]
+        :return: task of the packing worker
+        :rtype: dict
+        """
+        nodes, tasks = step.run_settings.get_resource_request()
+        return {
+            "name": step.entity_name,
+            "cmd": " ".join(launch_cmd),
+            "cwd": step.cwd,
+            "nodes": nodes,
+            "tasks": tasks,
+            "status_file": step.get_step_file(ending=".status"),
+        }
+
+    def write_packed_tasks(self, packed_tasks):
+        """Write the tasks of a packed batch to the task file of the worker
+
+        Status files left by a previous launch of the tasks are removed.
+
+        :param packed_tasks: tasks of the packing worker
+        :type packed_tasks: list[dict]
+        :return: batch script line running the packing worker
+        :rtype: str
+        """
+        for task in packed_tasks:
+            if osp.exists(task["status_file"]):
+                os.remove(task["status_file"])
+
+        task_file = self.get_step_file(ending=".tasks.json")
+        with open(task_file, "w") as f:
+            json.dump(packed_tasks, f)
+
+        cmd = [sys.executable, "-m", "smartsim._core.entrypoints.packer"]
+        cmd += ["+tasks", task_file]
+        if self.batch_settings.packed_nodes:
+            cmd += ["+nodes", str(self.batch_settings.packed_nodes)]
+        if self.batch_settings.packed_tasks_per_node:
+            cmd += ["+tasks_per_node", str(self.batch_settings.packed_tasks_per_node)]
+        return " ".join(cmd)
+
     def get_colocated_launch_script(self):
         # prep step for colocated launch if specifed in run settings
         script_path = self.get_step_file(script_name=".colocated_launcher.sh")
@@ -30,27 +30,48 @@ StepMap = namedtuple("StepMap", ["step_id", "task_id", "managed"])
 
 
 class StepMapping:
+    """Mapping of step names to the ids a launcher tracks them by
+
+    A reverse index of step id to step name is kept alongside the
+    mapping so that step ids can be resolved in constant time.
+    """
+
     def __init__(self):
         # step_name : wlm_id, pid, wlm_managed?
         self.mapping = {}
+        # wlm_id : step_name
+        self._step_names = {}
 
     def __getitem__(self, step_name):
         return self.mapping[step_name]
 
     def __setitem__(self, step_name, step_map):
+        old_map = self.mapping.get(step_name)
+        if old_map is not None and old_map.step_id is not None:
+            self._step_names.pop(old_map.step_id, None)
         self.mapping[step_name] = step_map
+        if step_map.step_id is not None:
+            self._step_names[step_map.step_id] = step_name
 
     def add(self, step_name, step_id=None, task_id=None, managed=True):
-        self.mapping[step_name] = StepMap(step_id, task_id, managed)
+        self[step_name] = StepMap(step_id, task_id, managed)
 
     def get_task_id(self, step_id):
         """Get the task id from the step id"""
-        task_id = None
-        for stepmap in self.mapping.values():
-            if stepmap.step_id == step_id:
-                task_id = stepmap.task_id
-                break
-        return task_id
+        step_name = self._step_names.get(step_id)
+        if step_name is None:
+            return None
+        return self.mapping[step_name].task_id
+
+    def get_task_ids(self, step_ids):
+        """Get the task ids of a list of step ids
+
+        :param step_ids: step ids to resolve
+        :type step_ids: list[str]
+        :return: task id for each step id, None if there is no task
+        :rtype: list[str]
+        """
+        return [self.get_task_id(step_id) for step_id in step_ids]
 
     def get_ids(self, step_names, managed=True):
         ids = []
@@ -66,3 +87,29 @@ class StepMapping:
                     names.append(name)
                     ids.append(stepmap.task_id)
         return names, ids
+
+    def get_partitioned_ids(self, step_names):
+        """Split step names into managed and unmanaged steps in one pass
+
+        Equivalent to calling ``get_ids`` with ``managed=True``
+        and ``managed=False``. Unknown step names are skipped.
+
+        :param step_names: names of the steps
+        :type step_names: list[str]
+        :return: (names, step ids) of managed steps and
+                 (names, task ids) of unmanaged steps
+        :rtype: tuple[tuple[list[str], list[str]], tuple[list[str], list[str]]]
+        """
+        managed_names, step_ids = [], []
+        unmanaged_names, task_ids = [], []
+        for name in step_names:
+            stepmap = self.mapping.get(name)
+            if stepmap is None:
+                continue
+            if stepmap.managed:
+                managed_names.append(name)
+                step_ids.append(stepmap.step_id)
+            else:
+                unmanaged_names.append(name)
+                task_ids.append(stepmap.task_id)
+        return (managed_names, step_ids), (unmanaged_names, task_ids)
@@ -24,7 +24,10 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import os
+import selectors
 import time
+from collections import OrderedDict
 from subprocess import PIPE
 from threading import RLock, Thread
 
@@ -32,6 +35,7 @@ import psutil
 
 from ...error import LauncherError
 from ...log import get_logger
+from ..config import CONFIG
 from ..utils.helpers import check_dev_log_level
 from .util.shell import execute_async_cmd, execute_cmd
 
@@ -40,6 +44,28 @@ verbose_tm = check_dev_log_level()
 
 
 TM_INTERVAL = 1
+# bytes of output and error of each task kept in memory
+OUTPUT_TAIL_SIZE = 4096
+
+
+def _open_pidfd(pid):
+    """Open a file descriptor that becomes readable when ``pid`` exits
+
+    pidfds are only available on Linux >= 5.3 with Python >= 3.9. When
+    they cannot be used, None is returned and the task is polled.
+
+    :param pid: process id
+    :type pid: int
+    :return: pidfd or None
+    :rtype: int | None
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
 
 
 class TaskManager:
@@ -47,9 +73,19 @@ class TaskManager:
     the asyncronous shell interface. Each task is a wrapper
     around the Popen/Process instance.
 
-    The Task Managers polls processes on TM_INTERVAL
-    and detects job failure and completion. Upon termination, the
-    task returncode, output, and error are added to the task history.
+    The Task Manager is event driven. Tasks owned by the Task Manager
+    are watched through a pidfd registered with a selector so that
+    the monitor thread wakes the moment a task exits and sleeps
+    while all tasks are running. Tasks that cannot be watched this
+    way (e.g. processes adopted through ``add_existing`` or systems
+    without pidfd support) are polled on TM_INTERVAL.
+
+    Tasks are held in a dictionary keyed by task id. Output and error
+    of tasks started with ``PIPE`` are streamed by the monitor thread
+    into the output files of the step as they are produced (see
+    ``OutputStream``). Upon termination, the task returncode and the
+    tail of its output and error are added to the bounded task
+    history (see ``TaskHistory``).
 
     When a launcher uses the task manager to start a task, the task
     is either managed (by a WLM) or unmanaged (meaning not managed by
@@ -59,50 +95,192 @@ class TaskManager:
 
     def __init__(self):
         """Initialize a task manager thread."""
-        self.actively_monitoring = False
-        self.task_history = dict()
-        self.tasks = []
+        self._monitoring = False
+        self.task_history = TaskHistory()
+        # task id : Task for tasks that have not exited
+        self.tasks = {}
         self._lock = RLock()
 
+        # task pid : pidfd for tasks watched through the selector
+        self._pidfds = {}
+        self._next_poll = 0.0
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+
+    @property
+    def actively_monitoring(self):
+        return self._monitoring
+
+    @actively_monitoring.setter
+    def actively_monitoring(self, monitoring):
+        self._monitoring = monitoring
+        if not monitoring:
+            # wake the monitor thread so that it can exit
+            self._wakeup()
+
     def start(self):
         """Start the task manager thread
 
         The TaskManager is run as a daemon thread meaning
         that it will die when the main thread dies.
         """
-        monitor = Thread(name="TaskManager", daemon=True, target=self.run)
-        monitor.start()
+        self._lock.acquire()
+        try:
+            if self._monitoring:
+                return
+            self._monitoring = True
+            monitor = Thread(name="TaskManager", daemon=True, target=self.run)
+            monitor.start()
+        finally:
+            self._lock.release()
 
     def run(self):
-        """Start monitoring Tasks"""
+        """Start monitoring Tasks
+
+        The monitor thread blocks on the selector until a watched
+        task exits, a new task is added, or polled tasks are due
+        to be checked.
+        """
 
         global verbose_tm
         if verbose_tm:
             logger.debug("Starting Task Manager")
 
-        self.actively_monitoring = True
-        while self.actively_monitoring:
-            time.sleep(TM_INTERVAL)
+        while self._monitoring:
+            events = self._selector.select(self._get_timeout())
+
+            self._lock.acquire()
+            try:
+                for key, _ in events:
+                    if key.fd == self._wakeup_r:
+                        self._drain_wakeup()
+                    elif isinstance(key.data, OutputStream):
+                        self._read_stream(key.data)
+                    else:
+                        self._check_task(key.data)
+
+                if self._has_polled_tasks() and time.monotonic() >= self._next_poll:
+                    self._next_poll = time.monotonic() + TM_INTERVAL
+                    for task in self._polled_tasks():
+                        self._check_task(task)
+
+                if len(self) == 0:
+                    # exit under the lock so a task started concurrently
+                    # is guaranteed to see that a new monitor is needed
+                    self._monitoring = False
+                    if verbose_tm:
+                        logger.debug("Sleeping, no tasks to monitor")
+                    break
+            finally:
+                self._lock.release()
+
+    def _check_task(self, task):
+        """Record and remove a task if it has exited
+
+        :param task: task to check
+        :type task: Task
+        """
+        returncode = task.check_status()  # poll and set returncode
+        # has to be != None because returncode can be 0
+        if returncode is not None:
+            self._close_streams(task)
+            output, error = task.get_io()
+            self.add_task_history(task.pid, returncode, output, error)
+            self.remove_task(task.pid)
+
+    def _polled_tasks(self):
+        return [task for task in self.tasks.values() if task.pid not in self._pidfds]
+
+    def _has_polled_tasks(self):
+        return len(self.tasks) > len(self._pidfds)
 
-            for task in self.tasks:
-                returncode = task.check_status()  # poll and set returncode
-                # has to be != None because returncode can be 0
-                if returncode is not None:
-                    output, error = task.get_io()
-                    self.add_task_history(task.pid, returncode, output, error)
-                    self.remove_task(task.pid)
+    def _get_timeout(self):
+        """Time the monitor may block for before polling tasks
 
-            if len(self) == 0:
-                self.actively_monitoring = False
-                if verbose_tm:
-                    logger.debug("Sleeping, no tasks to monitor")
+        :return: seconds to block for, None blocks until an event
+        :rtype: float | None
+        """
+        self._lock.acquire()
+        try:
+            if not self._has_polled_tasks():
+                return None
+            return max(self._next_poll - time.monotonic(), 0)
+        finally:
+            self._lock.release()
 
-    def start_task(self, cmd_list, cwd, env=None, out=PIPE, err=PIPE):
+    def _watch(self, task):
+        """Register an owned task with the selector if possible
+
+        :param task: task to watch
+        :type task: Task
+        """
+        if task.owned:
+            pidfd = _open_pidfd(int(task.pid))
+            if pidfd is not None:
+                # epoll picks up the registration without waking the monitor
+                self._pidfds[task.pid] = pidfd
+                self._selector.register(pidfd, selectors.EVENT_READ, task)
+                return
+        # wake the monitor so that it starts polling on TM_INTERVAL
+        self._wakeup()
+
+    def _unwatch(self, task):
+        pidfd = self._pidfds.pop(task.pid, None)
+        if pidfd is not None:
+            self._selector.unregister(pidfd)
+            os.close(pidfd)
+        self._close_streams(task)
+
+    def _read_stream(self, stream):
+        # the stream may have been closed by an earlier event of the batch
+        if stream.closed:
+            return
+        if stream.read() is None:
+            # end of file, the task closed its output
+            self._selector.unregister(stream)
+            stream.close()
+
+    def _close_streams(self, task):
+        """Drain the remaining output of a task and stop streaming it
+
+        :param task: task to close the streams of
+        :type task: Task
+        """
+        for stream in task.streams:
+            if not stream.closed:
+                stream.drain()
+                self._selector.unregister(stream)
+                stream.close()
+
+    def _wakeup(self):
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except BlockingIOError:
+            # pipe is full, the monitor will wake regardless
+            pass
+
+    def _drain_wakeup(self):
+        try:
+            while os.read(self._wakeup_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def start_task(
+        self, cmd_list, cwd, env=None, out=PIPE, err=PIPE, output_files=None
+    ):
         """Start a task managed by the TaskManager
 
         This is an "unmanaged" task, meaning it is NOT managed
         by a workload manager
 
+        Output and error captured through ``PIPE`` are streamed
+        into ``output_files`` while the task runs, only the last
+        ``OUTPUT_TAIL_SIZE`` bytes of each are kept in memory.
+
         :param cmd_list: command to run
         :type cmd_list: list[str]
         :param cwd: current working directory
@@ -113,17 +291,24 @@ class TaskManager:
         :type out: file, optional
         :param err: error file, defaults to PIPE
         :type err: file, optional
+        :param output_files: paths to stream output and error to
+        :type output_files: tuple[str, str], optional
         :return: task id
         :rtype: int
         """
+        # spawn outside of the lock so that tasks can be started concurrently
+        proc = execute_async_cmd(cmd_list, cwd, env=env, out=out, err=err)
+        task = Task(proc, output_files=output_files)
         self._lock.acquire()
         try:
-            proc = execute_async_cmd(cmd_list, cwd, env=env, out=out, err=err)
-            task = Task(proc)
             if verbose_tm:
                 logger.debug(f"Starting Task {task.pid}")
-            self.tasks.append(task)
-            self.task_history[task.pid] = (None, None, None)
+            self.tasks[task.pid] = task
+            for stream in task.streams:
+                self._selector.register(stream, selectors.EVENT_READ, stream)
+            self._watch(task)
+            if not self._monitoring:
+                self.start()
             return task.pid
 
         finally:
@@ -164,8 +349,11 @@ class TaskManager:
         try:
             process = psutil.Process(pid=task_id)
             task = Task(process)
-            self.tasks.append(task)
-            self.task_history[task.pid] = (None, None, None)
+            self.tasks[task.pid] = task
+            # processes we don't own can't be waited on, poll them instead
+            self._watch(task)
+            if not self._monitoring:
+                self.start()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             raise LauncherError(f"Process provided {task_id} does not exist") from None
         finally:
@@ -182,14 +370,18 @@ class TaskManager:
             logger.debug(f"Removing Task {task_id}")
         try:
             task = self[task_id]
-            if task.is_alive:
-                task.kill()
-                returncode = task.check_status()
-                out, err = task.get_io()
-                self.add_task_history(task_id, returncode, out, err)
-            self.tasks.remove(task)
-        except psutil.NoSuchProcess:
-            logger.debug("Failed to kill a task during removal")
+            try:
+                if task.is_alive:
+                    task.kill()
+                    returncode = task.check_status()
+                    self._close_streams(task)
+                    out, err = task.get_io()
+                    self.add_task_history(task_id, returncode, out, err)
+            except psutil.NoSuchProcess:
+                logger.debug("Failed to kill a task during removal")
+            finally:
+                self._unwatch(task)
+                del self.tasks[task_id]
         except KeyError:
             logger.debug("Failed to remove a task, task was already removed")
         finally:
@@ -198,6 +390,12 @@ class TaskManager:
     def get_task_update(self, task_id):
         """Get the update of a task
 
+        Tasks that are no longer held by the TaskManager or the
+        task history (i.e. evicted) are reported as completed without
+        a returncode. Records are only evicted once they have been
+        read or after ``SMARTSIM_TM_HISTORY_AGE`` seconds, so the exit
+        status of a task is reported by the first update that reads it.
+
         :param task_id: task id
         :type task_id: str
         :return: status, returncode, output, error
@@ -205,24 +403,23 @@ class TaskManager:
         """
         self._lock.acquire()
         try:
-            rc, out, err = self.task_history[task_id]
-            # has to be == None because rc can be 0
-            if rc == None:
-                try:
-                    task = self[task_id]
-                    return task.status, rc, out, err
-                # removed forcefully either by OS or us, no returncode set
-                # either way, job has completed and we won't have returncode
-                # Usually hits when jobs last less then the TM_INTERVAL
-                except (KeyError, psutil.NoSuchProcess):
-                    return "Completed", rc, out, err
-
+            record = self.task_history.read(task_id)
             # process has completed, status set manually as we don't
             # save task statuses during runtime.
-            else:
+            if record is not None:
+                rc, out, err = record
                 if rc != 0:
                     return "Failed", rc, out, err
                 return "Completed", rc, out, err
+
+            try:
+                task = self.tasks[task_id]
+                return task.status, None, None, None
+            # removed forcefully either by OS or us, or evicted from the
+            # history. either way, job has completed and we won't have
+            # returncode
+            except (KeyError, psutil.NoSuchProcess):
+                return "Completed", None, None, None
         finally:
             self._lock.release()
 
@@ -240,15 +437,12 @@ class TaskManager:
         :param err: output, defaults to None
         :type err: str, optional
         """
-        self.task_history[task_id] = (returncode, out, err)
+        self.task_history.add(task_id, returncode, out, err)
 
     def __getitem__(self, task_id):
         self._lock.acquire()
         try:
-            for task in self.tasks:
-                if task.pid == task_id:
-                    return task
-            raise KeyError
+            return self.tasks[task_id]
         finally:
             self._lock.release()
 
@@ -260,15 +454,137 @@ class TaskManager:
             self._lock.release()
 
 
+class TaskHistory:
+    """Bounded history of the tasks that have exited
+
+    Each record holds the returncode, output and error of a task.
+    Two bounds of ``max_size`` keep the memory of the history flat
+    regardless of the number of tasks launched:
+
+    - at most ``max_size`` records hold output in memory. When more
+      are added, the output of the oldest record is dropped from
+      memory, it can still be found in the output files of its step.
+    - at most ``max_size`` records that have already been read
+      through ``read`` are kept. When more are read, the least
+      recently read record is evicted.
+
+    Records that have not been read are kept for ``max_age`` seconds
+    so that the returncode of a task is available to the first update
+    without keeping the records of tasks nobody asks about forever.
+    """
+
+    def __init__(self, max_size=None, max_age=None):
+        """Initialize a task history
+
+        :param max_size: bound of the history, defaults to
+                         ``CONFIG.tm_history_size``
+        :type max_size: int, optional
+        :param max_age: seconds unread records are kept for, defaults
+                        to ``CONFIG.tm_history_age``
+        :type max_age: float, optional
+        """
+        self.max_size = CONFIG.tm_history_size if max_size is None else max_size
+        self.max_age = CONFIG.tm_history_age if max_age is None else max_age
+        # task id : (returncode, output, error)
+        self._records = {}
+        self._buffered = OrderedDict()
+        self._read = OrderedDict()
+        # task id : time the record was added, for unread records
+        self._unread = OrderedDict()
+
+    def add(self, task_id, returncode, out=None, err=None):
+        """Record a task that has exited
+
+        :param task_id: id of the task
+        :type task_id: str
+        :param returncode: returncode
+        :type returncode: int
+        :param out: output, defaults to None
+        :type out: str, optional
+        :param err: error, defaults to None
+        :type err: str, optional
+        """
+        now = time.time()
+        self._evict_expired(now)
+        self._records[task_id] = (returncode, out, err)
+        self._read.pop(task_id, None)
+        self._unread[task_id] = now
+        self._unread.move_to_end(task_id)
+        if out or err:
+            self._buffered[task_id] = None
+            self._buffered.move_to_end(task_id)
+            if len(self._buffered) > self.max_size:
+                oldest, _ = self._buffered.popitem(last=False)
+                self._drop_output(oldest)
+
+    def read(self, task_id):
+        """Return the record of a task and mark it as read
+
+        :param task_id: id of the task
+        :type task_id: str
+        :return: returncode, output and error, or None if not recorded
+        :rtype: tuple[int, str, str] | None
+        """
+        record = self._records.get(task_id)
+        if record is not None:
+            self._unread.pop(task_id, None)
+            self._read[task_id] = None
+            self._read.move_to_end(task_id)
+            if len(self._read) > self.max_size:
+                oldest, _ = self._read.popitem(last=False)
+                self._evict(oldest)
+        return record
+
+    def _drop_output(self, task_id):
+        returncode, _, _ = self._records[task_id]
+        self._records[task_id] = (returncode, None, None)
+
+    def _evict_expired(self, now):
+        while self._unread:
+            task_id, added = next(iter(self._unread.items()))
+            if now - added < self.max_age:
+                break
+            del self._unread[task_id]
+            self._evict(task_id)
+
+    def _evict(self, task_id):
+        if task_id in self._buffered:
+            del self._buffered[task_id]
+        del self._records[task_id]
+
+    def get(self, task_id, default=None):
+        return self._records.get(task_id, default)
+
+    def __getitem__(self, task_id):
+        return self._records[task_id]
+
+    def __contains__(self, task_id):
+        return task_id in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+
 class Task:
-    def __init__(self, process):
+    def __init__(self, process, output_files=None):
         """Initialize a task
 
         :param process: Popen object
         :type process: psutil.Popen
+        :param output_files: paths to stream output and error to
+        :type output_files: tuple[str, str], optional
         """
         self.process = process
         self.pid = str(self.process.pid)
+        self.output_files = output_files
+
+        # stream the pipes of the process, if any
+        out_file, err_file = output_files or (None, None)
+        self.streams = []
+        if self.owned:
+            for pipe, path in ((process.stdout, out_file), (process.stderr, err_file)):
+                if pipe is not None:
+                    self.streams.append(OutputStream(pipe, path))
 
     def check_status(self):
         """Ping the job and return the returncode if finished
@@ -291,6 +607,14 @@ class Task:
         # Process class does not implement communicate
         if not self.owned:
             return None, None
+        if self.streams:
+            output, error = None, None
+            for stream in self.streams:
+                if stream.pipe is self.process.stdout:
+                    output = stream.tail() or None
+                else:
+                    error = stream.tail() or None
+            return output, error
         output, error = self.process.communicate()
         if output:
             output = output.decode("utf-8")
@@ -367,3 +691,83 @@ class Task:
         if isinstance(self.process, psutil.Popen):
             return True
         return False
+
+
+class OutputStream:
+    """Stream the output of a task pipe into a file
+
+    The pipe is read without blocking whenever the selector of the
+    TaskManager reports it readable, so a task never stalls on a full
+    pipe. Everything read is written to ``path`` (if provided) and
+    only the last ``tail_size`` bytes are kept in memory.
+    """
+
+    def __init__(self, pipe, path=None, tail_size=OUTPUT_TAIL_SIZE):
+        """Initialize an output stream
+
+        :param pipe: pipe to read from
+        :type pipe: io.BufferedReader
+        :param path: file to write the output to, defaults to None
+        :type path: str, optional
+        :param tail_size: bytes of output to keep in memory
+        :type tail_size: int, optional
+        """
+        self.pipe = pipe
+        self.tail_size = tail_size
+        self.closed = False
+        self._tail = bytearray()
+        self._file = None
+        os.set_blocking(pipe.fileno(), False)
+        if path:
+            try:
+                self._file = open(path, "wb", buffering=0)
+            except OSError as e:
+                logger.warning(f"Failed to open output file {path}: {e}")
+
+    def fileno(self):
+        return self.pipe.fileno()
+
+    def read(self, size=65536):
+        """Read the output currently available
+
+        :param size: maximum bytes to read
+        :type size: int, optional
+        :return: bytes read, None at the end of the output
+        :rtype: int | None
+        """
+        try:
+            chunk = os.read(self.pipe.fileno(), size)
+        except BlockingIOError:
+            return 0
+        except OSError:
+            chunk = b""
+        if not chunk:
+            return None
+        if self._file:
+            self._file.write(chunk)
+        self._tail += chunk
+        # trim lazily to keep appends amortized constant time
+        if len(self._tail) > 2 * self.tail_size:
+            del self._tail[: -self.tail_size]
+        return len(chunk)
+
+    def drain(self):
+        """Read until no more output is available without blocking"""
+        while self.read():
+            pass
+
+    def tail(self):
+        """Return the last ``tail_size`` bytes of output
+
+        :return: decoded output
+        :rtype: str
+        """
+        return bytes(self._tail[-self.tail_size :]).decode("utf-8", errors="replace")
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self._file:
+            self._file.close()
+        self.pipe.close()
@@ -0,0 +1,178 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import itertools
+import json
+import os
+import os.path as osp
+import subprocess
+import sys
+from threading import Event, Lock, Thread
+
+from ....log import get_logger
+
+logger = get_logger(__name__)
+
+
+class CommandRunner:
+    """Run commands through a long-lived helper process
+
+    Forking a driver process that holds a lot of memory is slow, so
+    frequent commands (e.g. ``sacct`` or ``qstat``) can be sent to a
+    small helper process, started early, which runs them instead.
+    Requests from many threads are served concurrently.
+
+    ``run`` returns None when the helper is not available so that the
+    caller can run the command itself.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._closed = False
+        self._lock = Lock()
+        # request id : [Event, reply]
+        self._replies = {}
+        self._ids = itertools.count()
+
+    @property
+    def running(self):
+        """Return True if the helper process is running"""
+        if self._proc is None or self._closed:
+            return False
+        return self._proc.poll() is None
+
+    def start(self):
+        """Start the helper process
+
+        :return: True if the helper was started
+        :rtype: bool
+        """
+        server = osp.join(osp.dirname(osp.abspath(__file__)), "commandServer.py")
+        try:
+            self._proc = subprocess.Popen(
+                [sys.executable, server],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                close_fds=True,
+            )
+        except OSError as e:
+            logger.debug(f"Could not start the command runner: {e}")
+            return False
+        reader = Thread(name="CommandRunner", daemon=True, target=self._read_replies)
+        reader.start()
+        return True
+
+    def stop(self):
+        """Stop the helper process once running commands have finished"""
+        if self._proc is not None:
+            self._proc.stdin.close()
+            self._proc.wait()
+
+    def run(
+        self, cmd_list, shell=False, cwd=None, env=None, proc_input="", timeout=None
+    ):
+        """Run a command through the helper process
+
+        Commands run in the working directory and environment of the
+        driver unless ``cwd`` and ``env`` are given.
+
+        :param cmd_list: list of command with arguments
+        :type cmd_list: list of str
+        :param shell: run in system shell, defaults to False
+        :type shell: bool, optional
+        :param cwd: current working directory, defaults to None
+        :type cwd: str, optional
+        :param env: environment of the command, defaults to None
+        :type env: dict, optional
+        :param proc_input: input to the process, defaults to ""
+        :type proc_input: str, optional
+        :param timeout: timeout of the process, defaults to None
+        :type timeout: int, optional
+        :return: reply of the helper, None if the request could not be sent
+        :rtype: dict | None
+        """
+        request = {
+            "cmd": cmd_list,
+            "shell": shell,
+            "cwd": cwd or os.getcwd(),
+            "env": dict(os.environ) if env is None else env,
+            "input": proc_input,
+            "timeout": timeout,
+        }
+        reply = [Event(), None]
+        self._lock.acquire()
+        try:
+            if not self.running:
+                return None
+            request["id"] = next(self._ids)
+            self._replies[request["id"]] = reply
+            try:
+                self._proc.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+                self._proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                logger.debug(f"Command runner is not available: {e}")
+                del self._replies[request["id"]]
+                return None
+        finally:
+            self._lock.release()
+
+        reply[0].wait()
+        if reply[1] is None:
+            # the helper exited while running the command
+            return {"error": "exited", "message": "command runner exited"}
+        return reply[1]
+
+    def _read_replies(self):
+        """Hand the replies of the helper to the waiting requests"""
+        try:
+            for line in self._proc.stdout:
+                try:
+                    reply = json.loads(line)
+                    request_id = reply["id"]
+                except (ValueError, TypeError, KeyError) as e:
+                    # replies can no longer be matched to their requests
+                    logger.debug(f"Malformed reply of the command runner: {e}")
+                    self._proc.kill()
+                    break
+                self._lock.acquire()
+                try:
+                    waiting = self._replies.pop(request_id, None)
+                finally:
+                    self._lock.release()
+                if waiting:
+                    waiting[1] = reply
+                    waiting[0].set()
+        finally:
+            # the helper exited, wake requests that will get no reply
+            self._lock.acquire()
+            try:
+                self._closed = True
+                waiting, self._replies = self._replies, {}
+            finally:
+                self._lock.release()
+            for event, _ in waiting.values():
+                event.set()
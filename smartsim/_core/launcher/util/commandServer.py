@@ -0,0 +1,96 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Command server of the SmartSim command runner
+
+This script is run directly by ``CommandRunner`` rather than
+imported, and only uses the standard library, so that the helper
+process stays small. Every line read from stdin is a JSON request
+to run a command. Commands run in threads of their own and every
+reply is written to stdout as one JSON line with the id of its
+request. The server exits once stdin is closed.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+
+WRITE_LOCK = threading.Lock()
+
+
+def run_command(request):
+    """Run the command of a request
+
+    :param request: command, shell, cwd, env, input and timeout
+    :type request: dict
+    :return: reply with the returncode, output and error of the command,
+             or the error raised while running it
+    :rtype: dict
+    """
+    reply = {"id": request["id"]}
+    try:
+        proc = subprocess.run(
+            request["cmd"],
+            shell=request["shell"],
+            cwd=request["cwd"],
+            env=request["env"],
+            input=request["input"].encode("utf-8"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=request["timeout"],
+        )
+        reply["returncode"] = proc.returncode
+        reply["out"] = proc.stdout.decode("utf-8", errors="replace")
+        reply["err"] = proc.stderr.decode("utf-8", errors="replace")
+    except subprocess.TimeoutExpired as e:
+        reply["error"] = "timeout"
+        reply["message"] = str(e)
+    except Exception as e:
+        reply["error"] = "exception"
+        reply["message"] = str(e)
+    return reply
+
+
+def handle_request(request):
+    reply = json.dumps(run_command(request))
+    with WRITE_LOCK:
+        sys.stdout.write(reply + "\n")
+        sys.stdout.flush()
+
+
+def main():
+    for line in sys.stdin:
+        request = json.loads(line)
+        thread = threading.Thread(target=handle_request, args=(request,))
+        thread.daemon = True
+        thread.start()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import json
+import os
+import shutil
+import subprocess
+import time
+
+from ....log import get_logger
+from ....status import STATUS_CANCELLED, STATUS_COMPLETED, STATUS_FAILED, STATUS_RUNNING
+
+logger = get_logger(__name__)
+
+
+def write_status(status_file, status, returncode=None):
+    """Write the status of a packed task
+
+    The file is replaced at once so that readers never see a
+    partially written status.
+
+    :param status_file: path of the status file
+    :type status_file: str
+    :param status: status of the task
+    :type status: str
+    :param returncode: returncode of the task, defaults to None
+    :type returncode: int, optional
+    """
+    tmp_file = status_file + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump({"status": status, "returncode": returncode}, f)
+    os.replace(tmp_file, status_file)
+
+
+def read_status(status_file):
+    """Read the status of a packed task
+
+    :param status_file: path of the status file
+    :type status_file: str
+    :return: status and returncode, None if the task has not started
+    :rtype: tuple[str, int] | None
+    """
+    try:
+        with open(status_file) as f:
+            status = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return status["status"], status["returncode"]
+
+
+class Packer:
+    """Start the tasks of a batch on the free nodes of its allocation
+
+    Tasks are started in order as soon as enough of the allocation
+    is free for them, and later tasks that fit are started ahead of
+    those that do not. The allocation is divided into slots: a slot
+    is one task on a node if the tasks per node are known, otherwise
+    a whole node.
+
+    Each task is a dictionary with the ``name``, ``cmd``, ``cwd`` and
+    ``status_file`` of the task and the ``nodes`` and ``tasks`` it
+    requests (None if not requested). Tasks that request neither are
+    given a node.
+    """
+
+    def __init__(self, tasks, nodes, tasks_per_node=None, interval=0.1):
+        """Initialize a packer
+
+        :param tasks: tasks to run
+        :type tasks: list[dict]
+        :param nodes: number of nodes in the allocation
+        :type nodes: int
+        :param tasks_per_node: tasks that fit on a node, defaults to None
+        :type tasks_per_node: int, optional
+        :param interval: seconds between checks of running tasks
+        :type interval: float, optional
+        """
+        self.tasks = list(tasks)
+        self.tasks_per_node = tasks_per_node
+        self.capacity = max(int(nodes), 1) * (tasks_per_node or 1)
+        self.interval = interval
+        self._queue = []
+        self._running = {}
+        self._stopped = False
+
+    def get_slots(self, task):
+        """Get the number of slots a task takes
+
+        :param task: task to run
+        :type task: dict
+        :return: number of slots
+        :rtype: int
+        """
+        slots_per_node = self.tasks_per_node or 1
+        if task.get("nodes"):
+            slots = task["nodes"] * slots_per_node
+        elif task.get("tasks") and self.tasks_per_node:
+            slots = task["tasks"]
+        else:
+            slots = slots_per_node
+        if slots > self.capacity:
+            logger.warning(
+                f"{task['name']} requests more than the allocation, "
+                "running it on the whole allocation"
+            )
+        return min(slots, self.capacity)
+
+    def run(self):
+        """Run all tasks and wait for them to finish
+
+        :return: number of tasks that failed
+        :rtype: int
+        """
+        self._queue = list(self.tasks)
+        free = self.capacity
+        failed = 0
+        while (self._queue or self._running) and not self._stopped:
+            for task in list(self._queue):
+                slots = self.get_slots(task)
+                if slots <= free:
+                    self._queue.remove(task)
+                    proc = self._start(task)
+                    if proc:
+                        self._running[proc] = (task, slots)
+                        free -= slots
+                    else:
+                        failed += 1
+
+            finished = []
+            for proc, (task, slots) in list(self._running.items()):
+                returncode = proc.poll()
+                # tasks terminated by stop() are already cancelled
+                if returncode is not None and not self._stopped:
+                    finished.append(proc)
+                    del self._running[proc]
+                    free += slots
+                    status = STATUS_COMPLETED if returncode == 0 else STATUS_FAILED
+                    failed += returncode != 0
+                    write_status(task["status_file"], status, returncode)
+            if self._running and not finished:
+                time.sleep(self.interval)
+        return failed
+
+    def stop(self):
+        """Cancel queued tasks and terminate running ones"""
+        self._stopped = True
+        for proc, (task, _) in list(self._running.items()):
+            proc.terminate()
+            write_status(task["status_file"], STATUS_CANCELLED, None)
+        for task in self._queue:
+            write_status(task["status_file"], STATUS_CANCELLED, None)
+
+    def _start(self, task):
+        """Start a task
+
+        :param task: task to start
+        :type task: dict
+        :return: process of the task, None if it could not be started
+        :rtype: subprocess.Popen | None
+        """
+        logger.debug(f"Starting {task['name']}")
+        try:
+            proc = subprocess.Popen(
+                task["cmd"],
+                shell=True,
+                cwd=task["cwd"],
+                executable=shutil.which("bash"),
+            )
+        except OSError as e:
+            logger.error(f"Failed to start {task['name']}: {e}")
+            write_status(task["status_file"], STATUS_FAILED, None)
+            return None
+        write_status(task["status_file"], STATUS_RUNNING, None)
+        return proc
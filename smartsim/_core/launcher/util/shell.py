@@ -1,4 +1,4 @@
-import time
+import atexit
 from subprocess import PIPE, TimeoutExpired
 
 import psutil
@@ -6,14 +6,39 @@ import psutil
 from ....error import ShellError
 from ....log import get_logger
 from ...utils.helpers import check_dev_log_level
+from .commandRunner import CommandRunner
 
 logger = get_logger(__name__)
 verbose_shell = check_dev_log_level()
 
+# helper process running execute_cmd commands, see start_command_runner
+command_runner = None
+
+
+def start_command_runner():
+    """Run the commands of ``execute_cmd`` through a helper process
+
+    The helper should be started while the driver process is small.
+    Commands are run directly again if the helper is not available.
+
+    :return: True if the helper is running
+    :rtype: bool
+    """
+    global command_runner
+    if command_runner is None or not command_runner.running:
+        runner = CommandRunner()
+        if runner.start():
+            command_runner = runner
+            atexit.register(runner.stop)
+    return command_runner is not None and command_runner.running
+
 
 def execute_cmd(cmd_list, shell=False, cwd=None, env=None, proc_input="", timeout=None):
     """Execute a command locally
 
+    The command is run by the command runner if one was started
+    (see ``start_command_runner``).
+
     :param cmd_list: list of command with arguments
     :type cmd_list: list of str
     :param shell: run in system shell, defaults to False
@@ -37,6 +62,21 @@ def execute_cmd(cmd_list, shell=False, cwd=None, env=None, proc_input="", timeou
         source = "shell" if shell else "Popen"
         logger.debug(f"Executing {source} cmd: {' '.join(cmd_list)}")
 
+    if command_runner is not None:
+        reply = command_runner.run(cmd_list, shell, cwd, env, proc_input, timeout)
+        error = reply.get("error") if reply else None
+        if error == "timeout":
+            logger.error(reply["message"])
+            raise ShellError(
+                "Failed to execute command, timeout reached", reply["message"], cmd_list
+            )
+        if reply is not None and error is None:
+            return reply["returncode"], reply["out"], reply["err"]
+        if error == "exited":
+            logger.debug(f"{reply['message']}, executing cmd directly")
+        # the command could not be run by the runner, start it directly,
+        # which also raises the same errors as without the runner
+
     # spawning the subprocess and connecting to its output
     proc = psutil.Popen(
         cmd_list, stderr=PIPE, stdout=PIPE, stdin=PIPE, cwd=cwd, shell=shell, env=env
@@ -66,12 +106,19 @@ def execute_async_cmd(cmd_list, cwd, env=None, out=PIPE, err=PIPE):
     This function executes an asynchronous command and returns a
     popen subprocess object wrapped with psutil.
 
+    The call does not wait on the spawned process. Failures to
+    execute the command (e.g. a missing executable) are reported
+    by the child over a close-on-exec pipe before Popen returns
+    and raised as a ShellError. Failures of the command after it
+    has started are left to the monitoring of the launched task.
+
     :param cmd_list: list of command with arguments
     :type cmd_list: list of str
     :param cwd: current working directory
     :type cwd: str
     :param env: environment variables to set
     :type env: dict
+    :raises ShellError: if the command could not be executed
     :return: the subprocess object
     :rtype: psutil.Popen
     """
@@ -83,16 +130,6 @@ def execute_async_cmd(cmd_list, cwd, env=None, out=PIPE, err=PIPE):
         popen_obj = psutil.Popen(
             cmd_list, cwd=cwd, stdout=out, stderr=err, env=env, close_fds=True
         )
-        time.sleep(0.2)
-        popen_obj.poll()
-        if not popen_obj.is_running() and popen_obj.returncode != 0:
-            output, error = popen_obj.communicate()
-            err_msg = ""
-            if output:
-                err_msg += output.decode("utf-8") + " "
-            if error:
-                err_msg += error.decode("utf-8")
-            raise ShellError("Command failed immediately", err_msg, cmd_list)
     except OSError as e:
         raise ShellError("Failed to run command", e, cmd_list) from None
     return popen_obj
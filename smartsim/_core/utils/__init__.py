@@ -1,2 +1,7 @@
 from .helpers import colorize, delete_elements, init_default, installed_redisai_backends
-from .redis import check_cluster_status, create_cluster, db_is_active
+from .redis import (
+    check_cluster_status,
+    create_cluster,
+    db_is_active,
+    get_cluster_layout,
+)
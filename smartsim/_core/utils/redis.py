@@ -24,95 +24,299 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import redis
-from rediscluster import RedisCluster
-from rediscluster.exceptions import ClusterDownError, RedisClusterException
 from smartredis import Client
 from smartredis.error import RedisReplyError
 
-logging.getLogger("rediscluster").setLevel(logging.WARNING)
-
 from ...entity import DBModel, DBScript
 from ...error import SSInternalError
 from ...log import get_logger
-from ..config import CONFIG
-from ..launcher.util.shell import execute_cmd
 from .network import get_ip_from_host
 
 logger = get_logger(__name__)
 
+# number of hash slots of a Redis/KeyDB cluster
+CLUSTER_SLOTS = 16384
+
+# backoff between cluster status checks, in seconds
+CLUSTER_CHECK_MIN_DELAY = 0.1
+CLUSTER_CHECK_MAX_DELAY = 5
+
+# attempts to attach a replica to its primary
+CLUSTER_REPLICATE_TRIALS = 10
+
 
-def create_cluster(hosts, ports):  # cov-wlm
+def create_cluster(hosts, ports, replicas=0):  # cov-wlm
     """Connect launched cluster instances.
 
-    Should only be used in the case where cluster initialization
-    needs to occur manually which is not often.
+    The shards are split into primaries and replicas with
+    ``get_cluster_layout``, and the hash slots are split evenly
+    between the primaries. Each shard is first sent its config
+    epoch and each primary its slots (with ``CLUSTER ADDSLOTSRANGE``
+    if supported), then all other shards are sent a ``CLUSTER MEET``
+    for the first shard. Finally, each replica is attached to its
+    primary with ``CLUSTER REPLICATE``. Shards are bootstrapped
+    concurrently and the slot assignment of each shard is pipelined.
 
     :param hosts: List of hostnames to connect to
     :type hosts: List[str]
     :param ports: List of ports for each hostname
     :type ports: List[int]
-    :raises SmartSimError: if cluster creation fails
+    :param replicas: number of replicas of each primary, defaults to 0
+    :type replicas: int, optional
+    :raises SSInternalError: if cluster creation fails
     """
-    ip_list = []
-    for host in hosts:
-        ip = get_ip_from_host(host)
-        for port in ports:
-            address = ":".join((ip, str(port) + " "))
-            ip_list.append(address)
-
-    # call cluster command
-    redis_cli = CONFIG.database_cli
-    cmd = [redis_cli, "--cluster", "create"]
-    cmd += ip_list
-    cmd += ["--cluster-replicas", "0"]
-    returncode, out, err = execute_cmd(cmd, proc_input="yes", shell=False)
-
-    if returncode != 0:
-        logger.error(out)
-        logger.error(err)
-        raise SSInternalError("Database '--cluster create' command failed")
-    logger.debug(out)
-
-
-def check_cluster_status(hosts, ports, trials=10):  # cov-wlm
+    layout = get_cluster_layout(hosts, ports, replicas)
+    primaries = [_resolve_address(primary) for primary, _ in layout]
+    replica_of = {
+        _resolve_address(replica): _resolve_address(primary)
+        for primary, primary_replicas in layout
+        for replica in primary_replicas
+    }
+    addresses = primaries + list(replica_of)
+    clients = {
+        address: redis.Redis(host=address[0], port=address[1], db=0)
+        for address in addresses
+    }
+    slot_ranges = _get_slot_ranges(len(primaries))
+    node_ids = {}
+
+    def assign_slots(shard, use_slot_ranges):
+        address = addresses[shard]
+        pipe = clients[address].pipeline(transaction=False)
+        pipe.execute_command("CLUSTER", "SET-CONFIG-EPOCH", shard + 1)
+        pipe.execute_command("CLUSTER", "MYID")
+        if shard < len(primaries):
+            first_slot, last_slot = slot_ranges[shard]
+            if use_slot_ranges:
+                pipe.execute_command("CLUSTER", "ADDSLOTSRANGE", first_slot, last_slot)
+            else:
+                pipe.execute_command(
+                    "CLUSTER", "ADDSLOTS", *range(first_slot, last_slot + 1)
+                )
+        node_ids[address] = pipe.execute()[1]
+
+    def meet(shard):
+        clients[addresses[shard]].execute_command("CLUSTER", "MEET", *addresses[0])
+
+    def replicate(replica):
+        # the replica has to learn about its primary through the
+        # cluster bus before it can be attached to it
+        primary_id = node_ids[replica_of[replica]]
+        delay = CLUSTER_CHECK_MIN_DELAY
+        for _ in range(CLUSTER_REPLICATE_TRIALS - 1):
+            try:
+                return clients[replica].execute_command(
+                    "CLUSTER", "REPLICATE", primary_id
+                )
+            except redis.ResponseError:
+                time.sleep(delay)
+                delay = min(delay * 2, CLUSTER_CHECK_MAX_DELAY)
+        return clients[replica].execute_command("CLUSTER", "REPLICATE", primary_id)
+
+    try:
+        # ADDSLOTSRANGE was added in Redis 7
+        version = clients[addresses[0]].info("server").get("redis_version", "0")
+        use_slot_ranges = int(version.split(".")[0]) >= 7
+        shards = range(len(addresses))
+        with ThreadPoolExecutor(thread_name_prefix="ClusterCreate") as pool:
+            # config epochs can only be set before shards know each other
+            list(pool.map(assign_slots, shards, [use_slot_ranges] * len(shards)))
+            list(pool.map(meet, shards[1:]))
+            list(pool.map(replicate, replica_of))
+    except redis.RedisError as e:
+        logger.error(str(e))
+        raise SSInternalError("Database cluster creation failed") from e
+    finally:
+        for client in clients.values():
+            client.close()
+    logger.debug(
+        f"Assigned hash slots to {len(primaries)} database shards "
+        f"with {len(replica_of)} replicas"
+    )
+
+
+def get_cluster_layout(hosts, ports, replicas=0):
+    """Split the shards of a cluster into primaries and replicas
+
+    Shards are taken round-robin over the hosts, so that primaries
+    are spread over as many hosts as possible. Each replica is placed
+    on a host which does not run its primary or any other replica
+    of the same primary, whenever the hosts allow it.
+
+    :param hosts: List of hostnames of the shards
+    :type hosts: List[str]
+    :param ports: List of ports for each hostname
+    :type ports: List[int]
+    :param replicas: number of replicas of each primary, defaults to 0
+    :type replicas: int, optional
+    :return: address of each primary with the addresses of its replicas
+    :rtype: list[tuple[tuple[str, int], list[tuple[str, int]]]]
+    """
+    shards = [(host, port) for port in ports for host in hosts]
+    num_primaries = len(shards) // (replicas + 1)
+    layout = [(primary, []) for primary in shards[:num_primaries]]
+    pool = shards[num_primaries:]
+
+    def conflicts(shard, replica):
+        primary, primary_replicas = layout[shard]
+        other_hosts = [primary[0]] + [r[0] for r in primary_replicas[:-1]]
+        return replica[0] in other_hosts
+
+    for _ in range(replicas):
+        for primary, primary_replicas in layout:
+            other_hosts = [primary[0]] + [r[0] for r in primary_replicas]
+            replica = next((s for s in pool if s[0] not in other_hosts), pool[0])
+            pool.remove(replica)
+            primary_replicas.append(replica)
+
+        # swap replicas placed next to their primary with replicas
+        # of this round that can be moved
+        for shard, (_, primary_replicas) in enumerate(layout):
+            if not conflicts(shard, primary_replicas[-1]):
+                continue
+            for other, (_, other_replicas) in enumerate(layout):
+                if not conflicts(shard, other_replicas[-1]) and not conflicts(
+                    other, primary_replicas[-1]
+                ):
+                    primary_replicas[-1], other_replicas[-1] = (
+                        other_replicas[-1],
+                        primary_replicas[-1],
+                    )
+                    break
+    return layout
+
+
+def check_cluster_status(hosts, ports, trials=20, replicas=0):  # cov-wlm
     """Check that a Redis/KeyDB cluster is up and running
 
+    ``CLUSTER INFO`` is polled on all shards concurrently, with
+    exponential backoff between trials, until every shard reports
+    the cluster state as ok and knows all the replicas.
+
     :param hosts: List of hostnames to connect to
     :type hosts: List[str]
     :param ports: List of ports for each hostname
     :type ports: List[int]
     :param trials: number of attempts to verify cluster status
     :type trials: int, optional
+    :param replicas: number of replicas of each primary, defaults to 0
+    :type replicas: int, optional
 
-    :raises SmartSimError: If cluster status cannot be verified
+    :raises SSInternalError: If cluster status cannot be verified
     """
-    host_list = []
-    for host in hosts:
-        for port in ports:
-            host_dict = dict()
-            host_dict["host"] = get_ip_from_host(host)
-            host_dict["port"] = port
-            host_list.append(host_dict)
+    addresses = _get_shard_addresses(hosts, ports)
+    num_replicas = len(addresses) - len(addresses) // (replicas + 1)
+    delay = CLUSTER_CHECK_MIN_DELAY
 
     logger.debug("Beginning database cluster status check...")
-    while trials > 0:
-        # wait for cluster to spin up
-        time.sleep(5)
-        try:
-            redis_tester = RedisCluster(startup_nodes=host_list)
-            redis_tester.set("__test__", "__test__")
-            redis_tester.delete("__test__")
-            logger.debug("Cluster status verified")
-            return
-        except (ClusterDownError, RedisClusterException, redis.RedisError):
-            logger.debug("Cluster still spinning up...")
+    with ThreadPoolExecutor(thread_name_prefix="ClusterCheck") as pool:
+        while trials > 0:
+            if all(
+                pool.map(lambda address: _cluster_ok(*address, num_replicas), addresses)
+            ):
+                logger.debug("Cluster status verified")
+                return
             trials -= 1
-    if trials == 0:
-        raise SSInternalError("Cluster setup could not be verified")
+            if trials > 0:
+                logger.debug("Cluster still spinning up...")
+                time.sleep(delay)
+                delay = min(delay * 2, CLUSTER_CHECK_MAX_DELAY)
+    raise SSInternalError("Cluster setup could not be verified")
+
+
+def _get_shard_addresses(hosts, ports):
+    return [(get_ip_from_host(host), port) for host in hosts for port in ports]
+
+
+def _resolve_address(address):
+    return get_ip_from_host(address[0]), address[1]
+
+
+def _get_slot_ranges(num_shards):
+    """Split the hash slots of a cluster evenly between shards
+
+    :param num_shards: number of shards
+    :type num_shards: int
+    :return: first and last slot of each shard
+    :rtype: list[tuple[int, int]]
+    """
+    return [
+        (
+            shard * CLUSTER_SLOTS // num_shards,
+            (shard + 1) * CLUSTER_SLOTS // num_shards - 1,
+        )
+        for shard in range(num_shards)
+    ]
+
+
+def _cluster_ok(host, port, num_replicas=0):
+    """Check if a shard reports the cluster state as ok
+
+    :param host: ip of the shard
+    :type host: str
+    :param port: port of the shard
+    :type port: int
+    :param num_replicas: number of replicas the shard has to know
+                         about, defaults to 0
+    :type num_replicas: int, optional
+    :return: Whether the cluster state is ok
+    :rtype: bool
+    """
+    try:
+        client = redis.Redis(host=host, port=port, db=0, socket_timeout=5)
+        try:
+            info = client.execute_command("CLUSTER", "INFO")
+            if num_replicas:
+                nodes = client.execute_command("CLUSTER", "NODES")
+        finally:
+            client.close()
+    except redis.RedisError:
+        return False
+    if isinstance(info, bytes):
+        info = info.decode("utf-8")
+    if "cluster_state:ok" not in info.split():
+        return False
+    if num_replicas:
+        if isinstance(nodes, bytes):
+            nodes = nodes.decode("utf-8")
+        flags = [line.split()[2].split(",") for line in nodes.splitlines() if line]
+        return sum("slave" in node_flags for node_flags in flags) == num_replicas
+    return True
+
+
+def ping_db(host, port, timeout=1):
+    """Check if a database shard answers a PING
+
+    Shards that are still loading their dataset answer
+    with an error and are not considered ready.
+
+    :param host: hostname or ip of the shard
+    :type host: str
+    :param port: port of the shard
+    :type port: int
+    :param timeout: socket timeout in seconds, defaults to 1
+    :type timeout: float, optional
+    :return: Whether the shard answered
+    :rtype: bool
+    """
+    try:
+        client = redis.Redis(
+            host=host,
+            port=port,
+            db=0,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+        )
+        try:
+            return bool(client.ping())
+        finally:
+            client.close()
+    except redis.RedisError:
+        return False
 
 
 def db_is_active(hosts, ports, num_shards):
@@ -0,0 +1,82 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import json
+import os
+
+"""
+Rendezvous files written by database shards once started
+"""
+
+
+def get_rendezvous_filename(name, port):
+    """Return the name of the rendezvous file of a database shard
+
+    :param name: name of the shard
+    :type name: str
+    :param port: port of the shard
+    :type port: int
+    :return: rendezvous file name
+    :rtype: str
+    """
+    return "".join(("rendezvous-", name, "-", str(port), ".json"))
+
+
+def write_rendezvous_file(filepath, host, port, pid):
+    """Report the address of a database shard
+
+    The file is replaced at once so that readers never see a
+    partially written address.
+
+    :param filepath: path of the rendezvous file
+    :type filepath: str
+    :param host: ip address the shard is bound to
+    :type host: str
+    :param port: port of the shard
+    :type port: int
+    :param pid: process id of the shard
+    :type pid: int
+    """
+    tmp_file = filepath + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump({"host": host, "port": port, "pid": pid}, f)
+    os.replace(tmp_file, filepath)
+
+
+def read_rendezvous_file(filepath):
+    """Read the address reported by a database shard
+
+    :param filepath: path of the rendezvous file
+    :type filepath: str
+    :return: host, port and pid of the shard, None if not reported
+    :rtype: dict | None
+    """
+    try:
+        with open(filepath) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,202 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2022, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import asyncio
+import functools
+import time
+
+from .status import ALL_COMPLETED, FIRST_COMPLETED
+
+
+class AsyncExperiment:
+    """Asyncio interface to an ``Experiment``
+
+    ``AsyncExperiment`` exposes the launch and monitoring methods of
+    an ``Experiment`` as coroutines so that SmartSim workflows can be
+    driven from an asyncio event loop alongside other I/O.
+
+    Launching and stopping instances query the workload manager and
+    run in an executor so the event loop is never blocked, including
+    while waiting for an ``Orchestrator`` to come up. Waiting on
+    instances is driven by the status changes published by SmartSim
+    rather than by polling.
+
+    .. highlight:: python
+    .. code-block:: python
+
+        exp = Experiment("async-exp", launcher="slurm")
+        aexp = AsyncExperiment(exp)
+
+        async def workflow():
+            await aexp.start(db)
+            await aexp.start(ensemble)
+            done, not_done = await aexp.wait(ensemble, timeout=3600)
+            await aexp.stop(db)
+
+        asyncio.run(workflow())
+
+    Instances are created, generated and summarized through the
+    wrapped ``Experiment``.
+    """
+
+    def __init__(self, experiment, executor=None):
+        """Initialize an AsyncExperiment
+
+        :param experiment: experiment to drive from the event loop
+        :type experiment: Experiment
+        :param executor: executor running the blocking launcher calls,
+                         defaults to None (the event loop default executor)
+        :type executor: concurrent.futures.Executor, optional
+        """
+        self.experiment = experiment
+        self._executor = executor
+        self._launch_lock = None
+
+    async def _run_in_executor(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    async def start(
+        self, *args, summary=False, kill_on_interrupt=True, max_concurrent=None
+    ):
+        """Launch instances without blocking the event loop
+
+        The coroutine returns once the instances have been launched
+        (for an ``Orchestrator``, once it is running) and does not
+        wait for them to complete; use ``AsyncExperiment.wait`` for
+        that. Concurrent calls are launched one after the other.
+
+        :param summary: print a launch summary prior to launch,
+                        defaults to False
+        :type summary: bool, optional
+        :param kill_on_interrupt: flag for killing jobs when ^C (SIGINT)
+                                  signal is received.
+        :type kill_on_interrupt: bool, optional
+        :param max_concurrent: maximum number of running members of each
+                               ensemble, defaults to None (no limit)
+        :type max_concurrent: int, optional
+        """
+        # signal handlers can only be installed from the main thread
+        self.experiment._control.set_interrupt_handler(kill_on_interrupt)
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+        async with self._launch_lock:
+            await self._run_in_executor(
+                self.experiment.start,
+                *args,
+                block=False,
+                summary=summary,
+                kill_on_interrupt=kill_on_interrupt,
+                max_concurrent=max_concurrent,
+            )
+
+    async def stop(self, *args):
+        """Stop instances without blocking the event loop
+
+        :raises TypeError: if wrong type
+        :raises SmartSimError: if stop request fails
+        """
+        await self._run_in_executor(self.experiment.stop, *args)
+
+    async def get_status(self, *args):
+        """Return the status of launched instances
+
+        Statuses are read from the last update of the job manager
+        and do not query the workload manager.
+
+        :returns: status of the instances passed as arguments
+        :rtype: list[str]
+        :raises SmartSimError: if status retrieval fails
+        """
+        return self.experiment.get_status(*args)
+
+    async def finished(self, entity):
+        """Query if a job has completed.
+
+        :param entity: object launched by the ``Experiment``
+        :type entity: Model | Ensemble
+        :returns: True if job has completed, False otherwise
+        :rtype: bool
+        :raises SmartSimError: if entity has not been launched
+                               by the ``Experiment``
+        """
+        return self.experiment.finished(entity)
+
+    async def wait(self, *args, return_when=ALL_COMPLETED, timeout=None):
+        """Wait for launched instances to complete
+
+        Equivalent of ``Experiment.wait`` that suspends the calling
+        coroutine instead of blocking the event loop.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            done, not_done = await aexp.wait(ensemble, return_when=FIRST_COMPLETED)
+
+        :param return_when: ``smartsim.status.FIRST_COMPLETED`` or
+                            ``smartsim.status.ALL_COMPLETED``,
+                            defaults to ``ALL_COMPLETED``
+        :type return_when: str, optional
+        :param timeout: seconds to wait for, defaults to None (forever)
+        :type timeout: float, optional
+        :return: the completed and not completed instances
+        :rtype: tuple[list, list]
+        :raises SmartSimError: if an instance has not been launched
+        """
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+
+        def on_event(_):
+            loop.call_soon_threadsafe(changed.set)
+
+        subscription = self.experiment.subscribe(*args, callback=on_event)
+        try:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                # clear before checking so that no status change is missed
+                changed.clear()
+                done, not_done = self.experiment.wait(
+                    *args, return_when=return_when, timeout=0
+                )
+                if not not_done or (done and return_when == FIRST_COMPLETED):
+                    return done, not_done
+
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return done, not_done
+                try:
+                    await asyncio.wait_for(changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            subscription.cancel()
+
+    def __str__(self):
+        return str(self.experiment)
@@ -34,9 +34,10 @@ from smartredis import Client
 from smartredis.error import RedisReplyError
 
 from .._core.config import CONFIG
-from .._core.utils import db_is_active
+from .._core.utils import db_is_active, get_cluster_layout
 from .._core.utils.helpers import is_valid_cmd
 from .._core.utils.network import get_ip_from_host
+from .._core.utils.rendezvous import get_rendezvous_filename
 from ..entity import DBNode, EntityList
 from ..error import SmartSimError, SSConfigError, SSUnsupportedError
 from ..log import get_logger
@@ -76,6 +77,9 @@ class Orchestrator(EntityList):
         time=None,
         alloc=None,
         single_cmd=False,
+        shards_per_node=1,
+        pin_shards=False,
+        replicas=0,
         **kwargs,
     ):
         """Initialize an Orchestrator reference for local launch
@@ -84,6 +88,17 @@ class Orchestrator(EntityList):
         :type port: int, optional
         :param interface: network interface, defaults to "lo"
         :type interface: str, optional
+        :param shards_per_node: number of shards started on each database
+                                node, on ports ``port`` to
+                                ``port + shards_per_node - 1``, defaults to 1
+        :type shards_per_node: int, optional
+        :param pin_shards: pin the shards of a node to separate CPUs,
+                           defaults to False
+        :type pin_shards: bool, optional
+        :param replicas: number of replicas of each primary shard of a
+                         clustered database, placed on distinct nodes from
+                         their primary whenever possible, defaults to 0
+        :type replicas: int, optional
 
         Extra configurations for RedisAI
 
@@ -143,6 +158,7 @@ class Orchestrator(EntityList):
         self.path = getcwd()
         self._hosts = []
         self._interface = interface
+        self._pin_shards = pin_shards
         self._check_network_interface()
         self.queue_threads = kwargs.get("threads_per_queue", None)
         self.inter_threads = kwargs.get("inter_op_threads", None)
@@ -165,6 +181,8 @@ class Orchestrator(EntityList):
             run_command=run_command,
             alloc=alloc,
             single_cmd=single_cmd,
+            shards_per_node=shards_per_node,
+            replicas=replicas,
             gpus_per_shard=gpus_per_shard,
             cpus_per_shard=cpus_per_shard,
             **kwargs,
@@ -204,12 +222,13 @@ class Orchestrator(EntityList):
     def num_shards(self):
         """Return the number of DB shards contained in the orchestrator.
         This might differ from the number of ``DBNode`` objects, as each
-        ``DBNode`` may start more than one shard (e.g. with MPMD).
+        ``DBNode`` may start more than one shard (e.g. with MPMD or
+        ``shards_per_node``).
 
         :returns: num_shards
         :rtype: int
         """
-        return self.db_nodes
+        return self.db_nodes * self.shards_per_node
 
     @property
     def hosts(self):
@@ -251,6 +270,40 @@ class Orchestrator(EntityList):
             addresses.append(":".join((ip, str(port))))
         return addresses
 
+    def get_primary_addresses(self):
+        """Return the addresses of the primary database shards
+
+        Without replicas, these are the same as the addresses
+        returned by ``get_address``.
+
+        :return: addresses
+        :rtype: list[str]
+
+        :raises SmartSimError: If database address cannot be found or is not active
+        """
+        return list(self.get_replica_addresses())
+
+    def get_replica_addresses(self):
+        """Return the addresses of the replicas of each primary shard
+
+        :return: addresses of the replicas of each primary address
+        :rtype: dict[str, list[str]]
+
+        :raises SmartSimError: If database address cannot be found or is not active
+        """
+        self.get_address()
+        return self._get_replica_addresses()
+
+    def _get_replica_addresses(self):
+        def to_address(shard):
+            return ":".join((shard[0], str(shard[1])))
+
+        layout = get_cluster_layout(self._hosts, self.ports, self.replicas)
+        return {
+            to_address(primary): [to_address(replica) for replica in replicas]
+            for primary, replicas in layout
+        }
+
     def is_active(self):
         """Check if the database is active
 
@@ -290,11 +343,13 @@ class Orchestrator(EntityList):
         """Set the number of CPUs available to each database shard
 
         This effectively will determine how many cpus can be used for
-        compute threads, background threads, and network I/O.
+        compute threads, background threads, and network I/O. Database
+        nodes running several shards are given the CPUs of all of them.
 
         :param num_cpus: number of cpus to set
         :type num_cpus: int
         """
+        num_cpus *= self.shards_per_node
         if self.batch:
             if self.launcher == "pbs" or self.launcher == "cobalt":
                 self.batch_settings.set_ncpus(num_cpus)
@@ -593,11 +648,16 @@ class Orchestrator(EntityList):
 
     def _initialize_entities(self, **kwargs):
         self.db_nodes = kwargs.get("db_nodes", 1)
+        self.shards_per_node = kwargs.get("shards_per_node", 1)
+        self.replicas = kwargs.get("replicas", 0)
         single_cmd = kwargs.get("single_cmd", True)
 
-        if int(self.db_nodes) == 2:
+        if int(self.num_shards) == 2:
             raise SSUnsupportedError("Orchestrator does not support clusters of size 2")
 
+        if self.replicas:
+            self._check_replicas()
+
         if self.launcher == "local" and self.db_nodes > 1:
             raise ValueError(
                 "Local Orchestrator does not support multiple database shards"
@@ -608,8 +668,8 @@ class Orchestrator(EntityList):
         if mpmd_nodes:
             self._initialize_entities_mpmd(**kwargs)
         else:
-            port = kwargs.get("port", 6379)
-            cluster = not bool(self.db_nodes < 3)
+            ports = self._get_ports(kwargs.get("port", 6379))
+            cluster = not bool(self.num_shards < 3)
 
             for db_id in range(self.db_nodes):
                 db_node_name = "_".join((self.name, str(db_id)))
@@ -617,7 +677,7 @@ class Orchestrator(EntityList):
                 # create the exe_args list for launching multiple databases
                 # per node. also collect port range for dbnode
                 start_script_args = self._get_start_script_args(
-                    db_node_name, port, cluster
+                    db_node_name, ports, cluster
                 )
 
                 exe_args = " ".join(start_script_args)
@@ -631,16 +691,16 @@ class Orchestrator(EntityList):
                     db_node_name,
                     self.path,
                     run_settings,
-                    [port],
+                    ports,
                     [db_node_name + ".out"],
                 )
                 self.entities.append(node)
 
-            self.ports = [port]
+            self.ports = ports
 
     def _initialize_entities_mpmd(self, **kwargs):
-        port = kwargs.get("port", 6379)
-        cluster = not bool(self.db_nodes < 3)
+        ports = self._get_ports(kwargs.get("port", 6379))
+        cluster = not bool(self.num_shards < 3)
 
         exe_args_mpmd = []
 
@@ -649,7 +709,7 @@ class Orchestrator(EntityList):
             # create the exe_args list for launching multiple databases
             # per node. also collect port range for dbnode
             start_script_args = self._get_start_script_args(
-                db_shard_name, port, cluster
+                db_shard_name, ports, cluster
             )
             exe_args = " ".join(start_script_args)
             exe_args_mpmd.append(sh_split(exe_args))
@@ -667,12 +727,40 @@ class Orchestrator(EntityList):
                 sys.executable, exe_args_mpmd, **kwargs
             )
             output_files = [self.name + ".out"]
-        node = DBNode(self.name, self.path, run_settings, [port], output_files)
+        node = DBNode(self.name, self.path, run_settings, ports, output_files)
         node._mpmd = True
         node._num_shards = self.db_nodes
         self.entities.append(node)
 
-        self.ports = [port]
+        self.ports = ports
+
+    def _check_replicas(self):
+        if self.num_shards % (self.replicas + 1):
+            raise SSUnsupportedError(
+                f"Orchestrator with {self.replicas} replicas per shard needs "
+                f"a multiple of {self.replicas + 1} database shards"
+            )
+        if self.num_shards // (self.replicas + 1) < 3:
+            raise SSUnsupportedError(
+                "Orchestrator replicas are only supported for clusters "
+                "of at least 3 primary shards"
+            )
+        if self.db_nodes <= self.replicas:
+            logger.warning(
+                f"Orchestrator with {self.replicas} replicas per shard on "
+                f"{self.db_nodes} nodes can not place all replicas on other "
+                "nodes than their primary"
+            )
+
+    def _get_ports(self, port):
+        """Return the ports of the shards started on each database node
+
+        :param port: port of the first shard
+        :type port: int
+        :return: ports
+        :rtype: list[int]
+        """
+        return list(range(port, port + self.shards_per_node))
 
     @staticmethod
     def _get_cluster_args(name, port):
@@ -681,20 +769,28 @@ class Orchestrator(EntityList):
         db_args = ["--cluster-enabled yes", "--cluster-config-file", cluster_conf]
         return db_args
 
-    def _get_start_script_args(self, name, port, cluster):
+    def _get_start_script_args(self, name, ports, cluster):
         start_script_args = [
             "-m",
             "smartsim._core.entrypoints.redis",  # entrypoint
             f"+ifname={self._interface}",  # pass interface to start script
-            "+command",  # command flag for argparser
-            self._redis_exe,  # redis-server
-            self._redis_conf,  # redis6.conf file
-            self._rai_module,  # redisai.so
-            "--port",  # redis port
-            str(port),  # port number
         ]
-        if cluster:
-            start_script_args += self._get_cluster_args(name, port)
+        if self._pin_shards:
+            start_script_args.append("+pin_cpus")  # pin shards to separate cpus
+
+        # one database process per port
+        for port in ports:
+            start_script_args += [
+                f"+rendezvous={get_rendezvous_filename(name, port)}",  # address file
+                "+command",  # command flag for argparser
+                self._redis_exe,  # redis-server
+                self._redis_conf,  # redis6.conf file
+                self._rai_module,  # redisai.so
+                "--port",  # redis port
+                str(port),  # port number
+            ]
+            if cluster:
+                start_script_args += self._get_cluster_args(name, port)
 
         return start_script_args
 
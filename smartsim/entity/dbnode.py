@@ -28,6 +28,7 @@ import os
 import os.path as osp
 import time
 
+from .._core.utils.rendezvous import get_rendezvous_filename, read_rendezvous_file
 from ..error import SmartSimError
 from ..log import get_logger
 from .entity import SmartSimEntity
@@ -79,9 +80,9 @@ class DBNode(SmartSimEntity):
         self._hosts = [str(host) for host in hosts]
 
     def remove_stale_dbnode_files(self):
-        """This function removes the .conf, .err, and .out files that
-        have the same names used by this dbnode that may have been
-        created from a previous experiment execution.
+        """This function removes the .conf, .err, .out and rendezvous
+        files that have the same names used by this dbnode that may
+        have been created from a previous experiment execution.
         """
 
         for port in self.ports:
@@ -98,6 +99,11 @@ class DBNode(SmartSimEntity):
                     if osp.exists(conf_file):
                         os.remove(conf_file)
 
+        for filename in self._get_rendezvous_filenames():
+            rendezvous_file = osp.join(self.path, filename)
+            if osp.exists(rendezvous_file):
+                os.remove(rendezvous_file)
+
         for file_ending in [".err", ".out", ".mpmd"]:
             file_name = osp.join(self.path, self.name + file_ending)
             if osp.exists(file_name):
@@ -136,60 +142,102 @@ class DBNode(SmartSimEntity):
             for shard_id in range(self._num_shards)
         ]
 
-    def _parse_ips(self, filepath, num_ips=None):
-        ips = []
-        with open(filepath, "r") as f:
-            lines = f.readlines()
-            for line in lines:
-                content = line.split()
-                if "IPADDRESS:" in content:
-                    ips.append(content[-1])
-                    if num_ips and len(ips) == num_ips:
-                        break
+    def _get_rendezvous_filenames(self):
+        """Returns the names of the files the shards of this node
+        write their address to once started
+
+        :return: rendezvous file names
+        :rtype: list[str]
+        """
+        if not self._mpmd:
+            names = [self.name]
+        else:  # cov-lsf
+            names = [f"{self.name}_{shard_id}" for shard_id in range(self._num_shards)]
+        return [
+            get_rendezvous_filename(name, port) for name in names for port in self.ports
+        ]
+
+    def _read_rendezvous_files(self):
+        """Read the addresses the shards of this node reported so far
 
+        All rendezvous files are collected with a single
+        scan of the node directory.
+
+        :return: host, port and pid of each shard that reported
+        :rtype: list[dict]
+        """
+        try:
+            written = set(os.listdir(self.path))
+        except FileNotFoundError:
+            return []
+
+        shards = []
+        for filename in self._get_rendezvous_filenames():
+            if filename in written:
+                shard = read_rendezvous_file(osp.join(self.path, filename))
+                if shard:
+                    shards.append(shard)
+        return shards
+
+    def _try_parse_db_hosts(self):
+        """Parse the database hosts/IPs without waiting for them
+
+        Unlike ``host`` and ``hosts``, this returns immediately if not
+        all shards reported their address yet. Parsed hosts are cached.
+
+        :return: ip addresses | hostnames, or None if not all are reported yet
+        :rtype: list[str] | None
+        """
+        shards = self._read_rendezvous_files()
+        if not shards or len(shards) < len(self._get_rendezvous_filenames()):
+            return None
+
+        ips = list(dict.fromkeys(shard["host"] for shard in shards))
+        if self._mpmd:
+            self.set_hosts(ips)
+        else:
+            self.set_host(ips[0])
         return ips
 
-    def _parse_db_host(self, filepath=None):
-        """Parse the database host/IP from the output file
+    def _wait_for_db_hosts(self, timeout):
+        """Wait for all shards to report their address
 
-        If no file is passed as argument, then the first
-        file in self._output_files is used.
+        :param timeout: seconds to wait for
+        :type timeout: float
+        :raises SmartSimError: if host/ip could not be found
+        :return: ip addresses | hostnames
+        :rtype: list[str]
+        """
+        deadline = time.time() + timeout
+        delay = 0.05
+        ips = self._try_parse_db_hosts()
+        while not ips and time.time() < deadline:
+            logger.debug("Waiting for database shards to report their address...")
+            time.sleep(delay)
+            delay = min(delay * 2, 1)
+            ips = self._try_parse_db_hosts()
+
+        if not ips:
+            msg = f"Address lookup failed for database node {self.name}. "
+            msg += f"Found {len(self._read_rendezvous_files())} out of "
+            msg += f"{len(self._get_rendezvous_filenames())} shard addresses in "
+            msg += self.path
+            logger.error(msg)
+            raise SmartSimError("Failed to obtain database hostname")
+        return ips
+
+    def _parse_db_host(self):
+        """Parse the database host/IP reported by the shard
 
-        :param filepath: Path to file to parse
-        :type filepath: str, optional
         :raises SmartSimError: if host/ip could not be found
         :return: ip address | hostname
         :rtype: str
         """
-        if not filepath:
-            filepath = osp.join(self.path, self._output_files[0])
-        trials = 5
-        ip = None
-
-        # try a few times to give the database files time to
-        # populate on busy systems.
-        while not ip and trials > 0:
-            try:
-                ip = self._parse_ips(filepath, 1)[0]
-            # suppress error
-            except FileNotFoundError:
-                pass
-
-            logger.debug("Waiting for Redis output files to populate...")
-            if not ip:
-                time.sleep(1)
-                trials -= 1
-
-        if not ip:
-            logger.error(f"IP address lookup strategy failed for file {filepath}.")
-            raise SmartSimError("Failed to obtain database hostname")
-
-        return ip
+        return self._wait_for_db_hosts(timeout=5)[0]
 
     def _parse_db_hosts(self):
-        """Parse the database hosts/IPs from the output files
+        """Parse the database hosts/IPs reported by the shards
 
-        this uses the RedisIP module that is built as a dependency
         The IP address is preferred, but if hostname is only present
         then a lookup to /etc/hosts is done through the socket library.
         This function must be called only if ``_mpmd==True``.
@@ -198,39 +246,4 @@ class DBNode(SmartSimEntity):
         :return: ip addresses | hostnames
         :rtype: list[str]
         """
-        ips = []
-
-        # Find out if all shards' output streams are piped to separate files
-        if len(self._output_files) > 1:
-            for output_file in self._output_files:
-                filepath = osp.join(self.path, output_file)
-                ip = self._parse_db_host(filepath)
-        else:
-            filepath = osp.join(self.path, self._output_files[0])
-            trials = 10
-            ips = []
-            while len(ips) < self._num_shards and trials > 0:
-                ips = []
-                try:
-                    ip = self._parse_ips(filepath, self._num_shards)
-                    ips.extend(ip)
-
-                # suppress error
-                except FileNotFoundError:
-                    pass
-
-                if len(ips) < self._num_shards:
-                    logger.debug("Waiting for RedisIP files to populate...")
-                    # Larger sleep time, as this seems to be needed for
-                    # multihost setups
-                    time.sleep(2)
-                    trials -= 1
-
-            if len(ips) < self._num_shards:
-                msg = f"IP address lookup strategy failed for file {filepath}. "
-                msg += f"Found {len(ips)} out of {self._num_shards} IPs."
-                logger.error(msg)
-                raise SmartSimError("Failed to obtain database hostname")
-
-        ips = list(dict.fromkeys(ips))
-        return ips
+        return self._wait_for_db_hosts(timeout=20)
@@ -57,6 +57,7 @@ class Ensemble(EntityList):
         batch_settings=None,
         run_settings=None,
         perm_strat="all_perm",
+        max_concurrent=None,
         **kwargs,
     ):
         """Initialize an Ensemble of Model instances.
@@ -83,6 +84,11 @@ class Ensemble(EntityList):
                              options are "all_perm", "stepped", "random"
                              or a callable function. Defaults to "all_perm".
         :type perm_strategy: str
+        :param max_concurrent: maximum number of members running at once
+                               when not launched as a batch, the next member
+                               is launched as soon as one finishes. Defaults
+                               to None (all members at once)
+        :type max_concurrent: int, optional
         :return: ``Ensemble`` instance
         :rtype: ``Ensemble``
         """
@@ -91,6 +97,7 @@ class Ensemble(EntityList):
         self._key_prefixing_enabled = True
         self.batch_settings = init_default({}, batch_settings, BatchSettings)
         self.run_settings = init_default({}, run_settings, RunSettings)
+        self.max_concurrent = int(max_concurrent) if max_concurrent else None
         self._db_models = []
         self._db_scripts = []
         super().__init__(name, getcwd(), perm_strat=perm_strat, **kwargs)
@@ -48,6 +48,16 @@ class EntityList:
         except AttributeError:
             return False
 
+    @property
+    def array(self):
+        """Return True if the entities are launched as a job array"""
+        return self.batch and self.batch_settings.array
+
+    @property
+    def packed(self):
+        """Return True if the entities are packed into the batch allocation"""
+        return self.batch and self.batch_settings.packed
+
     @property
     def type(self):
         """Return the name of the class"""
@@ -38,6 +38,7 @@ from .entity import Ensemble, Model
 from .error import SmartSimError
 from .log import get_logger
 from .settings import settings
+from .status import ALL_COMPLETED
 from .wlm import detect_launcher
 
 logger = get_logger(__name__)
@@ -125,7 +126,14 @@ class Experiment:
         self._control = Controller(launcher=launcher)
         self._launcher = launcher.lower()
 
-    def start(self, *args, block=True, summary=False, kill_on_interrupt=True):
+    def start(
+        self,
+        *args,
+        block=True,
+        summary=False,
+        kill_on_interrupt=True,
+        max_concurrent=None,
+    ):
         """Start passed instances using Experiment launcher
 
         Any instance ``Model``, ``Ensemble`` or ``Orchestrator``
@@ -159,6 +167,17 @@ class Experiment:
         ``Experiment.stop``. This allows for multiple stages of a workflow
         to produce to and consume from the same Orchestrator database.
 
+        If `max_concurrent` is set, at most that many members of each
+        ensemble launched as separate job steps run at once. The other
+        members report a ``Pending`` status and are launched one by
+        one as running members finish. The limit of an ensemble
+        created with ``max_concurrent`` takes precedence.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            exp.start(ensemble, max_concurrent=8)
+
         If `kill_on_interrupt=True`, then all jobs launched by this
         experiment are guaranteed to be killed when ^C (SIGINT) signal is
         received. If `kill_on_interrupt=False`, then it is not guaranteed
@@ -175,6 +194,9 @@ class Experiment:
                                   signal is received.
 
         :type kill_on_interrupt: bool, optional
+        :param max_concurrent: maximum number of running members of each
+                               ensemble, defaults to None (no limit)
+        :type max_concurrent: int, optional
         """
         start_manifest = Manifest(*args)
         try:
@@ -184,6 +206,7 @@ class Experiment:
                 manifest=start_manifest,
                 block=block,
                 kill_on_interrupt=kill_on_interrupt,
+                max_concurrent=max_concurrent,
             )
         except SmartSimError as e:
             logger.error(e)
@@ -352,6 +375,85 @@ class Experiment:
             logger.error(e)
             raise
 
+    def subscribe(self, *args, callback=None):
+        """Subscribe to the status changes of launched instances
+
+        Every time SmartSim observes the status of a launched instance
+        change, a ``StatusEvent`` with the instance, its new status
+        and previous status is delivered to the subscription. Passing
+        an ``Ensemble`` subscribes to all of its members.
+
+        If a callback is provided it is called with each event from
+        the thread monitoring the jobs, so it should return quickly.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            exp.subscribe(ensemble, callback=lambda event: print(event))
+
+        Otherwise the events are put in the thread-safe queue
+        ``Subscription.events``
+
+        .. highlight:: python
+        .. code-block:: python
+
+            subscription = exp.subscribe(ensemble)
+            event = subscription.events.get()
+
+        Call ``Subscription.cancel`` to stop receiving events. If no
+        instances are passed, events of all instances are delivered.
+
+        :param callback: callable receiving each ``StatusEvent``
+        :type callback: callable, optional
+        :return: the subscription
+        :rtype: Subscription
+        :raises SmartSimError: if subscription fails
+        """
+        try:
+            entities = None
+            if args:
+                manifest = Manifest(*args)
+                entities = manifest.models + manifest.all_entity_lists
+            return self._control.subscribe(entities, callback=callback)
+        except SmartSimError as e:
+            logger.error(e)
+            raise
+
+    def wait(self, *args, return_when=ALL_COMPLETED, timeout=None):
+        """Wait for launched instances to complete
+
+        Block until all (``return_when=ALL_COMPLETED``) or any
+        (``return_when=FIRST_COMPLETED``) of the passed ``Model``
+        and ``Ensemble`` instances have completed, failed or been
+        cancelled. Members of an ``Ensemble`` are waited on
+        individually unless it was launched as a batch.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            from smartsim.status import FIRST_COMPLETED
+            done, not_done = exp.wait(ensemble, return_when=FIRST_COMPLETED)
+
+        :param return_when: ``smartsim.status.FIRST_COMPLETED`` or
+                            ``smartsim.status.ALL_COMPLETED``,
+                            defaults to ``ALL_COMPLETED``
+        :type return_when: str, optional
+        :param timeout: seconds to wait for, defaults to None (forever)
+        :type timeout: float, optional
+        :return: the completed and not completed instances
+        :rtype: tuple[list, list]
+        :raises SmartSimError: if an instance has not been launched
+        """
+        try:
+            manifest = Manifest(*args)
+            entities = manifest.models + manifest.all_entity_lists
+            return self._control.wait(
+                entities, return_when=return_when, timeout=timeout
+            )
+        except SmartSimError as e:
+            logger.error(e)
+            raise
+
     def create_ensemble(
         self,
         name,
@@ -360,6 +462,7 @@ class Experiment:
         run_settings=None,
         replicas=None,
         perm_strategy="all_perm",
+        max_concurrent=None,
         **kwargs,
     ):
         """Create an ``Ensemble`` of ``Model`` instances
@@ -407,6 +510,10 @@ class Experiment:
                               options are "all_perm", "stepped", "random"
                               or a callable function. Default is "all_perm".
         :type perm_strategy: str, optional
+        :param max_concurrent: maximum number of members running at once
+                               when not launched as a batch, defaults to
+                               None (all members at once)
+        :type max_concurrent: int, optional
         :raises SmartSimError: if initialization fails
         :return: ``Ensemble`` instance
         :rtype: Ensemble
@@ -419,6 +526,7 @@ class Experiment:
                 run_settings=run_settings,
                 perm_strat=perm_strategy,
                 replicas=replicas,
+                max_concurrent=max_concurrent,
                 **kwargs,
             )
             return new_ensemble
@@ -632,6 +740,9 @@ class Experiment:
         time=None,
         queue=None,
         single_cmd=True,
+        shards_per_node=1,
+        pin_shards=False,
+        replicas=0,
         **kwargs,
     ):
         """Initialize an Orchestrator database
@@ -673,6 +784,15 @@ class Experiment:
         :type queue: str, optional
         :param single_cmd: run all shards with one (MPMD) command, defaults to True
         :type single_cmd: bool, optional
+        :param shards_per_node: number of shards started on each database node,
+                                on consecutive ports from ``port``, defaults to 1
+        :type shards_per_node: int, optional
+        :param pin_shards: pin the shards of a node to separate CPUs,
+                           defaults to False
+        :type pin_shards: bool, optional
+        :param replicas: number of replicas of each primary shard of a
+                         clustered database, defaults to 0
+        :type replicas: int, optional
         :raises SmartSimError: if detection of launcher or of run command fails
         :raises SmartSimError: if user indicated an incompatible run command for the launcher
         :return: Orchestrator
@@ -689,6 +809,9 @@ class Experiment:
             time=time,
             queue=queue,
             single_cmd=single_cmd,
+            shards_per_node=shards_per_node,
+            pin_shards=pin_shards,
+            replicas=replicas,
             launcher=self._launcher,
             **kwargs,
         )
@@ -727,7 +850,6 @@ class Experiment:
         :return: tabulate string of ``Experiment`` history
         :rtype: str
         """
-        values = []
         headers = [
             "Name",
             "Entity-Type",
@@ -737,23 +859,31 @@ class Experiment:
             "Status",
             "Returncode",
         ]
-        for job in self._control.get_jobs().values():
-            for run in range(job.history.runs + 1):
-                values.append(
-                    [
-                        job.entity.name,
-                        job.entity.type,
-                        job.history.jids[run],
-                        run,
-                        job.history.job_times[run],
-                        job.history.statuses[run],
-                        job.history.returns[run],
-                    ]
-                )
-        else:
-            return tabulate(
-                values, headers, showindex=True, tablefmt=format, missingval="None"
-            )
+        values = list(self._control.get_run_history().rows())
+        return tabulate(
+            values, headers, showindex=True, tablefmt=format, missingval="None"
+        )
+
+    def get_history(self):
+        """Return the history of the runs of this ``Experiment``
+
+        Every completed run of a launched instance is a row of
+        the returned history which can be filtered, aggregated
+        and exported.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            history = exp.get_history()
+            names = [model.name for model in ensemble]
+            failures = history.failures(names)
+            p50, p99 = history.runtime_percentiles([50, 99], history.select(names))
+            history.to_csv("history.csv")
+
+        :return: history of the completed runs
+        :rtype: RunHistory
+        """
+        return self._control.get_run_history()
 
     def _launch_summary(self, manifest):
         """Experiment pre-launch summary of entities that will be launched
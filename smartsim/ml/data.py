@@ -1,7 +1,12 @@
 import time
+from bisect import bisect_right
 from os import environ
 
 import numpy as np
+import redis
+from rediscluster.connection import ClusterConnection
+from rediscluster.crc import crc16
+from rediscluster.exceptions import AskError
 from smartredis import Client, Dataset
 
 from ..error import SmartSimError
@@ -9,11 +14,176 @@ from ..log import get_logger
 
 logger = get_logger(__name__)
 
+# numpy types of RedisAI tensor data types
+TENSOR_DTYPES = {
+    "FLOAT": np.float32,
+    "DOUBLE": np.float64,
+    "INT8": np.int8,
+    "INT16": np.int16,
+    "INT32": np.int32,
+    "INT64": np.int64,
+    "UINT8": np.uint8,
+    "UINT16": np.uint16,
+    "BOOL": np.bool_,
+}
+
+# number of hash slots of a Redis/KeyDB cluster
+CLUSTER_SLOTS = 16384
+
 
 def form_name(*args):
     return "_".join(str(arg) for arg in args if arg is not None)
 
 
+def form_key(data_source, name):
+    """Form the database key of a tensor read from a data source
+
+    This is the key under which the SmartRedis client of the data
+    source stores a tensor named `name`.
+
+    :param data_source: name of the entity which put the tensor, if any
+    :type data_source: str
+    :param name: name of the tensor
+    :type name: str
+    :return: database key
+    :rtype: str
+    """
+    if data_source:
+        return ".".join((data_source, name))
+    return name
+
+
+class ReplicaReader:
+    """A class to read tensors from the replicas of a clustered database.
+
+    Each key is routed with its hash slot to one of the replicas
+    of the primary shard holding it, so that reads do not load the
+    primaries. The replica is chosen with `rank`, which spreads the
+    reads of readers with different ranks over all replicas of a
+    shard. Keys of shards without replicas are read from the primary.
+
+    The slot map is reloaded when a node redirects a read or cannot
+    be reached, e.g. after a failover or a slot migration.
+
+    :param address: Address of a shard of the database as <ip_address>:<port>
+    :type address: str
+    :param rank: Rank of the reader, defaults to 0
+    :type rank: int, optional
+    """
+
+    def __init__(self, address, rank=0):
+        host, port = address.rsplit(":", 1)
+        self.rank = rank
+        self.primaries = [(host, int(port))]
+        self.clients = {}
+        self._load_slots()
+
+    def _load_slots(self):
+        """Map the hash slots of the database to the nodes to read from
+
+        The map is read from the first known primary that answers.
+        """
+        error = None
+        for host, port in self.primaries:
+            client = redis.Redis(host=host, port=port)
+            try:
+                slots = client.execute_command("CLUSTER", "SLOTS")
+                break
+            except (redis.ConnectionError, redis.TimeoutError) as e:
+                error = e
+            finally:
+                client.close()
+        else:
+            raise error
+
+        for client in self.clients.values():
+            client.connection_pool.disconnect()
+        self.clients = {}
+        self.first_slots = []
+        self.nodes = []
+        self.primaries = []
+        for first_slot, _, primary, *replicas in sorted(slots):
+            node = replicas[self.rank % len(replicas)] if replicas else primary
+            self.first_slots.append(first_slot)
+            self.nodes.append((_to_str(node[0]), int(node[1])))
+            self.primaries.append((_to_str(primary[0]), int(primary[1])))
+
+    def tensor_exists(self, key):
+        """Check if a tensor exists
+
+        :param key: database key of the tensor
+        :type key: str
+        :return: Whether the tensor exists
+        :rtype: bool
+        """
+        return bool(self._execute(key, "EXISTS", key))
+
+    def get_tensor(self, key):
+        """Get a tensor from a replica
+
+        :param key: database key of the tensor
+        :type key: str
+        :return: tensor data
+        :rtype: np.array
+        """
+        reply = self._execute(key, "AI.TENSORGET", key, "META", "BLOB")
+        fields = dict(zip(map(_to_str, reply[::2]), reply[1::2]))
+        dtype = TENSOR_DTYPES[_to_str(fields["dtype"])]
+        # copy the data, as arrays backed by the reply are read-only
+        data = np.frombuffer(fields["blob"], dtype=dtype).copy()
+        return data.reshape(fields["shape"])
+
+    def _execute(self, key, *args):
+        """Run a command on the node to read a key from
+
+        After a redirection (``MOVED`` or ``ASK``) or a connection
+        error, the slot map is reloaded and the command retried once.
+        """
+        try:
+            return self._get_client(key).execute_command(*args)
+        except (AskError, redis.ConnectionError, redis.TimeoutError) as e:
+            logger.debug(f"Reloading the slot map of the database: {e}")
+            self._load_slots()
+            return self._get_client(key).execute_command(*args)
+
+    def _get_client(self, key):
+        node = self.nodes[bisect_right(self.first_slots, get_keyslot(key)) - 1]
+        if node not in self.clients:
+            # connections to replicas have to be set to READONLY
+            pool = redis.ConnectionPool(
+                connection_class=ClusterConnection,
+                host=node[0],
+                port=node[1],
+                readonly=True,
+            )
+            self.clients[node] = redis.Redis(connection_pool=pool)
+        return self.clients[node]
+
+
+def get_keyslot(key):
+    """Compute the hash slot of a key in a clustered database
+
+    :param key: database key
+    :type key: str
+    :return: hash slot
+    :rtype: int
+    """
+    key = key.encode("utf-8")
+    # only the hash tag of a key is hashed, if it has one
+    start = key.find(b"{")
+    if start > -1:
+        end = key.find(b"}", start + 1)
+        if end > start + 1:
+            key = key[start + 1 : end]
+    return crc16(key) % CLUSTER_SLOTS
+
+
+def _to_str(value):
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
+
+
 class TrainingDataUploader:
     """A class to simplify uploading batches of samples to train a model.
 
@@ -204,6 +374,9 @@ class StaticDataDownloader:
     :type verbose: bool
     :param init_samples: whether samples should be initialized in the constructor
     :type init_samples: bool
+    :param read_from_replicas: whether samples and targets should be read from the
+                               replicas of the Orchestrator shards, see ``ReplicaReader``
+    :type read_from_replicas: bool
     """
 
     def __init__(
@@ -223,12 +396,16 @@ class StaticDataDownloader:
         num_replicas=1,
         verbose=False,
         init_samples=True,
+        read_from_replicas=False,
         **kwargs,
     ):
         self.replica_rank = replica_rank
         self.num_replicas = num_replicas
         self.address = address
         self.cluster = cluster
+        self.read_from_replicas = read_from_replicas
+        self.replica_reader = None
+        self.data_source = None
         self.uploader_info = uploader_info
         self.uploader_name = uploader_name
         self.verbose = verbose
@@ -324,6 +501,9 @@ class StaticDataDownloader:
         :raises ValueError: If self.uploader_info is not set to `auto` or `manual`.
         """
         self.client = Client(self.address, self.cluster)
+        if self.read_from_replicas and self.cluster:
+            address = self.address or environ["SSDB"].split(",")[0]
+            self.replica_reader = ReplicaReader(address, self.replica_rank)
         if self.uploader_info == "auto":
             if not self.uploader_name:
                 raise ValueError(
@@ -399,27 +579,37 @@ class StaticDataDownloader:
         if self.shuffle:
             np.random.shuffle(self.indices)
 
+    def _set_data_source(self, entity):
+        self.client.set_data_source(entity)
+        self.data_source = entity
+
+    def _tensor_exists(self, name):
+        if self.replica_reader:
+            return self.replica_reader.tensor_exists(form_key(self.data_source, name))
+        return self.client.tensor_exists(name)
+
+    def _get_tensor(self, name):
+        if self.replica_reader:
+            return self.replica_reader.get_tensor(form_key(self.data_source, name))
+        return self.client.get_tensor(name)
+
     def _data_exists(self, batch_name, target_name):
 
         if self.need_targets:
-            return self.client.tensor_exists(batch_name) and self.client.tensor_exists(
-                target_name
-            )
+            return self._tensor_exists(batch_name) and self._tensor_exists(target_name)
         else:
-            return self.client.tensor_exists(batch_name)
+            return self._tensor_exists(batch_name)
 
     def _add_samples(self, batch_name, target_name):
         if self.samples is None:
-            self.samples = self.client.get_tensor(batch_name)
+            self.samples = self._get_tensor(batch_name)
             if self.need_targets:
-                self.targets = self.client.get_tensor(target_name)
+                self.targets = self._get_tensor(target_name)
         else:
-            self.samples = np.concatenate(
-                (self.samples, self.client.get_tensor(batch_name))
-            )
+            self.samples = np.concatenate((self.samples, self._get_tensor(batch_name)))
             if self.need_targets:
                 self.targets = np.concatenate(
-                    (self.targets, self.client.get_tensor(target_name))
+                    (self.targets, self._get_tensor(target_name))
                 )
 
         self.num_samples = self.samples.shape[0]
@@ -499,7 +689,7 @@ class StaticDataDownloader:
         for source in self.sources:
             entity = source[0]
             sub_index = source[1]
-            self.client.set_data_source(entity)
+            self._set_data_source(entity)
             batch_name = form_name(self.sample_prefix, sub_index)
             if self.need_targets:
                 target_name = form_name(self.target_prefix, sub_index)
@@ -624,6 +814,9 @@ class DynamicDataDownloader(StaticDataDownloader):
     :type verbose: bool
     :param init_samples: whether samples should be initialized in the constructor
     :type init_samples: bool
+    :param read_from_replicas: whether samples and targets should be read from the
+                               replicas of the Orchestrator shards, see ``ReplicaReader``
+    :type read_from_replicas: bool
     """
 
     def __init__(self, **kwargs):
@@ -641,7 +834,7 @@ class DynamicDataDownloader(StaticDataDownloader):
             entity = source[0]
             sub_index = source[1]
             index = source[2]
-            self.client.set_data_source(entity)
+            self._set_data_source(entity)
             batch_name = form_name(self.sample_prefix, index, sub_index)
             if self.need_targets:
                 target_name = form_name(self.target_prefix, index, sub_index)
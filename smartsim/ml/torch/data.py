@@ -21,16 +21,16 @@ class StaticDataGenerator(StaticDataDownloader, torch.utils.data.IterableDataset
 
     def _add_samples(self, batch_name, target_name):
         if self.samples is None:
-            self.samples = torch.tensor(self.client.get_tensor(batch_name))
+            self.samples = torch.tensor(self._get_tensor(batch_name))
             if self.need_targets:
-                self.targets = torch.tensor(self.client.get_tensor(target_name))
+                self.targets = torch.tensor(self._get_tensor(target_name))
         else:
             self.samples = torch.cat(
-                (self.samples, torch.tensor(self.client.get_tensor(batch_name)))
+                (self.samples, torch.tensor(self._get_tensor(batch_name)))
             )
             if self.need_targets:
                 self.targets = torch.cat(
-                    (self.targets, torch.tensor(self.client.get_tensor(target_name)))
+                    (self.targets, torch.tensor(self._get_tensor(target_name)))
                 )
 
         self.num_samples = self.samples.shape[0]
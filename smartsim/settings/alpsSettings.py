@@ -103,6 +103,14 @@ class AprunSettings(RunSettings):
         """
         self.run_args["pes-per-node"] = int(tasks_per_node)
 
+    def get_resource_request(self):
+        """Get the number of nodes and tasks requested by these settings
+
+        :return: number of nodes and tasks, None where not requested
+        :rtype: tuple[int | None, int | None]
+        """
+        return self._get_resource_request(None, "pes", "pes-per-node")
+
     def set_hostlist(self, host_list):
         """Specify the hostlist for this job
 
@@ -511,6 +511,46 @@ class RunSettings:
             formatted.append(str(value))
         return formatted
 
+    def get_resource_request(self):
+        """Get the number of nodes and tasks requested by these settings
+
+        Used to pack the members of a batch into its allocation.
+        ``RunSettings`` do not request any resources.
+
+        :return: number of nodes and tasks, None where not requested
+        :rtype: tuple[int | None, int | None]
+        """
+        return None, None
+
+    def _get_resource_request(self, nodes_arg, tasks_arg, tasks_per_node_arg):
+        """Get the number of nodes and tasks requested by run arguments
+
+        The number of nodes is derived from the tasks and tasks per
+        node if not requested.
+
+        :param nodes_arg: run argument of the number of nodes
+        :type nodes_arg: str | None
+        :param tasks_arg: run argument of the number of tasks
+        :type tasks_arg: str
+        :param tasks_per_node_arg: run argument of the tasks per node
+        :type tasks_per_node_arg: str
+        :return: number of nodes and tasks, None where not requested
+        :rtype: tuple[int | None, int | None]
+        """
+
+        def get_int(arg):
+            try:
+                return int(self.run_args[arg])
+            except (KeyError, TypeError, ValueError):
+                return None
+
+        nodes = get_int(nodes_arg) if nodes_arg else None
+        tasks = get_int(tasks_arg)
+        tasks_per_node = get_int(tasks_per_node_arg)
+        if nodes is None and tasks and tasks_per_node:
+            nodes = -(-tasks // tasks_per_node)
+        return nodes, tasks
+
     def format_env_vars(self):
         """Build environment variable string
 
@@ -542,6 +582,11 @@ class BatchSettings:
         self._batch_cmd = batch_cmd
         self.batch_args = init_default({}, batch_args, dict)
         self._preamble = []
+        self.array = False
+        self.array_max_concurrent = None
+        self.packed = False
+        self.packed_nodes = None
+        self.packed_tasks_per_node = None
         self.set_nodes(kwargs.get("nodes", None))
         self.set_walltime(kwargs.get("time", None))
         self.set_queue(kwargs.get("queue", None))
@@ -581,6 +626,47 @@ class BatchSettings:
     def format_batch_args(self):
         raise NotImplementedError
 
+    def set_array(self, max_concurrent=None):
+        """Launch the members of a batch ensemble as a job array
+
+        Every member becomes a task of a single array job instead of
+        a backgrounded command of one batch script. The batch arguments,
+        e.g. the number of nodes, then apply to each array task.
+
+        :param max_concurrent: maximum number of array tasks running
+                               at once, defaults to None (no limit)
+        :type max_concurrent: int, optional
+        """
+        self.array = True
+        self.array_max_concurrent = int(max_concurrent) if max_concurrent else None
+
+    def format_array(self, num_tasks):
+        raise NotImplementedError
+
+    def set_packing(self, nodes=None, tasks_per_node=None):
+        """Pack the members of a batch ensemble into the allocation
+
+        Instead of starting every member at once, a worker inside
+        the allocation starts members on free nodes as earlier ones
+        finish. The nodes and tasks requested by the run settings
+        of each member (e.g. ``set_nodes`` and ``set_tasks``) decide
+        how much of the allocation a member takes. Members that
+        request neither take a whole node.
+
+        The status of each member is written to ``<member>.status``
+        in the directory of the member.
+
+        :param nodes: number of nodes to pack members on,
+                      defaults to None (nodes of the allocation)
+        :type nodes: int, optional
+        :param tasks_per_node: tasks that fit on a node,
+                               defaults to None (read from the allocation)
+        :type tasks_per_node: int, optional
+        """
+        self.packed = True
+        self.packed_nodes = int(nodes) if nodes else None
+        self.packed_tasks_per_node = int(tasks_per_node) if tasks_per_node else None
+
     def set_batch_command(self, command):
         """Set the command used to launch the batch e.g. ``sbatch``
 
@@ -24,6 +24,7 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from ..error import SSUnsupportedError
 from .base import BatchSettings
 
 
@@ -130,6 +131,9 @@ class CobaltBatchSettings(BatchSettings):
         if account:
             self.batch_args["project"] = account
 
+    def set_array(self, max_concurrent=None):
+        raise SSUnsupportedError("Cobalt does not support job arrays")
+
     def format_batch_args(self):
         """Get the formatted batch arguments for a preview
 
@@ -149,6 +149,19 @@ class JsrunSettings(RunSettings):
         """
         self.set_tasks_per_rs(tasks_per_node)
 
+    def get_resource_request(self):
+        """Get the number of nodes and tasks requested by these settings
+
+        The number of nodes is derived from the resource sets and
+        resource sets per host.
+
+        :return: number of nodes and tasks, None where not requested
+        :rtype: tuple[int | None, int | None]
+        """
+        nodes, _ = self._get_resource_request(None, "nrs", "rs_per_host")
+        _, tasks = self._get_resource_request(None, "np", None)
+        return nodes, tasks
+
     def set_cpus_per_task(self, cpus_per_task):
         """Set the number of cpus per tasks.
 
@@ -526,6 +539,19 @@ class BsubBatchSettings(BatchSettings):
         if queue:
             self.batch_args["q"] = queue
 
+    def format_array(self, num_tasks):
+        """Get the job array directive for a number of array tasks
+
+        :param num_tasks: number of array tasks
+        :type num_tasks: int
+        :return: job name suffix e.g. ``[1-10]%2``, LSF array indices start at 1
+        :rtype: str
+        """
+        array = f"[1-{num_tasks}]"
+        if self.array_max_concurrent:
+            array += f"%{self.array_max_concurrent}"
+        return array
+
     def _format_alloc_flags(self):
         """Format ``alloc_flags`` checking if user already
         set it. Currently only adds SMT flag if missing
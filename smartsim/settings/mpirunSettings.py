@@ -119,6 +119,14 @@ class _OpenMPISettings(RunSettings):
         """
         self.run_args["npernode"] = int(tasks_per_node)
 
+    def get_resource_request(self):
+        """Get the number of nodes and tasks requested by these settings
+
+        :return: number of nodes and tasks, None where not requested
+        :rtype: tuple[int | None, int | None]
+        """
+        return self._get_resource_request(None, "n", "npernode")
+
     def set_tasks(self, tasks):
         """Set the number of tasks for this job
 
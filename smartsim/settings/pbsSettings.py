@@ -168,6 +168,19 @@ class QsubBatchSettings(BatchSettings):
         # TODO include option to overwrite place (warning for orchestrator?)
         self.resources[resource_name] = value
 
+    def format_array(self, num_tasks):
+        """Get the job array directive for a number of array tasks
+
+        :param num_tasks: number of array tasks
+        :type num_tasks: int
+        :return: qsub option e.g. ``-J 0-9%2``
+        :rtype: str
+        """
+        array = f"-J 0-{num_tasks - 1}"
+        if self.array_max_concurrent:
+            array += f"%{self.array_max_concurrent}"
+        return array
+
     def format_batch_args(self):
         """Get the formatted batch arguments for a preview
 
@@ -167,6 +167,14 @@ class SrunSettings(RunSettings):
         """
         self.run_args["ntasks-per-node"] = int(tasks_per_node)
 
+    def get_resource_request(self):
+        """Get the number of nodes and tasks requested by these settings
+
+        :return: number of nodes and tasks, None where not requested
+        :rtype: tuple[int | None, int | None]
+        """
+        return self._get_resource_request("nodes", "ntasks", "ntasks-per-node")
+
     def set_cpu_bindings(self, bindings):
         """Bind by setting CPU masks on tasks
 
@@ -414,6 +422,19 @@ class SbatchSettings(BatchSettings):
             raise TypeError("host_list argument must be list of strings")
         self.batch_args["nodelist"] = ",".join(host_list)
 
+    def format_array(self, num_tasks):
+        """Get the job array directive for a number of array tasks
+
+        :param num_tasks: number of array tasks
+        :type num_tasks: int
+        :return: sbatch option e.g. ``--array=0-9%2``
+        :rtype: str
+        """
+        array = f"--array=0-{num_tasks - 1}"
+        if self.array_max_concurrent:
+            array += f"%{self.array_max_concurrent}"
+        return array
+
     def format_batch_args(self):
         """Get the formatted batch arguments for a preview
 
@@ -32,6 +32,7 @@ STATUS_CANCELLED = "Cancelled"
 STATUS_FAILED = "Failed"
 STATUS_NEW = "New"
 STATUS_PAUSED = "Paused"
+STATUS_PENDING = "Pending"
 
 # SmartSim status mapping
 SMARTSIM_STATUS = {
@@ -41,8 +42,13 @@ SMARTSIM_STATUS = {
     "Cancelled": STATUS_CANCELLED,
     "Failed": STATUS_FAILED,
     "New": STATUS_NEW,
+    "Pending": STATUS_PENDING,
 }
 
 # Status groupings
 TERMINAL_STATUSES = {STATUS_CANCELLED, STATUS_COMPLETED, STATUS_FAILED}
-LIVE_STATUSES = {STATUS_RUNNING, STATUS_PAUSED, STATUS_NEW}
+LIVE_STATUSES = {STATUS_RUNNING, STATUS_PAUSED, STATUS_NEW, STATUS_PENDING}
+
+# Conditions for waiting on launched entities
+FIRST_COMPLETED = "FIRST_COMPLETED"
+ALL_COMPLETED = "ALL_COMPLETED"
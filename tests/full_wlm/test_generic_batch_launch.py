@@ -63,3 +63,29 @@ def test_batch_ensemble_replicas(fileutils, wlmutils):
     exp.start(ensemble, block=True)
     statuses = exp.get_status(ensemble)
     assert all([stat == status.STATUS_COMPLETED for stat in statuses])
+
+
+def test_batch_ensemble_array(fileutils, wlmutils):
+    if wlmutils.get_test_launcher() == "cobalt":
+        pytest.skip("Cobalt does not support job arrays")
+
+    exp_name = "test-batch-ensemble-array"
+    exp = Experiment(exp_name, launcher=wlmutils.get_test_launcher())
+    test_dir = fileutils.make_test_dir()
+
+    script = fileutils.get_test_conf_path("sleep.py")
+    settings = wlmutils.get_run_settings("python", f"{script} --time=5")
+
+    batch = exp.create_batch_settings(nodes=1, time="00:01:00")
+    if wlmutils.get_test_launcher() == "lsf":
+        batch.set_account(wlmutils.get_test_account())
+    batch.set_array(max_concurrent=2)
+    ensemble = exp.create_ensemble(
+        "batch-ens-array", batch_settings=batch, run_settings=settings, replicas=4
+    )
+    ensemble.set_path(test_dir)
+
+    exp.start(ensemble, block=True)
+    statuses = exp.get_status(ensemble)
+    assert len(statuses) == 4
+    assert all([stat == status.STATUS_COMPLETED for stat in statuses])
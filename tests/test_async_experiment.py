@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+from smartsim import AsyncExperiment, Experiment, status
+
+"""
+Test driving an Experiment from an asyncio event loop
+"""
+
+
+def test_async_start_wait(fileutils):
+    exp_name = "test-async-start-wait"
+    exp = Experiment(exp_name, launcher="local")
+    aexp = AsyncExperiment(exp)
+    test_dir = fileutils.make_test_dir()
+
+    script = fileutils.get_test_conf_path("sleep.py")
+    fast = exp.create_model(
+        "fast", exp.create_run_settings("python", f"{script} --time=1")
+    )
+    slow = exp.create_model(
+        "slow", exp.create_run_settings("python", f"{script} --time=3")
+    )
+    fast.set_path(test_dir)
+    slow.set_path(test_dir)
+
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.1)
+
+    async def workflow():
+        tick_task = asyncio.ensure_future(ticker())
+        await asyncio.gather(aexp.start(fast), aexp.start(slow))
+        first = await aexp.wait(fast, slow, return_when=status.FIRST_COMPLETED)
+        both = await aexp.wait(fast, slow)
+        tick_task.cancel()
+        return first, both
+
+    (done, not_done), (all_done, none_left) = asyncio.run(workflow())
+    assert done == [fast]
+    assert not_done == [slow]
+    assert not none_left
+    assert asyncio.run(aexp.get_status(fast, slow)) == [status.STATUS_COMPLETED] * 2
+    assert asyncio.run(aexp.finished(fast))
+
+    # the event loop kept running while the models were launched and waited on
+    assert len(ticks) > 10
+
+
+def test_async_wait_timeout_and_stop(fileutils):
+    exp_name = "test-async-wait-timeout"
+    exp = Experiment(exp_name, launcher="local")
+    aexp = AsyncExperiment(exp)
+    test_dir = fileutils.make_test_dir()
+
+    script = fileutils.get_test_conf_path("sleep.py")
+    settings = exp.create_run_settings("python", f"{script} --time=10")
+    model = exp.create_model("model", settings)
+    model.set_path(test_dir)
+
+    async def workflow():
+        await aexp.start(model)
+        done, not_done = await aexp.wait(model, timeout=0.5)
+        await aexp.stop(model)
+        return done, not_done, await aexp.wait(model, timeout=5)
+
+    start = time.time()
+    done, not_done, (stopped, _) = asyncio.run(workflow())
+    assert time.time() - start < 5
+    assert not done
+    assert not_done == [model]
+    assert stopped == [model]
+    assert exp.get_status(model) == [status.STATUS_CANCELLED]
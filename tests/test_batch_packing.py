@@ -0,0 +1,263 @@
+import json
+import os
+import subprocess
+
+import pytest
+
+import smartsim
+from smartsim._core.control import Controller
+from smartsim._core.entrypoints import packer
+from smartsim._core.launcher.step import LocalStep, SbatchStep
+from smartsim._core.launcher.util.packing import Packer, read_status, write_status
+from smartsim.entity import Ensemble
+from smartsim.error import SSUnsupportedError
+from smartsim.settings import (
+    AprunSettings,
+    JsrunSettings,
+    MpirunSettings,
+    RunSettings,
+    SbatchSettings,
+    SrunSettings,
+)
+from smartsim.status import (
+    STATUS_CANCELLED,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_NEW,
+    STATUS_RUNNING,
+)
+
+
+def _task(test_dir, name, cmd, nodes=None, tasks=None):
+    return {
+        "name": name,
+        "cmd": cmd,
+        "cwd": test_dir,
+        "nodes": nodes,
+        "tasks": tasks,
+        "status_file": os.path.join(test_dir, f"{name}.status"),
+    }
+
+
+def _max_concurrent(log_file):
+    running = max_running = 0
+    with open(log_file) as f:
+        for line in f:
+            running += 1 if line.strip() == "start" else -1
+            max_running = max(max_running, running)
+    return max_running
+
+
+def test_packer_fills_allocation(fileutils):
+    test_dir = fileutils.make_test_dir()
+    log_file = os.path.join(test_dir, "log")
+    cmd = f"echo start >> {log_file}; sleep 0.2; echo end >> {log_file}"
+    tasks = [_task(test_dir, f"task_{i}", cmd) for i in range(5)]
+
+    packer = Packer(tasks, nodes=2, interval=0.01)
+    assert packer.run() == 0
+    assert _max_concurrent(log_file) == 2
+    for task in tasks:
+        assert read_status(task["status_file"]) == (STATUS_COMPLETED, 0)
+
+
+def test_packer_backfills(fileutils):
+    test_dir = fileutils.make_test_dir()
+    log_file = os.path.join(test_dir, "log")
+    cmd = f"echo start >> {log_file}; sleep 0.2; echo end >> {log_file}"
+    # the second task waits for the whole allocation, the third fits beside the first
+    tasks = [
+        _task(test_dir, "small_0", cmd, nodes=1),
+        _task(test_dir, "large", "true", nodes=4),
+        _task(test_dir, "small_1", cmd, nodes=1),
+    ]
+    packer = Packer(tasks, nodes=4, interval=0.01)
+    assert packer.run() == 0
+    assert _max_concurrent(log_file) == 2
+
+
+def test_packer_failed_task(fileutils):
+    test_dir = fileutils.make_test_dir()
+    tasks = [_task(test_dir, "ok", "true"), _task(test_dir, "bad", "exit 3")]
+
+    packer = Packer(tasks, nodes=2, interval=0.01)
+    assert packer.run() == 1
+    assert read_status(tasks[0]["status_file"]) == (STATUS_COMPLETED, 0)
+    assert read_status(tasks[1]["status_file"]) == (STATUS_FAILED, 3)
+
+
+def test_packer_stop(fileutils):
+    test_dir = fileutils.make_test_dir()
+    tasks = [_task(test_dir, f"task_{i}", "sleep 10") for i in range(2)]
+
+    packer = Packer(tasks, nodes=1)
+    packer._queue = [tasks[1]]
+    proc = packer._start(tasks[0])
+    packer._running[proc] = (tasks[0], 1)
+    assert read_status(tasks[0]["status_file"]) == (STATUS_RUNNING, None)
+
+    packer.stop()
+    assert proc.wait(timeout=5) != 0
+    for task in tasks:
+        assert read_status(task["status_file"]) == (STATUS_CANCELLED, None)
+
+
+@pytest.mark.parametrize(
+    "task, tasks_per_node, slots",
+    [
+        pytest.param({"nodes": 2}, None, 2, id="nodes"),
+        pytest.param({"nodes": 2}, 4, 8, id="nodes with tasks per node"),
+        pytest.param({"tasks": 3}, 4, 3, id="tasks"),
+        pytest.param({"tasks": 3}, None, 1, id="tasks without tasks per node"),
+        pytest.param({}, 4, 4, id="no request"),
+        pytest.param({"nodes": 16}, None, 4, id="larger than allocation"),
+    ],
+)
+def test_packer_slots(task, tasks_per_node, slots):
+    packer = Packer([], nodes=4, tasks_per_node=tasks_per_node)
+    task["name"] = "task"
+    assert packer.get_slots(task) == slots
+
+
+def test_read_status(fileutils):
+    test_dir = fileutils.make_test_dir()
+    status_file = os.path.join(test_dir, "task.status")
+    assert read_status(status_file) is None
+    write_status(status_file, STATUS_FAILED, 1)
+    assert read_status(status_file) == (STATUS_FAILED, 1)
+
+
+def _settings(settings, **run_args):
+    settings.run_args.update(run_args)
+    return settings
+
+
+@pytest.mark.parametrize(
+    "settings, request_",
+    [
+        pytest.param(RunSettings("echo"), (None, None), id="base"),
+        pytest.param(_settings(SrunSettings("echo"), nodes=2), (2, None), id="srun"),
+        pytest.param(
+            _settings(SrunSettings("echo"), ntasks=6, **{"ntasks-per-node": 4}),
+            (2, 6),
+            id="srun tasks",
+        ),
+        pytest.param(
+            _settings(MpirunSettings("echo"), n=8, npernode=4), (2, 8), id="mpirun"
+        ),
+        pytest.param(_settings(AprunSettings("echo"), pes=3), (None, 3), id="aprun"),
+        pytest.param(
+            _settings(JsrunSettings("echo"), nrs=4, rs_per_host=2, np=8),
+            (2, 8),
+            id="jsrun",
+        ),
+    ],
+)
+def test_resource_request(settings, request_):
+    assert settings.get_resource_request() == request_
+
+
+@pytest.mark.parametrize(
+    "env, allocation",
+    [
+        pytest.param(
+            {"SLURM_JOB_NUM_NODES": "2", "SLURM_JOB_CPUS_PER_NODE": "36(x2)"},
+            (2, 36),
+            id="slurm",
+        ),
+        pytest.param({"LSB_MCPU_HOSTS": "batch1 1 n1 42 n2 42"}, (2, 42), id="lsf"),
+        pytest.param({"COBALT_PARTSIZE": "8"}, (8, None), id="cobalt"),
+        pytest.param({}, (None, None), id="unknown"),
+    ],
+)
+def test_get_allocation(monkeypatch, env, allocation):
+    for var in ["SLURM_JOB_NUM_NODES", "PBS_NODEFILE", "LSB_MCPU_HOSTS"]:
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.delenv("COBALT_PARTSIZE", raising=False)
+    for var, value in env.items():
+        monkeypatch.setenv(var, value)
+    assert packer.get_allocation() == allocation
+
+
+def test_get_allocation_pbs(fileutils, monkeypatch):
+    test_dir = fileutils.make_test_dir()
+    node_file = os.path.join(test_dir, "nodefile")
+    with open(node_file, "w") as f:
+        f.write("n1\nn1\nn2\nn2\n")
+    monkeypatch.delenv("SLURM_JOB_NUM_NODES", raising=False)
+    monkeypatch.setenv("PBS_NODEFILE", node_file)
+    assert packer.get_allocation() == (2, 2)
+
+
+def _create_packed_step(test_dir, members=3):
+    settings = SbatchSettings()
+    settings.set_packing(nodes=2)
+    batch_step = SbatchStep("ens", test_dir, settings)
+    for i in range(members):
+        member_dir = os.path.join(test_dir, f"ens_{i}")
+        os.makedirs(member_dir, exist_ok=True)
+        step = LocalStep(f"ens_{i}", member_dir, RunSettings("echo", [f"member_{i}"]))
+        batch_step.add_to_batch(step)
+    return batch_step
+
+
+def test_packed_script(fileutils):
+    test_dir = fileutils.make_test_dir()
+    batch_step = _create_packed_step(test_dir)
+    script = batch_step.get_launch_cmd()[-1]
+
+    with open(script) as f:
+        assert "smartsim._core.entrypoints.packer" in f.read()
+    with open(batch_step.get_step_file(ending=".tasks.json")) as f:
+        tasks = json.load(f)
+    assert [task["name"] for task in tasks] == ["ens_0", "ens_1", "ens_2"]
+
+    # the worker runs smartsim from the interpreter of the driver
+    smartsim_dir = os.path.dirname(os.path.dirname(smartsim.__file__))
+    env = dict(os.environ, PYTHONPATH=smartsim_dir)
+    out = subprocess.check_output(["bash", script], cwd=test_dir, env=env)
+    assert sorted(out.decode().split()) == ["member_0", "member_1", "member_2"]
+    for task in tasks:
+        assert read_status(task["status_file"]) == (STATUS_COMPLETED, 0)
+
+
+def test_packed_statuses(fileutils, monkeypatch):
+    test_dir = fileutils.make_test_dir()
+    controller = Controller(launcher="local")
+    settings = SbatchSettings()
+    settings.set_packing()
+    ensemble = Ensemble(
+        "ens", {}, batch_settings=settings, run_settings=RunSettings("echo"), replicas=3
+    )
+    ensemble.set_path(test_dir)
+    assert ensemble.packed
+
+    models = ensemble.entities
+    write_status(os.path.join(test_dir, f"{models[0].name}.status"), STATUS_COMPLETED)
+    write_status(os.path.join(test_dir, f"{models[1].name}.status"), STATUS_RUNNING)
+
+    monkeypatch.setattr(controller, "get_entity_status", lambda _: STATUS_RUNNING)
+    assert controller.get_entity_list_status(ensemble) == [
+        STATUS_COMPLETED,
+        STATUS_RUNNING,
+        STATUS_NEW,
+    ]
+
+    monkeypatch.setattr(controller, "get_entity_status", lambda _: STATUS_CANCELLED)
+    assert controller.get_entity_list_status(ensemble) == [
+        STATUS_COMPLETED,
+        STATUS_CANCELLED,
+        STATUS_CANCELLED,
+    ]
+
+
+def test_packed_array_unsupported():
+    controller = Controller(launcher="local")
+    settings = SbatchSettings()
+    settings.set_array()
+    settings.set_packing()
+    ensemble = Ensemble(
+        "ens", {}, batch_settings=settings, run_settings=RunSettings("echo"), replicas=2
+    )
+    with pytest.raises(SSUnsupportedError):
+        controller._create_batch_job_step(ensemble)
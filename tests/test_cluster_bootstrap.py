@@ -0,0 +1,127 @@
+import shutil
+import subprocess
+
+import pytest
+import redis
+
+from smartsim._core.config import CONFIG
+from smartsim._core.utils.redis import (
+    CLUSTER_SLOTS,
+    _get_slot_ranges,
+    check_cluster_status,
+    create_cluster,
+    get_cluster_layout,
+)
+
+
+def find_redis_server():
+    try:
+        return CONFIG.database_exe
+    except Exception:
+        return shutil.which("redis-server")
+
+
+def test_slot_ranges():
+    for num_shards in (1, 3, 7, 64):
+        ranges = _get_slot_ranges(num_shards)
+        assert len(ranges) == num_shards
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == CLUSTER_SLOTS - 1
+        for (_, last), (first, _) in zip(ranges, ranges[1:]):
+            assert first == last + 1
+        sizes = [last - first + 1 for first, last in ranges]
+        assert max(sizes) - min(sizes) <= 1
+
+
+def test_cluster_layout():
+    layout = get_cluster_layout(["host0"], [6379, 6380, 6381])
+    assert layout == [(("host0", port), []) for port in (6379, 6380, 6381)]
+
+    for num_hosts, ports, replicas in ((3, 2, 1), (2, 3, 1), (4, 3, 2), (6, 1, 1)):
+        hosts = [f"host{i}" for i in range(num_hosts)]
+        ports = list(range(6379, 6379 + ports))
+        layout = get_cluster_layout(hosts, ports, replicas)
+
+        assert len(layout) == len(hosts) * len(ports) // (replicas + 1)
+        shards = [primary for primary, _ in layout]
+        for primary, primary_replicas in layout:
+            assert len(primary_replicas) == replicas
+            shards.extend(primary_replicas)
+            # replicas are on distinct nodes from their primary
+            shard_hosts = [primary[0]] + [replica[0] for replica in primary_replicas]
+            assert len(set(shard_hosts)) == len(shard_hosts)
+        assert sorted(shards) == sorted((h, p) for h in hosts for p in ports)
+
+
+def launch_shards(test_dir, ports):
+    return [
+        subprocess.Popen(
+            [find_redis_server(), "--port", str(port), "--bind", "127.0.0.1"]
+            + ["--cluster-enabled", "yes"]
+            + ["--cluster-config-file", f"nodes-{port}.conf"]
+            + ["--save", "", "--appendonly", "no"],
+            cwd=test_dir,
+            stdout=subprocess.DEVNULL,
+        )
+        for port in ports
+    ]
+
+
+def get_cluster_info(port):
+    client = redis.Redis(host="127.0.0.1", port=port)
+    try:
+        info = client.execute_command("CLUSTER", "INFO")
+    finally:
+        client.close()
+    if isinstance(info, bytes):
+        info = info.decode("utf-8")
+    return info.split()
+
+
+@pytest.mark.skipif(not find_redis_server(), reason="redis-server not found")
+def test_create_cluster(fileutils, wlmutils, dbutils):
+    test_dir = fileutils.make_test_dir()
+    ports = [wlmutils.get_test_port() + i for i in range(3)]
+    procs = launch_shards(test_dir, ports)
+    try:
+        dbutils.wait_for_shards(procs, ports)
+
+        create_cluster(["127.0.0.1"], ports)
+        check_cluster_status(["127.0.0.1"], ports)
+
+        info = get_cluster_info(ports[0])
+        assert "cluster_known_nodes:3" in info
+        assert f"cluster_slots_assigned:{CLUSTER_SLOTS}" in info
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
+
+
+@pytest.mark.skipif(not find_redis_server(), reason="redis-server not found")
+def test_create_cluster_replicas(fileutils, wlmutils, dbutils):
+    test_dir = fileutils.make_test_dir()
+    ports = [wlmutils.get_test_port() + i for i in range(6)]
+    procs = launch_shards(test_dir, ports)
+    try:
+        dbutils.wait_for_shards(procs, ports)
+
+        create_cluster(["127.0.0.1"], ports, replicas=1)
+        check_cluster_status(["127.0.0.1"], ports, replicas=1)
+
+        info = get_cluster_info(ports[0])
+        assert "cluster_known_nodes:6" in info
+        assert "cluster_size:3" in info
+        assert f"cluster_slots_assigned:{CLUSTER_SLOTS}" in info
+        for primary, replicas in get_cluster_layout(["127.0.0.1"], ports, 1):
+            client = redis.Redis(host="127.0.0.1", port=replicas[0][1])
+            try:
+                role = client.execute_command("ROLE")
+            finally:
+                client.close()
+            assert role[0] in (b"slave", "slave")
+            assert role[2] == primary[1]
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
@@ -13,6 +13,19 @@ def test_parse_step_status():
     assert step_id == "running"
 
 
+def test_parse_step_statuses():
+    output = (
+        "JobName      State \n"
+        "=====================\n"
+        "507975     running \n"
+        "507976     queued \n"
+    )
+    statuses = cobaltParser.parse_cobalt_step_statuses(output)
+    assert statuses["507975"] == "running"
+    assert statuses["507976"] == "queued"
+    assert cobaltParser.parse_cobalt_step_status(output, "507977") == "NOTFOUND"
+
+
 def test_parse_qsub_out():
     output = (
         "Job routed to queue 'debug-flat-quad'.\n"
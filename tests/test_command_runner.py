@@ -0,0 +1,111 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from smartsim._core.launcher.slurm.slurmLauncher import SlurmLauncher
+from smartsim._core.launcher.util import shell
+from smartsim._core.launcher.util.commandRunner import CommandRunner
+from smartsim.error import ShellError
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    runner = CommandRunner()
+    assert runner.start()
+    monkeypatch.setattr(shell, "command_runner", runner)
+    yield runner
+    runner.stop()
+
+
+def test_run(runner, fileutils):
+    test_dir = fileutils.make_test_dir()
+    reply = runner.run(
+        ["bash", "-c", "cat; pwd; echo $RUNNER_TEST >&2"],
+        cwd=test_dir,
+        env={"RUNNER_TEST": "env", "PATH": os.environ["PATH"]},
+        proc_input="input",
+    )
+    assert reply["returncode"] == 0
+    assert reply["out"] == f"input{test_dir}\n"
+    assert reply["err"] == "env\n"
+
+
+def test_execute_cmd(runner):
+    os.environ["RUNNER_TEST"] = "current"
+    try:
+        assert shell.execute_cmd(["bash", "-c", "echo $RUNNER_TEST; exit 3"]) == (
+            3,
+            "current\n",
+            "",
+        )
+    finally:
+        del os.environ["RUNNER_TEST"]
+
+
+def test_concurrent_commands(runner):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(4) as pool:
+        results = list(
+            pool.map(lambda _: shell.execute_cmd(["sleep", "0.5"]), range(4))
+        )
+    assert time.perf_counter() - start < 1.5
+    assert [result[0] for result in results] == [0] * 4
+
+
+def test_errors(runner):
+    with pytest.raises(ShellError):
+        shell.execute_cmd(["sleep", "3"], timeout=0.2)
+    # commands the runner cannot start raise as without it
+    with pytest.raises(FileNotFoundError):
+        shell.execute_cmd(["notexistingcommand"])
+
+
+def test_fallback(runner):
+    runner._proc.kill()
+    runner._proc.wait()
+    assert runner.run(["true"]) is None
+    assert not runner.running
+    assert shell.execute_cmd(["echo", "direct"]) == (0, "direct\n", "")
+
+
+def test_fallback_when_runner_exits(runner, fileutils):
+    test_dir = fileutils.make_test_dir()
+    # kills the runner the first time, runs directly the second time
+    script = "if [ -e ran ]; then echo direct; else touch ran; kill -9 $PPID; fi"
+    assert shell.execute_cmd(["bash", "-c", script], cwd=test_dir) == (
+        0,
+        "direct\n",
+        "",
+    )
+    assert not runner.running
+
+
+def test_malformed_reply():
+    class FakeProc:
+        stdout = [b"not a reply\n"]
+        killed = False
+
+        def kill(self):
+            self.killed = True
+
+    runner = CommandRunner()
+    runner._proc = FakeProc()
+    waiting = [Event(), None]
+    runner._replies[0] = waiting
+
+    runner._read_replies()
+    assert runner._proc.killed
+    assert waiting[0].is_set()
+    assert not runner.running
+    assert runner.run(["true"]) is None
+
+
+def test_started_by_launcher(monkeypatch):
+    monkeypatch.setattr(shell, "command_runner", None)
+    monkeypatch.setenv("SMARTSIM_COMMAND_RUNNER", "1")
+    SlurmLauncher()
+    assert shell.command_runner.running
+    shell.command_runner.stop()
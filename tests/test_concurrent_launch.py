@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+
+from smartsim._core.control import Controller
+from smartsim._core.control.manifest import Manifest
+from smartsim.entity import Ensemble
+from smartsim.error import LauncherError, SmartSimError
+from smartsim.settings import RunSettings
+
+
+class SlowRun:
+    """Replacement of ``launcher.run`` taking ``delay`` seconds"""
+
+    def __init__(self, delay, fail=()):
+        self.delay = delay
+        self.fail = fail
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def __call__(self, step):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if step.entity_name in self.fail:
+            raise LauncherError("launch failed")
+        return step.name
+
+
+def _create_ensemble(test_dir, members):
+    ensemble = Ensemble("ens", {}, run_settings=RunSettings("echo"), replicas=members)
+    ensemble.set_path(test_dir)
+    return ensemble
+
+
+def test_launch_is_bounded(fileutils, monkeypatch):
+    monkeypatch.setenv("SMARTSIM_LAUNCH_WORKERS", "4")
+    test_dir = fileutils.make_test_dir()
+    controller = Controller(launcher="local")
+    run = SlowRun(0.1)
+    monkeypatch.setattr(controller._launcher, "run", run)
+
+    ensemble = _create_ensemble(test_dir, 16)
+    start = time.perf_counter()
+    controller._launch(Manifest(ensemble))
+    elapsed = time.perf_counter() - start
+
+    assert run.max_running == 4
+    assert elapsed < 16 * 0.1
+    # jobs are added to the job manager in launch order
+    assert list(controller._jobs.jobs) == [model.name for model in ensemble]
+
+
+def test_launch_error_names_entity(fileutils, monkeypatch):
+    monkeypatch.setenv("SMARTSIM_LAUNCH_WORKERS", "4")
+    test_dir = fileutils.make_test_dir()
+    controller = Controller(launcher="local")
+    monkeypatch.setattr(controller._launcher, "run", SlowRun(0.01, fail=("ens_2",)))
+
+    ensemble = _create_ensemble(test_dir, 8)
+    with pytest.raises(SmartSimError, match="ens_2"):
+        controller._launch(Manifest(ensemble))
+
+    # launches that succeeded are still monitored
+    assert "ens_0" in controller._jobs.jobs
+    assert "ens_2" not in controller._jobs.jobs
+
+
+def test_sequential_launch(fileutils, monkeypatch):
+    monkeypatch.setenv("SMARTSIM_LAUNCH_WORKERS", "1")
+    test_dir = fileutils.make_test_dir()
+    controller = Controller(launcher="local")
+    run = SlowRun(0.01, fail=("ens_2",))
+    monkeypatch.setattr(controller._launcher, "run", run)
+
+    ensemble = _create_ensemble(test_dir, 8)
+    with pytest.raises(SmartSimError, match="ens_2"):
+        controller._launch(Manifest(ensemble))
+    assert run.max_running == 1
+    assert list(controller._jobs.jobs) == ["ens_0", "ens_1"]
+
+
+def test_launch_workers_capped_by_launcher(fileutils, monkeypatch):
+    monkeypatch.setenv("SMARTSIM_LAUNCH_WORKERS", "4")
+    test_dir = fileutils.make_test_dir()
+    controller = Controller(launcher="local")
+    monkeypatch.setattr(controller._launcher, "max_launch_workers", 1)
+    run = SlowRun(0.01)
+    monkeypatch.setattr(controller._launcher, "run", run)
+
+    ensemble = _create_ensemble(test_dir, 8)
+    controller._launch(Manifest(ensemble))
+    assert run.max_running == 1
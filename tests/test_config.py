@@ -17,6 +17,7 @@ def test_all_config_defaults():
     # these will be changed so we will just run them
     assert config.log_level
     assert config.jm_interval
+    assert not config.command_runner
 
     config.test_interface
     config.test_launcher
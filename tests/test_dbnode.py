@@ -1,8 +1,16 @@
+import os.path as osp
+
 import pytest
 
 from smartsim import Experiment
+from smartsim._core.utils.rendezvous import (
+    get_rendezvous_filename,
+    write_rendezvous_file,
+)
 from smartsim.database import Orchestrator
+from smartsim.entity import DBNode
 from smartsim.error.errors import SmartSimError
+from smartsim.settings import RunSettings
 
 
 def test_parse_db_host_error():
@@ -40,3 +48,24 @@ def test_set_host():
     orc = Orchestrator()
     orc.entities[0].set_host("host")
     assert orc.entities[0]._host == "host"
+
+
+def test_rendezvous_hosts(fileutils):
+    test_dir = fileutils.make_test_dir()
+    dbnode = DBNode("orc", test_dir, RunSettings("python"), [6780], ["orc.out"])
+    dbnode._mpmd = True
+    dbnode._num_shards = 3
+
+    filenames = dbnode._get_rendezvous_filenames()
+    assert filenames == [get_rendezvous_filename(f"orc_{i}", 6780) for i in range(3)]
+
+    hosts = ["10.0.0.1", "10.0.0.2", "10.0.0.2"]
+    for filename, host in zip(filenames[:2], hosts):
+        write_rendezvous_file(osp.join(test_dir, filename), host, 6780, 1)
+    assert dbnode._try_parse_db_hosts() is None
+
+    write_rendezvous_file(osp.join(test_dir, filenames[2]), hosts[2], 6780, 1)
+    assert dbnode.hosts == ["10.0.0.1", "10.0.0.2"]
+
+    dbnode.remove_stale_dbnode_files()
+    assert not any(osp.exists(osp.join(test_dir, name)) for name in filenames)
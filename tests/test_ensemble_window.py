@@ -0,0 +1,175 @@
+from threading import RLock
+
+from smartsim import Experiment, status
+from smartsim._core.control.jobmanager import JobManager
+from smartsim.entity import Model
+from smartsim.error import LauncherError
+from smartsim.settings import RunSettings
+
+"""
+Test launching ensembles with a limit on running members
+"""
+
+
+def _running_counter(exp, ensemble):
+    counts = {"running": 0, "max": 0}
+
+    def count(event):
+        if event.status == status.STATUS_RUNNING:
+            counts["running"] += 1
+            counts["max"] = max(counts["max"], counts["running"])
+        elif event.previous_status == status.STATUS_RUNNING:
+            counts["running"] -= 1
+
+    exp.subscribe(ensemble, callback=count)
+    return counts
+
+
+def test_max_concurrent(fileutils):
+    exp = Experiment("test-max-concurrent", launcher="local")
+    test_dir = fileutils.make_test_dir()
+    settings = exp.create_run_settings("sleep", "0.5")
+    ensemble = exp.create_ensemble(
+        "ensemble", run_settings=settings, replicas=5, max_concurrent=2
+    )
+    ensemble.set_path(test_dir)
+    counts = _running_counter(exp, ensemble)
+
+    exp.start(ensemble, block=False)
+    statuses = exp.get_status(ensemble)
+    assert statuses[2:] == [status.STATUS_PENDING] * 3
+    assert status.STATUS_PENDING not in statuses[:2]
+
+    done, not_done = exp.wait(ensemble, timeout=60)
+    assert not not_done
+    assert all(stat == status.STATUS_COMPLETED for stat in exp.get_status(ensemble))
+    assert counts["max"] == 2
+
+
+def test_max_concurrent_on_start(fileutils):
+    exp = Experiment("test-max-concurrent-start", launcher="local")
+    test_dir = fileutils.make_test_dir()
+    settings = exp.create_run_settings("sleep", "0.2")
+    ensemble = exp.create_ensemble("ensemble", run_settings=settings, replicas=4)
+    ensemble.set_path(test_dir)
+    counts = _running_counter(exp, ensemble)
+
+    exp.start(ensemble, block=False, max_concurrent=1)
+    assert exp.get_status(ensemble).count(status.STATUS_PENDING) == 3
+
+    exp.wait(ensemble, timeout=60)
+    assert all(stat == status.STATUS_COMPLETED for stat in exp.get_status(ensemble))
+    assert counts["max"] == 1
+
+
+def test_stop_pending(fileutils):
+    exp = Experiment("test-stop-pending", launcher="local")
+    test_dir = fileutils.make_test_dir()
+    settings = exp.create_run_settings("sleep", "10")
+    ensemble = exp.create_ensemble(
+        "ensemble", run_settings=settings, replicas=3, max_concurrent=1
+    )
+    ensemble.set_path(test_dir)
+
+    exp.start(ensemble, block=False)
+    exp.stop(ensemble)
+    assert exp.get_status(ensemble) == [status.STATUS_CANCELLED] * 3
+
+    # no member is launched after the running one was stopped
+    done, not_done = exp.wait(ensemble, timeout=5)
+    assert not not_done
+    assert exp.get_status(ensemble) == [status.STATUS_CANCELLED] * 3
+
+
+def test_start_blocks_for_pending(fileutils):
+    exp = Experiment("test-block-pending", launcher="local")
+    test_dir = fileutils.make_test_dir()
+    settings = exp.create_run_settings("sleep", "0.2")
+    ensemble = exp.create_ensemble(
+        "ensemble", run_settings=settings, replicas=3, max_concurrent=1
+    )
+    ensemble.set_path(test_dir)
+
+    exp.start(ensemble, block=True)
+    assert exp.get_status(ensemble) == [status.STATUS_COMPLETED] * 3
+
+
+def test_launching_job_stays_pending():
+    jobs = JobManager(RLock())
+    model = Model("model", {}, "", RunSettings("echo"))
+
+    jobs.add_pending_job(model)
+    job = jobs.take_pending_job(model.name)
+    assert job is not None
+    # the entity is listed as pending until its launched job is added
+    assert model.name in jobs.pending
+    assert jobs.take_pending_job(model.name) is None
+
+    jobs.add_job("model-step", "1", model)
+    assert model.name not in jobs.pending
+    assert model.name in jobs.jobs
+    assert not jobs.cancel_pending_job(model.name)
+
+
+def test_cancel_launching_job():
+    jobs = JobManager(RLock())
+    model = Model("model", {}, "", RunSettings("echo"))
+
+    jobs.add_pending_job(model)
+    job = jobs.take_pending_job(model.name)
+    assert jobs.cancel_pending_job(model.name)
+    assert jobs.get_status(model) == status.STATUS_CANCELLED
+    # a failed launch of the cancelled job does not complete it again
+    assert not jobs.complete_pending_job(job, status.STATUS_FAILED)
+    assert jobs.get_status(model) == status.STATUS_CANCELLED
+
+
+def test_pending_job():
+    jobs = JobManager(RLock())
+    model = Model("model", {}, "", RunSettings("echo"))
+    events = []
+    jobs.events.subscribe(callback=events.append)
+
+    jobs.add_pending_job(model)
+    assert jobs.get_status(model) == status.STATUS_PENDING
+    assert not jobs.are_finished([model.name])
+    assert not jobs()
+
+    assert jobs.cancel_pending_job(model.name)
+    assert not jobs.cancel_pending_job(model.name)
+    assert jobs.get_status(model) == status.STATUS_CANCELLED
+    assert jobs.are_finished([model.name])
+    assert [event.status for event in events] == [
+        status.STATUS_PENDING,
+        status.STATUS_CANCELLED,
+    ]
+
+
+def test_failed_launches_do_not_recurse(fileutils, monkeypatch):
+    exp = Experiment("test-failed-launches", launcher="local")
+    test_dir = fileutils.make_test_dir()
+    settings = exp.create_run_settings("sleep", "0.5")
+    ensemble = exp.create_ensemble(
+        "ensemble", run_settings=settings, replicas=300, max_concurrent=1
+    )
+    ensemble.set_path(test_dir)
+
+    controller = exp._control
+    run_step = controller._run_step
+    launches = []
+
+    def run_first_step(job_step, entity):
+        launches.append(entity.name)
+        if len(launches) > 1:
+            raise LauncherError("launch failed")
+        return run_step(job_step, entity)
+
+    monkeypatch.setattr(controller, "_run_step", run_first_step)
+    exp.start(ensemble, block=False)
+
+    done, not_done = exp.wait(ensemble, timeout=60)
+    assert not not_done
+    statuses = exp.get_status(ensemble)
+    assert statuses[0] == status.STATUS_COMPLETED
+    assert statuses[1:] == [status.STATUS_FAILED] * 299
+    assert len(launches) == 300
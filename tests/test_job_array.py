@@ -0,0 +1,166 @@
+import os
+import subprocess
+
+import pytest
+
+from smartsim._core.control import Controller
+from smartsim._core.launcher.step import (
+    BsubBatchStep,
+    LocalStep,
+    QsubBatchStep,
+    SbatchStep,
+)
+from smartsim.entity import Ensemble, Model
+from smartsim.error import SSUnsupportedError
+from smartsim.settings import (
+    BsubBatchSettings,
+    CobaltBatchSettings,
+    QsubBatchSettings,
+    RunSettings,
+    SbatchSettings,
+)
+
+
+@pytest.mark.parametrize(
+    "settings, expected",
+    [
+        pytest.param(SbatchSettings(), "--array=0-9%2", id="slurm"),
+        pytest.param(QsubBatchSettings(nodes=1), "-J 0-9%2", id="pbs"),
+        pytest.param(BsubBatchSettings(), "[1-10]%2", id="lsf"),
+    ],
+)
+def test_format_array(settings, expected):
+    assert not settings.array
+    settings.set_array(max_concurrent=2)
+    assert settings.array
+    assert settings.format_array(10) == expected
+
+
+def test_cobalt_array_unsupported():
+    with pytest.raises(SSUnsupportedError):
+        CobaltBatchSettings().set_array()
+
+
+def _create_batch_step(step_class, settings, test_dir, members=3):
+    settings.set_array()
+    batch_step = step_class("ens", test_dir, settings)
+    for i in range(members):
+        member_dir = os.path.join(test_dir, f"ens_{i}")
+        os.makedirs(member_dir, exist_ok=True)
+        # arguments with spaces and shell syntax are passed as they are
+        args = ["-c", 'echo "$0"; pwd', f"member {i}; $HOME"]
+        step = LocalStep(f"ens_{i}", member_dir, RunSettings("bash", args))
+        batch_step.add_to_batch(step)
+    return batch_step
+
+
+@pytest.mark.parametrize(
+    "step_class, settings, index_var, first_index",
+    [
+        pytest.param(
+            SbatchStep, SbatchSettings(), "SLURM_ARRAY_TASK_ID", 0, id="slurm"
+        ),
+        pytest.param(
+            QsubBatchStep, QsubBatchSettings(nodes=1), "PBS_ARRAY_INDEX", 0, id="pbs"
+        ),
+        pytest.param(BsubBatchStep, BsubBatchSettings(), "LSB_JOBINDEX", 1, id="lsf"),
+    ],
+)
+def test_array_script_runs_member(
+    fileutils, step_class, settings, index_var, first_index
+):
+    test_dir = fileutils.make_test_dir()
+    batch_step = _create_batch_step(step_class, settings, test_dir)
+    script = batch_step.get_launch_cmd()[-1]
+
+    for i in range(3):
+        env = {index_var: str(first_index + i), "PATH": "/usr/bin:/bin"}
+        out = subprocess.check_output(["bash", script], env=env, cwd=test_dir)
+        member_dir = os.path.join(test_dir, f"ens_{i}")
+        assert out.decode().splitlines() == [f"member {i}; $HOME", member_dir]
+
+
+def test_pbs_single_member_array(fileutils):
+    test_dir = fileutils.make_test_dir()
+    batch_step = _create_batch_step(
+        QsubBatchStep, QsubBatchSettings(nodes=1), test_dir, members=1
+    )
+    script = batch_step.get_launch_cmd()[-1]
+    with open(script) as f:
+        assert "#PBS -J" not in f.read()
+
+    env = {"PATH": "/usr/bin:/bin"}
+    out = subprocess.check_output(["bash", script], env=env, cwd=test_dir)
+    assert out.decode().splitlines()[0] == "member 0; $HOME"
+    assert [task[2] for task in batch_step.get_array_tasks("1234.sdb")] == ["1234.sdb"]
+
+
+def test_array_task_ids(fileutils):
+    test_dir = fileutils.make_test_dir()
+    slurm_step = _create_batch_step(SbatchStep, SbatchSettings(), test_dir)
+    pbs_step = _create_batch_step(QsubBatchStep, QsubBatchSettings(nodes=1), test_dir)
+    lsf_step = _create_batch_step(BsubBatchStep, BsubBatchSettings(), test_dir)
+
+    assert [task[2] for task in slurm_step.get_array_tasks("1234")] == [
+        "1234_0",
+        "1234_1",
+        "1234_2",
+    ]
+    assert [task[2] for task in pbs_step.get_array_tasks("1234[].sdb")] == [
+        "1234[0].sdb",
+        "1234[1].sdb",
+        "1234[2].sdb",
+    ]
+    assert [task[2] for task in lsf_step.get_array_tasks("1234")] == [
+        "1234[1]",
+        "1234[2]",
+        "1234[3]",
+    ]
+    assert [task[1] for task in slurm_step.get_array_tasks("1234")] == [
+        "ens_0",
+        "ens_1",
+        "ens_2",
+    ]
+
+
+def test_not_an_array(fileutils):
+    test_dir = fileutils.make_test_dir()
+    batch_step = SbatchStep("ens", test_dir, SbatchSettings())
+    assert batch_step.get_array_tasks("1234") == []
+
+    ensemble = Ensemble("ens", {}, batch_settings=SbatchSettings())
+    assert ensemble.batch and not ensemble.array
+    ensemble.batch_settings.set_array()
+    assert ensemble.array
+
+
+def test_array_tasks_are_jobs(fileutils, monkeypatch):
+    test_dir = fileutils.make_test_dir()
+    controller = Controller(launcher="slurm")
+    launcher = controller._launcher
+
+    def run(step):
+        launcher._add_array_tasks(step, "1234")
+        return "1234"
+
+    monkeypatch.setattr(launcher, "run", run)
+
+    settings = SbatchSettings()
+    settings.set_array()
+    ensemble = Ensemble(
+        "ens", {}, batch_settings=settings, run_settings=RunSettings("echo"), replicas=3
+    )
+    ensemble.set_path(test_dir)
+    batch_step = controller._create_batch_job_step(ensemble)
+    controller._launch_step(batch_step, ensemble)
+
+    jobs = controller._jobs
+    assert [jobs[model.name].jid for model in ensemble] == [
+        "1234_0",
+        "1234_1",
+        "1234_2",
+    ]
+    for model in ensemble:
+        step_map = launcher.step_mapping[jobs[model.name].name]
+        assert step_map.step_id == jobs[model.name].jid
+    assert len(controller.get_entity_list_status(ensemble)) == 3
@@ -0,0 +1,184 @@
+import threading
+import time
+
+import pytest
+
+from smartsim._core.control.jobmanager import JobManager
+from smartsim._core.launcher.stepInfo import StepInfo
+from smartsim.entity import Model
+from smartsim.error import SmartSimError
+from smartsim.settings import RunSettings
+from smartsim.status import (
+    STATUS_CANCELLED,
+    STATUS_COMPLETED,
+    STATUS_NEW,
+    STATUS_RUNNING,
+)
+
+
+class SlowLauncher:
+    """Fake launcher whose status queries take ``delay`` seconds"""
+
+    def __init__(self, delay, status=STATUS_RUNNING):
+        self.delay = delay
+        self.status = status
+        self.querying = threading.Event()
+
+    def get_step_update(self, step_names):
+        self.querying.set()
+        time.sleep(self.delay)
+        return [(name, StepInfo(self.status, self.status)) for name in step_names]
+
+    def __str__(self):
+        return "Slow"
+
+
+def _create_job_manager(launcher, num_models=10):
+    jm = JobManager(threading.RLock(), launcher)
+    models = []
+    for i in range(num_models):
+        model = Model(f"model_{i}", {}, ".", RunSettings("echo"))
+        jm.add_job(f"model_{i}-step", str(i), model, is_task=False)
+        models.append(model)
+    return jm, models
+
+
+def test_get_status_not_blocked_by_check_jobs():
+    launcher = SlowLauncher(delay=2)
+    jm, models = _create_job_manager(launcher)
+
+    monitor = threading.Thread(target=jm.check_jobs)
+    monitor.start()
+    assert launcher.querying.wait(timeout=5)
+
+    latencies = []
+    for model in models:
+        start = time.perf_counter()
+        jm.get_status(model)
+        jm.is_finished(model)
+        latencies.append(time.perf_counter() - start)
+
+    # lock is not held while the launcher is queried
+    assert jm._lock.acquire(timeout=0.5)
+    jm._lock.release()
+
+    assert monitor.is_alive()
+    assert max(latencies) < 0.5
+    monitor.join()
+    assert all(jm.get_status(model) == STATUS_RUNNING for model in models)
+
+
+def test_check_jobs_skips_jobs_stopped_during_query():
+    launcher = SlowLauncher(delay=0.5, status=STATUS_COMPLETED)
+    jm, models = _create_job_manager(launcher, num_models=1)
+    job = jm[models[0].name]
+
+    monitor = threading.Thread(target=jm.check_jobs)
+    monitor.start()
+    assert launcher.querying.wait(timeout=5)
+
+    # simulate Controller.stop_entity while the launcher is queried
+    job.set_status(STATUS_CANCELLED, "", None)
+    jm.move_to_completed(job)
+    monitor.join()
+
+    assert jm.get_status(models[0]) == STATUS_CANCELLED
+
+
+def test_get_status_unknown_entity():
+    jm, _ = _create_job_manager(SlowLauncher(delay=0), num_models=0)
+    model = Model("not_launched", {}, ".", RunSettings("echo"))
+    with pytest.raises(SmartSimError):
+        jm.get_status(model)
+    with pytest.raises(KeyError):
+        jm.is_finished(model)
+
+
+def test_get_statuses_snapshot():
+    launcher = SlowLauncher(delay=0, status=STATUS_COMPLETED)
+    jm, models = _create_job_manager(launcher)
+    names = [model.name for model in models]
+
+    statuses = jm.get_statuses(names)
+    assert list(statuses) == names
+    assert set(statuses.values()) == {"New"}
+    assert not jm.are_finished(names)
+
+    jm.check_jobs()
+    assert set(jm.get_statuses(names).values()) == {STATUS_COMPLETED}
+    for model in models:
+        jm.move_to_completed(jm[model.name])
+    assert jm.are_finished(names)
+
+    with pytest.raises(SmartSimError):
+        jm.get_statuses(names + ["missing"])
+    with pytest.raises(KeyError):
+        jm.are_finished(names + ["missing"])
+
+
+def test_step_id_callback_sets_job_id():
+    launcher = SlowLauncher(delay=0)
+    launcher.step_id_callback = None
+    jm, models = _create_job_manager(launcher, num_models=2)
+    jm.set_launcher(launcher)
+    assert launcher.step_id_callback == jm.set_job_id
+
+    launcher.step_id_callback("model_1-step", "1234.1")
+    assert jm["model_1"].jid == "1234.1"
+    assert jm["model_0"].jid == "0"
+
+
+def test_completion_published_without_lock():
+    launcher = SlowLauncher(delay=0, status=STATUS_COMPLETED)
+    jm, models = _create_job_manager(launcher, num_models=1)
+    locked = []
+    jm.events.subscribe(callback=lambda event: locked.append(jm._lock._is_owned()))
+
+    job = jm[models[0].name]
+    job.set_status(STATUS_CANCELLED, "", None)
+    jm.move_to_completed(job)
+    assert locked == [False]
+
+    # callers holding the lock publish the events themselves
+    jm.restart_job("model_0-step-2", "1", models[0].name)
+    job.set_status(STATUS_CANCELLED, "", None)
+    with jm._lock:
+        events = jm.move_to_completed(job, publish=False)
+    assert [event.status for event in events] == [STATUS_CANCELLED]
+    jm.events.publish(events)
+    assert locked == [False, False, False]
+
+
+def test_restarted_job_publishes_statuses():
+    launcher = SlowLauncher(delay=0, status=STATUS_COMPLETED)
+    jm, models = _create_job_manager(launcher, num_models=1)
+    events = []
+    jm.events.subscribe(callback=lambda event: events.append(event.status))
+
+    for run in range(2):
+        jm.check_jobs()
+        jm.move_to_completed(jm[models[0].name])
+        if run == 0:
+            jm.restart_job("model_0-step-2", "1", models[0].name)
+    assert events == [STATUS_COMPLETED, STATUS_NEW, STATUS_COMPLETED]
+
+
+def test_step_id_reported_before_job_is_added():
+    launcher = SlowLauncher(delay=0)
+    launcher.step_id_callback = None
+    jm, models = _create_job_manager(launcher, num_models=1)
+    jm.set_launcher(launcher)
+
+    model = Model("model_1", {}, ".", RunSettings("echo"))
+    launcher.step_id_callback("model_1-step", "1234.1")
+    jm.add_job("model_1-step", None, model, is_task=False)
+    assert jm["model_1"].jid == "1234.1"
+
+    jm.move_to_completed(jm["model_0"])
+    launcher.step_id_callback("model_0-step-2", "1234.2")
+    jm.restart_job("model_0-step-2", None, "model_0", is_task=False)
+    assert jm["model_0"].jid == "1234.2"
+
+    # ids of previous steps do not apply to the restarted job
+    launcher.step_id_callback("model_0-step", "1234.0")
+    assert jm["model_0"].jid == "1234.2"
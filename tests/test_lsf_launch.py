@@ -0,0 +1,174 @@
+import time
+
+from smartsim._core.launcher.lsf import lsfLauncher
+from smartsim._core.launcher.lsf.lsfLauncher import LSFLauncher
+from smartsim.status import STATUS_COMPLETED, STATUS_FAILED, STATUS_RUNNING
+
+JSLIST = """
+    parent      cpus      gpus      exit
+ID    ID  nrs  per RS  per RS  status  status
+===============================================================================
+     3     0    1  various various         0 Complete
+     4     0    1  various various         0 Running
+     5     0    1  various various         0 Complete
+     6     0    1  various various         1 Complete
+"""
+
+JSLIST_RUNNING = """
+    parent      cpus      gpus      exit
+ID    ID  nrs  per RS  per RS  status  status
+===============================================================================
+     3     0    1  various various         0 Complete
+     4     0    1  various various         0 Running
+     5     0    1  various various         0 Running
+     6     0    1  various various         0 Running
+"""
+
+BJOBS = """JOBID   USER    STAT  QUEUE   FROM_HOST  EXEC_HOST  JOB_NAME  SUBMIT_TIME
+1234    user    RUN   batch   login1     batch1     job1      Jan 1 10:00
+1235    user    DONE  batch   login1     batch1     job2      Jan 1 10:00
+"""
+
+
+def _counting(monkeypatch, name, output):
+    calls = []
+
+    def command(args):
+        calls.append(args)
+        return output, ""
+
+    monkeypatch.setattr(lsfLauncher, name, command)
+    return calls
+
+
+def test_managed_update_single_query(monkeypatch):
+    jslist_calls = _counting(monkeypatch, "jslist", JSLIST)
+    bjobs_calls = _counting(monkeypatch, "bjobs", BJOBS)
+
+    launcher = LSFLauncher()
+    updates = launcher._get_managed_step_update(
+        ["1234.4", "1234.5", "1234.6", "1234", "1235", "1234.9", "99"]
+    )
+    assert len(jslist_calls) == 1
+    assert bjobs_calls == [["-a", "1234", "1235", "99"]]
+
+    statuses = [update.status for update in updates]
+    assert statuses[:5] == [
+        STATUS_RUNNING,
+        STATUS_COMPLETED,
+        STATUS_FAILED,
+        STATUS_RUNNING,
+        STATUS_COMPLETED,
+    ]
+    assert updates[4].returncode == 0
+
+
+def test_managed_update_skips_unused_queries(monkeypatch):
+    jslist_calls = _counting(monkeypatch, "jslist", JSLIST)
+    bjobs_calls = _counting(monkeypatch, "bjobs", BJOBS)
+
+    launcher = LSFLauncher()
+    launcher._get_managed_step_update(["1234.4"])
+    assert len(jslist_calls) == 1
+    assert not bjobs_calls
+
+
+def _add_pending(monkeypatch, launcher, names, deadline=None, exited=()):
+    deadline = deadline or time.monotonic() + 10
+    for i, name in enumerate(names):
+        launcher.step_mapping.add(name, None, str(i), False)
+        launcher._pending_steps[name] = ("1234", deadline)
+    monkeypatch.setattr(
+        launcher,
+        "_get_live_pending_steps",
+        lambda: set(launcher._pending_steps) - set(exited),
+    )
+
+
+def test_step_ids_from_one_snapshot(monkeypatch):
+    jslist_calls = _counting(monkeypatch, "jslist", JSLIST_RUNNING)
+    resolved = {}
+
+    launcher = LSFLauncher()
+    launcher.step_id_callback = resolved.__setitem__
+    launcher._last_step_id = 3
+    _add_pending(monkeypatch, launcher, ["a", "b", "c"])
+
+    launcher._get_lsf_step_ids()
+    assert len(jslist_calls) == 1
+    assert resolved == {"a": "1234.4", "b": "1234.5", "c": "1234.6"}
+    assert not launcher._pending_steps
+    assert launcher._last_step_id == 6
+
+    stepmap = launcher.step_mapping["b"]
+    assert stepmap.step_id == "1234.5"
+    assert stepmap.task_id == "1"
+    assert stepmap.managed
+
+
+def test_step_ids_pending_until_listed(monkeypatch):
+    _counting(monkeypatch, "jslist", JSLIST_RUNNING)
+
+    launcher = LSFLauncher()
+    launcher._last_step_id = 5
+    _add_pending(monkeypatch, launcher, ["a", "b"])
+
+    launcher._get_lsf_step_ids()
+    assert launcher.step_mapping["a"].step_id == "1234.6"
+    assert list(launcher._pending_steps) == ["b"]
+    assert not launcher.step_mapping["b"].managed
+
+
+def test_step_ids_timeout(monkeypatch):
+    _counting(monkeypatch, "jslist", JSLIST)
+
+    launcher = LSFLauncher()
+    launcher._last_step_id = 6
+    _add_pending(monkeypatch, launcher, ["a"], deadline=time.monotonic() - 1)
+
+    launcher._get_lsf_step_ids()
+    assert not launcher._pending_steps
+    assert not launcher.step_mapping["a"].managed
+
+
+def test_exited_steps_do_not_shift_ids(monkeypatch):
+    _counting(monkeypatch, "jslist", JSLIST)
+
+    launcher = LSFLauncher()
+    launcher._last_step_id = 3
+    _add_pending(monkeypatch, launcher, ["a", "b", "c"], exited=["a"])
+
+    launcher._get_lsf_step_ids()
+    # a exited before it was listed, b is the only running step after 3
+    assert not launcher.step_mapping["a"].managed
+    assert launcher.step_mapping["b"].step_id == "1234.4"
+    assert list(launcher._pending_steps) == ["c"]
+
+
+def test_step_mapped_before_pending(monkeypatch):
+    _counting(monkeypatch, "jslist", JSLIST)
+
+    class Step:
+        name = "a"
+        cwd = "."
+        alloc = "1234"
+        managed = True
+
+        def get_launch_cmd(self):
+            return ["jsrun", "true"]
+
+        def get_launcher_output_files(self):
+            return None
+
+    launcher = LSFLauncher()
+    launcher._last_step_id = 3
+    monkeypatch.setattr(lsfLauncher, "JsrunStep", Step)
+    monkeypatch.setattr(launcher.task_manager, "start", lambda: None)
+    monkeypatch.setattr(launcher.task_manager, "start_task", lambda *a, **k: "7")
+    monkeypatch.setattr(launcher, "_get_live_pending_steps", lambda: {"a"})
+
+    assert launcher.run(Step()) is None
+    assert launcher.step_mapping["a"].task_id == "7"
+    launcher._get_lsf_step_ids()
+    assert launcher.step_mapping["a"].step_id == "1234.4"
+    assert launcher.step_mapping["a"].managed
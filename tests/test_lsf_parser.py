@@ -92,3 +92,40 @@ def test_parse_jslist():
     parsed_result = lsfParser.parse_jslist_stepid(output, "1")
     result = ("Running", "0")
     assert parsed_result == result
+
+
+def test_parse_jslist_stepids():
+    output = (
+        "   parent                cpus      gpus      exit  \n"
+        "ID   ID       nrs    per RS    per RS    status         status\n"
+        "===============================================================================\n"
+        "    2    1       168         1         1         1       Complete\n"
+        "    1    1         4   various   various         0        Running\n"
+    )
+    parsed_results = lsfParser.parse_jslist_stepids(output)
+    assert parsed_results["1"] == ("Running", "0")
+    assert parsed_results["2"] == ("Complete", "1")
+    assert lsfParser.parse_jslist_stepid(output, "3") == ("NOTFOUND", None)
+
+
+def test_parse_bjobs_jobids():
+    output = (
+        "JOBID   USER    STAT  QUEUE      FROM_HOST   EXEC_HOST   JOB_NAME   SUBMIT_TIME\n"
+        "1234    smartsi RUN   batch      login1      batch1      smartsim   Jan 01 00:00\n"
+        "1235    smartsi PEND  batch      login1      -           smartsim   Jan 01 00:00\n"
+    )
+    parsed_results = lsfParser.parse_bjobs_jobids(output)
+    assert parsed_results["1234"] == "RUN"
+    assert parsed_results["1235"] == "PEND"
+    assert lsfParser.parse_bjobs_jobid(output, "123") == "NOTFOUND"
+
+
+def test_parse_bjobs_array_jobids():
+    output = (
+        "JOBID   USER    STAT  QUEUE      FROM_HOST   EXEC_HOST   JOB_NAME   SUBMIT_TIME\n"
+        "1234    smartsi RUN   batch      login1      batch1      ens[1]     Jan 01 00:00\n"
+        "1234    smartsi PEND  batch      login1      -           ens[2]     Jan 01 00:00\n"
+    )
+    parsed_results = lsfParser.parse_bjobs_jobids(output)
+    assert parsed_results["1234[1]"] == "RUN"
+    assert parsed_results["1234[2]"] == "PEND"
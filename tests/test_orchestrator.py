@@ -272,3 +272,93 @@ def test_lsf_set_batch_args(wlmutils):
     assert orc.batch_settings.batch_args["m"] == '"batch host1 host2"'
     orc.set_batch_arg("D", "102400000")
     assert orc.batch_settings.batch_args["D"] == "102400000"
+
+
+def test_shards_per_node(wlmutils):
+    port = wlmutils.get_test_port()
+    orc = Orchestrator(
+        port,
+        db_nodes=3,
+        batch=False,
+        interface="lo",
+        launcher="slurm",
+        run_command="srun",
+        shards_per_node=4,
+        pin_shards=True,
+    )
+    assert orc.num_shards == 12
+    assert orc.ports == [port, port + 1, port + 2, port + 3]
+    for db in orc.entities:
+        assert db.ports == orc.ports
+        exe_args = db.run_settings.exe_args
+        assert exe_args.count("+command") == 4
+        assert "+pin_cpus" in exe_args
+        assert "--cluster-enabled" in exe_args
+        assert f"+rendezvous=rendezvous-{db.name}-{port + 3}.json" in exe_args
+
+    with pytest.raises(SSUnsupportedError):
+        Orchestrator(shards_per_node=2)
+
+
+def test_local_shards_per_node(fileutils, wlmutils):
+    exp = Experiment("test_local_shards_per_node", launcher="local")
+    test_dir = fileutils.make_test_dir()
+
+    port = wlmutils.get_test_port()
+    db = Orchestrator(port=port, shards_per_node=3)
+    db.set_path(test_dir)
+
+    exp.start(db)
+    try:
+        assert db.is_active()
+        assert db.get_address() == [f"127.0.0.1:{port + i}" for i in range(3)]
+    finally:
+        exp.stop(db)
+
+
+def test_replicas(wlmutils):
+    port = wlmutils.get_test_port()
+    orc = Orchestrator(
+        port,
+        db_nodes=3,
+        batch=False,
+        interface="lo",
+        launcher="slurm",
+        run_command="srun",
+        shards_per_node=2,
+        replicas=1,
+    )
+    assert orc.num_shards == 6
+    assert orc.replicas == 1
+
+    orc._hosts = ["host0", "host1", "host2"]
+    replica_addresses = orc._get_replica_addresses()
+    assert len(replica_addresses) == 3
+    for primary, replicas in replica_addresses.items():
+        assert len(replicas) == 1
+        assert primary.split(":")[0] != replicas[0].split(":")[0]
+
+    with pytest.raises(SSUnsupportedError):
+        Orchestrator(shards_per_node=3, replicas=1)
+    with pytest.raises(SSUnsupportedError):
+        Orchestrator(shards_per_node=4, replicas=1)
+
+
+def test_local_replicas(fileutils, wlmutils):
+    exp = Experiment("test_local_replicas", launcher="local")
+    test_dir = fileutils.make_test_dir()
+
+    port = wlmutils.get_test_port()
+    db = Orchestrator(port=port, shards_per_node=6, replicas=1)
+    db.set_path(test_dir)
+
+    exp.start(db)
+    try:
+        assert db.is_active()
+        addresses = [f"127.0.0.1:{port + i}" for i in range(6)]
+        assert db.get_address() == addresses
+        assert db.get_primary_addresses() == addresses[:3]
+        replicas = db.get_replica_addresses()
+        assert sorted(sum(replicas.values(), [])) == addresses[3:]
+    finally:
+        exp.stop(db)
@@ -0,0 +1,85 @@
+import os.path as osp
+import socket
+import threading
+import time
+
+import pytest
+
+from smartsim._core.control import Controller
+from smartsim._core.utils.rendezvous import write_rendezvous_file
+from smartsim.database import Orchestrator
+from smartsim.error import SmartSimError
+from smartsim.status import STATUS_FAILED
+
+
+def pong_server():
+    """Answer every request with a redis PONG"""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+
+    def serve():
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            with conn:
+                while conn.recv(1024):
+                    conn.sendall(b"+PONG\r\n")
+
+    threading.Thread(target=serve, daemon=True).start()
+    return server
+
+
+def write_address(dbnode, delay=0):
+    def write():
+        time.sleep(delay)
+        for filename in dbnode._get_rendezvous_filenames():
+            filepath = osp.join(dbnode.path, filename)
+            write_rendezvous_file(filepath, "127.0.0.1", dbnode.ports[0], 1)
+
+    threading.Thread(target=write).start()
+
+
+def make_orc(fileutils, port):
+    orc = Orchestrator(port=port, interface="lo", launcher="local")
+    orc.set_path(fileutils.make_test_dir())
+    return orc
+
+
+def test_try_parse_db_hosts(fileutils):
+    dbnode = make_orc(fileutils, 6780).entities[0]
+    assert dbnode._try_parse_db_hosts() is None
+    write_address(dbnode)
+    time.sleep(0.1)
+    assert dbnode._try_parse_db_hosts() == ["127.0.0.1"]
+    assert dbnode.host == "127.0.0.1"
+
+
+def test_launch_wait(fileutils, monkeypatch):
+    monkeypatch.setenv("SMARTSIM_JM_INTERVAL", "10")
+    server = pong_server()
+    try:
+        orc = make_orc(fileutils, server.getsockname()[1])
+        write_address(orc.entities[0], delay=0.2)
+
+        start = time.time()
+        Controller()._orchestrator_launch_wait(orc)
+        assert time.time() - start < 2
+        assert orc.hosts == ["127.0.0.1"]
+    finally:
+        server.close()
+
+
+def test_launch_wait_failed(fileutils, monkeypatch):
+    monkeypatch.setenv("SMARTSIM_JM_INTERVAL", "1")
+    orc = make_orc(fileutils, 6780)
+    controller = Controller()
+    stopped = []
+    monkeypatch.setattr(controller, "get_entity_list_status", lambda _: [STATUS_FAILED])
+    monkeypatch.setattr(controller, "stop_entity_list", stopped.append)
+
+    with pytest.raises(SmartSimError):
+        controller._orchestrator_launch_wait(orc)
+    assert stopped == [orc]
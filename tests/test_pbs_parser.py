@@ -41,3 +41,17 @@ def test_parse_qstat_status():
     status = "R"
     parsed_status = pbsParser.parse_qstat_jobid(output, "1289903.sdb")
     assert status == parsed_status
+
+
+def test_parse_qstat_jobids():
+    output = (
+        "Job id            Name             User              Time Use S Queue\n"
+        "----------------  ---------------- ----------------  -------- - -----\n"
+        "1289903.sdb       jobname          username          00:00:00 R queue\n"
+        "1289904.sdb       jobname          username          00:00:00 Q queue\n"
+    )
+    parsed_statuses = pbsParser.parse_qstat_jobids(output)
+    assert parsed_statuses["1289903.sdb"] == "R"
+    assert parsed_statuses["1289904.sdb"] == "Q"
+    assert "1289905.sdb" not in parsed_statuses
+    assert pbsParser.parse_qstat_jobid(output, "1289905.sdb") == "NOTFOUND"
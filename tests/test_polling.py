@@ -0,0 +1,61 @@
+import time
+from threading import Timer
+
+from smartsim._core.control.polling import PollingPolicy
+from smartsim._core.launcher import LocalLauncher, SlurmLauncher
+
+
+def test_backoff_and_reset():
+    policy = PollingPolicy(1, 10, backoff=2)
+    assert policy.interval == 1
+
+    for expected in (2, 4, 8, 10, 10):
+        policy.record_query(changed=False)
+        assert policy.interval == expected
+
+    policy.record_query(changed=True)
+    assert policy.interval == 1
+
+
+def test_notify_wakes_wait():
+    policy = PollingPolicy(5, 10)
+    Timer(0.1, policy.notify).start()
+    start = time.monotonic()
+    policy.wait()
+    assert time.monotonic() - start < 2
+    assert policy.interval == 5
+
+
+def test_query_interval_is_ceiling():
+    policy = PollingPolicy(0, 1, query_interval=0.5)
+    policy.record_query(changed=True)
+    policy.notify()
+    start = time.monotonic()
+    policy.wait()
+    assert time.monotonic() - start >= 0.4
+
+
+def test_stats():
+    policy = PollingPolicy(0, 1)
+    policy.record_query(changed=False)
+    time.sleep(0.1)
+    policy.record_query(changed=True, completions=2)
+
+    stats = policy.stats
+    assert stats["queries"] == 2
+    assert stats["completions"] == 2
+    assert stats["mean_detection_delay"] >= 0.1
+    assert stats["max_detection_delay"] == stats["mean_detection_delay"]
+
+
+def test_policy_from_launcher(monkeypatch):
+    local = PollingPolicy.from_launcher(LocalLauncher())
+    assert local.query_interval == 0
+
+    monkeypatch.setenv("SMARTSIM_JM_INTERVAL", "20")
+    monkeypatch.setenv("SMARTSIM_JM_MIN_INTERVAL", "3")
+    monkeypatch.setenv("SMARTSIM_JM_QUERY_INTERVAL", "2")
+    wlm = PollingPolicy.from_launcher(SlurmLauncher())
+    assert wlm.max_interval == 20
+    assert wlm.min_interval == 3
+    assert wlm.query_interval == 2
@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from smartsim._core.launcher.queryBroker import QueryBroker
+
+
+class FakeQuery:
+    """Status query taking ``delay`` seconds and counting its calls"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, step_ids):
+        self.calls.append(sorted(step_ids))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("query failed")
+        return [f"status-{step_id}" for step_id in step_ids]
+
+
+def test_cache_hit():
+    query = FakeQuery()
+    broker = QueryBroker(query, ttl=10)
+    assert broker.get(["1", "2"]) == ["status-1", "status-2"]
+    assert broker.get(["2"]) == ["status-2"]
+    assert len(query.calls) == 1
+    assert broker.stats["cache_hits"] == 1
+
+    broker.get(["3"])
+    assert query.calls[-1] == ["3"]
+
+
+def test_ttl_expires():
+    query = FakeQuery()
+    broker = QueryBroker(query, ttl=0)
+    broker.get(["1"])
+    broker.get(["1"])
+    assert len(query.calls) == 2
+
+
+def test_invalidate():
+    query = FakeQuery()
+    broker = QueryBroker(query, ttl=10)
+    broker.get(["1", "2"])
+    broker.invalidate(["1"])
+    broker.get(["2"])
+    assert len(query.calls) == 1
+    broker.get(["1"])
+    assert len(query.calls) == 2
+
+
+def test_concurrent_requests_are_merged():
+    query = FakeQuery(delay=0.2)
+    broker = QueryBroker(query, ttl=0)
+
+    results = {}
+
+    def request(step_id):
+        results[step_id] = broker.get([step_id])
+
+    first = threading.Thread(target=request, args=("0",))
+    first.start()
+    time.sleep(0.05)
+    # requested while the first query runs, answered by one more query
+    threads = [threading.Thread(target=request, args=(str(i),)) for i in range(1, 9)]
+    for thread in threads:
+        thread.start()
+    for thread in [first] + threads:
+        thread.join()
+
+    assert results == {str(i): [f"status-{i}"] for i in range(9)}
+    assert len(query.calls) == 2
+    assert query.calls[1] == [str(i) for i in range(1, 9)]
+    stats = broker.stats
+    assert stats["requests"] == 9
+    assert stats["queries"] == 2
+    assert stats["max_latency"] >= 0.2
+
+
+def test_failed_query_is_retried():
+    query = FakeQuery()
+    query.fail = True
+    broker = QueryBroker(query, ttl=0)
+    with pytest.raises(RuntimeError):
+        broker.get(["1"])
+    query.fail = False
+    assert broker.get(["1"]) == ["status-1"]
+
+
+def test_running_query_does_not_answer_later_requests():
+    query = FakeQuery(delay=0.2)
+    broker = QueryBroker(query, ttl=10)
+
+    first = threading.Thread(target=broker.get, args=(["1"],))
+    first.start()
+    time.sleep(0.05)
+    # e.g. stop() after cancelling the step: the running query may
+    # have read the status from before the cancel
+    broker.invalidate(["1"])
+    broker.get(["1"])
+    first.join()
+    assert query.calls == [["1"], ["1"]]
+
+
+def test_old_statuses_are_evicted():
+    query = FakeQuery()
+    broker = QueryBroker(query, ttl=0.05)
+    broker.get(["1"])
+    time.sleep(0.1)
+    broker.get(["2"])
+    assert "1" not in broker._cache
+    assert "2" in broker._cache
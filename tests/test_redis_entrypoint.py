@@ -0,0 +1,59 @@
+import os
+import os.path as osp
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from smartsim._core.entrypoints.redis import get_cpu_sets
+from smartsim._core.utils.rendezvous import read_rendezvous_file
+
+
+def test_get_cpu_sets(monkeypatch):
+    monkeypatch.setattr(os, "sched_getaffinity", lambda _: set(range(8)))
+    assert get_cpu_sets(3) == [[0, 1], [2, 3], [4, 5]]
+    assert get_cpu_sets(1) == [list(range(8))]
+    assert get_cpu_sets(9) is None
+
+
+def test_multiple_shards(fileutils):
+    test_dir = fileutils.make_test_dir()
+    args = [sys.executable, "-m", "smartsim._core.entrypoints.redis", "+ifname=lo"]
+    for port in (6780, 6781):
+        args += [f"+rendezvous=shard-{port}.json", "+command", sys.executable]
+        args += ["-c", "print('started')", "--port", str(port)]
+
+    root = str(Path(__file__).parent.parent)
+    env = dict(os.environ, PYTHONPATH=root)
+    proc = subprocess.run(
+        args, cwd=test_dir, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 0
+    assert proc.stdout.split("Output")[-1].count("started") == 2
+
+    for port in (6780, 6781):
+        shard = read_rendezvous_file(osp.join(test_dir, f"shard-{port}.json"))
+        assert shard["host"] == "127.0.0.1"
+        assert shard["port"] == port
+
+
+@pytest.mark.skipif(len(os.sched_getaffinity(0)) < 2, reason="needs 2 CPUs")
+def test_pinned_shards(fileutils):
+    test_dir = fileutils.make_test_dir()
+    args = [sys.executable, "-m", "smartsim._core.entrypoints.redis", "+ifname=lo"]
+    args += ["+pin_cpus"]
+    for port in (6782, 6783):
+        args += ["+command", sys.executable, "-c"]
+        args += ["import os; print('cpus', len(os.sched_getaffinity(0)))"]
+        args += ["--port", str(port)]
+
+    root = str(Path(__file__).parent.parent)
+    env = dict(os.environ, PYTHONPATH=root)
+    proc = subprocess.run(
+        args, cwd=test_dir, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 0
+    cpus_per_shard = len(os.sched_getaffinity(0)) // 2
+    output = proc.stdout.split("Output")[-1]
+    assert output.count(f"cpus {cpus_per_shard}\n") == 2
@@ -0,0 +1,116 @@
+import shutil
+import subprocess
+import time
+
+import numpy as np
+import pytest
+from rediscluster import RedisCluster
+from rediscluster.exceptions import MovedError
+
+from smartsim._core.config import CONFIG
+from smartsim._core.utils.redis import (
+    check_cluster_status,
+    create_cluster,
+    get_cluster_layout,
+)
+from smartsim.ml.data import ReplicaReader, form_key, get_keyslot
+
+
+def find_redis_server():
+    try:
+        return CONFIG.database_exe
+    except Exception:
+        return shutil.which("redis-server")
+
+
+def test_keyslot():
+    assert get_keyslot("foo") == 12182
+    assert get_keyslot("{foo}.samples_0") == get_keyslot("foo")
+    assert get_keyslot("{}.samples_0") != get_keyslot("")
+
+
+def test_form_key():
+    assert form_key("producer_0", "samples_0") == "producer_0.samples_0"
+    assert form_key(None, "samples_0") == "samples_0"
+
+
+def test_get_tensor(monkeypatch):
+    class FakeClient:
+        def execute_command(self, *args):
+            assert args == ("AI.TENSORGET", "key", "META", "BLOB")
+            data = np.arange(6, dtype=np.float32)
+            return [b"dtype", b"FLOAT", b"shape", [2, 3], b"blob", data.tobytes()]
+
+    reader = ReplicaReader.__new__(ReplicaReader)
+    monkeypatch.setattr(reader, "_get_client", lambda key: FakeClient(), raising=False)
+    tensor = reader.get_tensor("key")
+    assert tensor.dtype == np.float32
+    assert tensor.shape == (2, 3)
+    assert tensor.flags.writeable
+    assert (tensor.ravel() == np.arange(6)).all()
+
+
+def test_reload_slots_on_redirect(monkeypatch):
+    class MovedClient:
+        def execute_command(self, *args):
+            raise MovedError("12182 127.0.0.1:6380")
+
+    class FakeClient:
+        def execute_command(self, *args):
+            return 1
+
+    clients = [MovedClient(), FakeClient()]
+    reloads = []
+    reader = ReplicaReader.__new__(ReplicaReader)
+    monkeypatch.setattr(
+        reader, "_get_client", lambda key: clients.pop(0), raising=False
+    )
+    monkeypatch.setattr(reader, "_load_slots", lambda: reloads.append(1), raising=False)
+
+    assert reader.tensor_exists("foo")
+    assert reloads == [1]
+
+
+@pytest.mark.skipif(not find_redis_server(), reason="redis-server not found")
+def test_read_from_replicas(fileutils, wlmutils, dbutils):
+    test_dir = fileutils.make_test_dir()
+    ports = [wlmutils.get_test_port() + i for i in range(6)]
+    procs = [
+        subprocess.Popen(
+            [find_redis_server(), "--port", str(port), "--bind", "127.0.0.1"]
+            + ["--cluster-enabled", "yes"]
+            + ["--cluster-config-file", f"nodes-{port}.conf"]
+            + ["--save", "", "--appendonly", "no"],
+            cwd=test_dir,
+            stdout=subprocess.DEVNULL,
+        )
+        for port in ports
+    ]
+    try:
+        dbutils.wait_for_shards(procs, ports)
+        create_cluster(["127.0.0.1"], ports, replicas=1)
+        check_cluster_status(["127.0.0.1"], ports, replicas=1)
+
+        layout = get_cluster_layout(["127.0.0.1"], ports, replicas=1)
+        replica_ports = [replicas[0][1] for _, replicas in layout]
+        reader = ReplicaReader(f"127.0.0.1:{ports[0]}", rank=1)
+        assert sorted(port for _, port in reader.nodes) == sorted(replica_ports)
+
+        keys = [form_key("producer", f"samples_{i}") for i in range(20)]
+        assert not any(reader.tensor_exists(key) for key in keys)
+
+        writer = RedisCluster(host="127.0.0.1", port=ports[0])
+        for key in keys:
+            writer.set(key, b"data")
+        writer.close()
+
+        # keys are replicated asynchronously
+        for _ in range(100):
+            if all(reader.tensor_exists(key) for key in keys):
+                break
+            time.sleep(0.05)
+        assert all(reader.tensor_exists(key) for key in keys)
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
@@ -0,0 +1,91 @@
+import csv
+import math
+import os
+
+import pytest
+
+from smartsim._core.control.history import FIELDS, RunHistory
+from smartsim._core.control.job import Job
+from smartsim.entity import Model
+from smartsim.settings import RunSettings
+from smartsim.status import STATUS_COMPLETED, STATUS_FAILED
+
+
+def _create_history():
+    history = RunHistory()
+    for i in range(10):
+        status = STATUS_FAILED if i % 3 == 0 else STATUS_COMPLETED
+        returncode = 1 if status == STATUS_FAILED else 0
+        history.record(
+            f"member_{i % 5}", "Model", f"10{i}", i // 5, i, status, returncode
+        )
+    history.record("db", "DBNode", "200", 0, 100.0, STATUS_COMPLETED, None)
+    return history
+
+
+def test_rows_round_trip():
+    history = _create_history()
+    assert len(history) == 11
+    rows = list(history.rows())
+    assert rows[0] == ("member_0", "Model", "100", 0, 0.0, STATUS_FAILED, 1)
+    assert rows[-1] == ("db", "DBNode", "200", 0, 100.0, STATUS_COMPLETED, None)
+
+
+def test_select_and_aggregate():
+    history = _create_history()
+    members = [f"member_{i}" for i in range(5)]
+
+    assert history.failures() == 4
+    assert history.failures(["member_0", "member_1"]) == 2
+    failed = history.select(names=members, statuses=[STATUS_FAILED])
+    assert history.count_by("name", failed) == {
+        "member_0": 1,
+        "member_3": 1,
+        "member_1": 1,
+        "member_4": 1,
+    }
+    assert history.count_by("entity_type") == {"Model": 10, "DBNode": 1}
+    assert history.select(names=["missing"]) == []
+
+    runtimes = history.runtime_percentiles([0, 50, 100], history.select(members))
+    assert runtimes == [0.0, 4.5, 9.0]
+    assert history.runtime_percentiles([50], []) == [None]
+
+
+def test_export(fileutils):
+    history = _create_history()
+    path = os.path.join(fileutils.make_test_dir(), "history.csv")
+    history.to_csv(path)
+    with open(path, newline="") as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert tuple(rows[0]) == FIELDS
+    assert len(rows) == 12
+
+    np = pytest.importorskip("numpy")
+    records = history.to_numpy()
+    assert records.shape == (11,)
+    assert records["name"][0] == "member_0"
+    assert records["run"][5] == 1
+    assert np.isnan(records["returncode"][-1])
+    assert records["time"].sum() == sum(range(10)) + 100.0
+
+
+def test_job_history_view():
+    history = RunHistory()
+    model = Model("model", {}, ".", RunSettings("echo"))
+    job = Job("model-step", "1", model, "local", True, history)
+    job.status = STATUS_COMPLETED
+    job.returncode = 0
+    job.record_history()
+
+    job.reset("model-step-2", "2", True)
+    job.status = STATUS_FAILED
+    job.returncode = 1
+    job.record_history()
+
+    assert job.history.runs == 1
+    assert job.history.jids == {0: "1", 1: "2"}
+    assert job.history.statuses == {0: STATUS_COMPLETED, 1: STATUS_FAILED}
+    assert job.history.returns == {0: 0, 1: 1}
+    assert len(history) == 2
+    assert not math.isnan(job.history.job_times[1])
@@ -21,7 +21,14 @@ def test_execute_async_cmd():
 
 def test_errors():
     with pytest.raises(ShellError):
-        execute_async_cmd(["sleep", "--notexistingoption"], cwd=".")
+        execute_async_cmd(["notexistingcommand"], cwd=".")
 
     with pytest.raises(ShellError):
         execute_cmd(["sleep", "3"], timeout=1)
+
+
+def test_execute_async_cmd_no_wait():
+    # failures after exec are left to the task monitor
+    proc = execute_async_cmd(["sleep", "--notexistingoption"], cwd=".")
+    proc.communicate()
+    assert proc.returncode != 0
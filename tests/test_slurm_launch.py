@@ -0,0 +1,114 @@
+import os.path as osp
+import pickle
+import time
+
+import pytest
+
+from smartsim._core.control.controller import Controller
+from smartsim._core.launcher.slurm import stepIdResolver
+from smartsim._core.launcher.slurm.stepIdResolver import StepIdResolver
+from smartsim._core.launcher.util.rateLimiter import RateLimiter
+from smartsim.error import LauncherError
+
+
+def test_rate_limiter_burst():
+    limiter = RateLimiter(100, burst=5)
+    waited = [limiter.acquire() for _ in range(5)]
+    assert waited == [0.0] * 5
+    assert limiter.acquire() > 0
+
+
+def test_rate_limiter_rate():
+    limiter = RateLimiter(50, burst=1)
+    start = time.monotonic()
+    for _ in range(11):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.18
+
+
+def test_rate_limiter_disabled():
+    limiter = RateLimiter(0)
+    assert all(limiter.acquire() == 0.0 for _ in range(100))
+
+
+def _wait_for(predicate, timeout=5):
+    start = time.monotonic()
+    while not predicate():
+        if time.monotonic() - start > timeout:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_resolver_batches_queries(monkeypatch):
+    calls = []
+
+    def sacct(args):
+        calls.append(args)
+        return "m1-1|1.0|\nm2-1|1.1|\n", ""
+
+    monkeypatch.setattr(stepIdResolver, "sacct", sacct)
+    resolved = {}
+    resolver = StepIdResolver(resolved.__setitem__, None, interval=0.05)
+    resolver.add("m1-1")
+    resolver.add("m2-1")
+    assert "m1-1" in resolver
+
+    assert _wait_for(lambda: len(resolved) == 2)
+    assert resolved == {"m1-1": "1.0", "m2-1": "1.1"}
+    assert len(calls) == 1
+    assert "m1-1" not in resolver
+
+
+def test_resolver_timeout(monkeypatch):
+    def sacct(args):
+        raise LauncherError("sacct not available")
+
+    monkeypatch.setattr(stepIdResolver, "sacct", sacct)
+    expired = []
+    resolver = StepIdResolver(None, expired.append, interval=0.01, timeout=0.05)
+    resolver.add("m1-1")
+    assert _wait_for(lambda: expired)
+    assert expired == ["m1-1"]
+
+
+def test_resolver_remove(monkeypatch):
+    monkeypatch.setattr(stepIdResolver, "sacct", lambda args: ("m1-1|1.0|", ""))
+    resolved = []
+    resolver = StepIdResolver(lambda *args: resolved.append(args), None, interval=0.1)
+    resolver.add("m1-1")
+    resolver.remove("m1-1")
+    assert _wait_for(lambda: not resolver._running)
+    assert resolved == []
+
+
+def test_resolver_timeout_from_config(monkeypatch):
+    monkeypatch.setenv("SMARTSIM_STEP_ID_TIMEOUT", "120")
+    assert StepIdResolver(None, None).timeout == 120
+
+
+class SavedOrchestrator:
+    def __init__(self, path):
+        self.path = path
+
+
+class SavedJob:
+    def __init__(self, name):
+        self.name = name
+
+
+def test_saved_orchestrator_gets_late_step_ids(fileutils):
+    controller = Controller("slurm")
+    launcher = controller._launcher
+    orchestrator = SavedOrchestrator(fileutils.make_test_dir())
+
+    # the id of the srun step is not known when the orchestrator is saved
+    launcher.step_mapping.add("orc_0-1", None, "1234", False)
+    controller._jobs.db_jobs["orc_0"] = SavedJob("orc_0-1")
+    controller._save_orchestrator(orchestrator)
+
+    launcher._set_step_id("orc_0-1", "56.0")
+    with open(osp.join(orchestrator.path, "smartsim_db.dat"), "rb") as dat_file:
+        steps = pickle.load(dat_file)["steps"]
+    assert steps[0].step_id == "56.0"
+    assert steps[0].managed
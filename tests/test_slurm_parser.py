@@ -251,3 +251,39 @@ def test_parse_sacct_status_2():
     status = ("FAILED", "1")
     parsed_status = slurmParser.parse_sacct(output, "22999.1")
     assert status == parsed_status
+
+
+def test_parse_sacct_steps():
+    """test the status of every id is parsed as jobid_exact_match would"""
+    output = (
+        "1234.batch|RUNNING|0:0|\n"
+        "1234|PENDING|0:0|\n"
+        "1234.1|FAILED|1:0|\n"
+        "1234.10|COMPLETED|0:0|\n"
+        "12345|CANCELLED|0:15|\n"
+    )
+    steps = slurmParser.parse_sacct_steps(output)
+    for job_id in ("1234", "1234.batch", "1234.1", "1234.10", "12345", "123"):
+        expected = ("PENDING", None)
+        for line in output.split("\n"):
+            line = line.split("|")
+            if len(line) >= 3 and slurmParser.jobid_exact_match(line[0], job_id):
+                expected = (line[1], line[2].split(":")[0])
+                break
+        assert steps.get(job_id, ("PENDING", None)) == expected
+        assert slurmParser.parse_sacct(output, job_id) == expected
+    assert steps["1234"] == ("RUNNING", "0")
+
+
+def test_parse_sacct_step_ids():
+    output = (
+        "SmartSim|119225|\n"
+        "extern|119225.extern|\n"
+        "m1-119225.0|119225.0|\n"
+        "m2-119225.1|119225.1|\n"
+        "m1-119225.0|119225.4|"
+    )
+    step_ids = slurmParser.parse_step_ids_from_sacct(
+        output, ["m1-119225.0", "m2-119225.1", "m3-119225.2"]
+    )
+    assert step_ids == {"m1-119225.0": "119225.4", "m2-119225.1": "119225.1"}
@@ -0,0 +1,104 @@
+import queue
+import time
+
+import pytest
+
+from smartsim import Experiment, status
+from smartsim.error import SmartSimError
+
+"""
+Test subscribing to and waiting on status changes
+"""
+
+
+def test_wait_first_and_all_completed(fileutils):
+    exp_name = "test-wait-completed"
+    exp = Experiment(exp_name, launcher="local")
+    test_dir = fileutils.make_test_dir()
+
+    script = fileutils.get_test_conf_path("sleep.py")
+    fast = exp.create_model(
+        "fast", exp.create_run_settings("python", f"{script} --time=1")
+    )
+    slow = exp.create_model(
+        "slow", exp.create_run_settings("python", f"{script} --time=5")
+    )
+    fast.set_path(test_dir)
+    slow.set_path(test_dir)
+
+    exp.start(fast, slow, block=False)
+    done, not_done = exp.wait(fast, slow, return_when=status.FIRST_COMPLETED)
+    assert done == [fast]
+    assert not_done == [slow]
+
+    done, not_done = exp.wait(fast, slow, return_when=status.ALL_COMPLETED)
+    assert not not_done
+    assert exp.get_status(fast, slow) == [status.STATUS_COMPLETED] * 2
+
+
+def test_wait_timeout(fileutils):
+    exp_name = "test-wait-timeout"
+    exp = Experiment(exp_name, launcher="local")
+    test_dir = fileutils.make_test_dir()
+
+    script = fileutils.get_test_conf_path("sleep.py")
+    settings = exp.create_run_settings("python", f"{script} --time=10")
+    model = exp.create_model("model", settings)
+    model.set_path(test_dir)
+
+    exp.start(model, block=False)
+    start = time.time()
+    done, not_done = exp.wait(model, timeout=1)
+    assert time.time() - start < 5
+    assert not done
+    assert not_done == [model]
+    exp.stop(model)
+
+
+def test_subscribe_ensemble(fileutils):
+    exp_name = "test-subscribe-ensemble"
+    exp = Experiment(exp_name, launcher="local")
+    test_dir = fileutils.make_test_dir()
+
+    script = fileutils.get_test_conf_path("sleep.py")
+    settings = exp.create_run_settings("python", f"{script} --time=1")
+    ensemble = exp.create_ensemble("e1", run_settings=settings, replicas=2)
+    ensemble.set_path(test_dir)
+
+    callback_events = []
+    exp.subscribe(ensemble, callback=callback_events.append)
+    subscription = exp.subscribe(ensemble)
+
+    exp.start(ensemble, block=False)
+    exp.wait(ensemble)
+
+    completed = set()
+    while len(completed) < 2:
+        event = subscription.events.get(timeout=10)
+        if event.status == status.STATUS_COMPLETED:
+            completed.add(event.entity.name)
+    assert completed == {model.name for model in ensemble}
+
+    callback_completed = [
+        event for event in callback_events if event.status == status.STATUS_COMPLETED
+    ]
+    assert len(callback_completed) == 2
+
+    subscription.cancel()
+    exp.start(ensemble, block=False)
+    exp.wait(ensemble)
+    with pytest.raises(queue.Empty):
+        subscription.events.get_nowait()
+
+
+def test_wait_errors(fileutils):
+    exp_name = "test-wait-errors"
+    exp = Experiment(exp_name, launcher="local")
+    script = fileutils.get_test_conf_path("sleep.py")
+    settings = exp.create_run_settings("python", f"{script} --time=1")
+    model = exp.create_model("model", settings)
+
+    with pytest.raises(SmartSimError):
+        exp.wait(model)
+    with pytest.raises(ValueError):
+        exp.wait(model, return_when="SOME_COMPLETED")
@@ -0,0 +1,39 @@
+from smartsim._core.launcher.stepMapping import StepMap, StepMapping
+
+
+def _create_mapping():
+    mapping = StepMapping()
+    mapping.add("batch", step_id="100", managed=True)
+    mapping.add("srun", step_id="101.0", task_id="2001", managed=True)
+    mapping.add("mpirun", task_id="2002", managed=False)
+    return mapping
+
+
+def test_get_task_id():
+    mapping = _create_mapping()
+    assert mapping.get_task_id("101.0") == "2001"
+    assert mapping.get_task_id("100") is None
+    assert mapping.get_task_id("102") is None
+
+
+def test_get_task_ids():
+    mapping = _create_mapping()
+    task_ids = mapping.get_task_ids(["100", "101.0", "102"])
+    assert task_ids == [None, "2001", None]
+
+
+def test_reverse_index_updated_on_set():
+    mapping = _create_mapping()
+    mapping["srun"] = StepMap("101.1", "2003", True)
+    assert mapping.get_task_id("101.0") is None
+    assert mapping.get_task_id("101.1") == "2003"
+
+
+def test_partitioned_ids_match_get_ids():
+    mapping = _create_mapping()
+    names = ["batch", "srun", "mpirun", "not-launched"]
+    managed, unmanaged = mapping.get_partitioned_ids(names)
+    assert managed == mapping.get_ids(names, managed=True)
+    assert unmanaged == mapping.get_ids(names, managed=False)
+    assert managed == (["batch", "srun"], ["100", "101.0"])
+    assert unmanaged == (["mpirun"], ["2002"])
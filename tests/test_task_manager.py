@@ -0,0 +1,209 @@
+import os
+import time
+from subprocess import DEVNULL
+
+import psutil
+import pytest
+
+from smartsim._core.launcher import taskManager
+from smartsim._core.launcher.taskManager import TaskHistory, TaskManager
+
+
+def _wait_for_history(tm, task_id, timeout=10):
+    start = time.time()
+    while time.time() - start < timeout:
+        record = tm.task_history.get(task_id)
+        if record is not None:
+            return record
+        time.sleep(0.01)
+    raise AssertionError(f"Task {task_id} was not recorded")
+
+
+def _has_pidfd():
+    pidfd = taskManager._open_pidfd(os.getpid())
+    if pidfd is None:
+        return False
+    os.close(pidfd)
+    return True
+
+
+def test_task_completion_recorded_on_exit():
+    tm = TaskManager()
+    start = time.time()
+    task_id = tm.start_task(["sleep", "0.1"], ".", out=DEVNULL, err=DEVNULL)
+    assert tm.actively_monitoring
+
+    rc, _, _ = _wait_for_history(tm, task_id)
+    assert rc == 0
+    if _has_pidfd():
+        # event driven monitors report well before TM_INTERVAL
+        assert time.time() - start < taskManager.TM_INTERVAL
+
+    status, rc, _, _ = tm.get_task_update(task_id)
+    assert status == "Completed"
+    assert rc == 0
+
+
+def test_task_failure_recorded_with_polling(monkeypatch):
+    monkeypatch.setattr(taskManager, "_open_pidfd", lambda pid: None)
+    tm = TaskManager()
+    task_id = tm.start_task(
+        ["sh", "-c", "sleep 0.5; exit 3"], ".", out=DEVNULL, err=DEVNULL
+    )
+
+    rc, _, _ = _wait_for_history(tm, task_id)
+    assert rc == 3
+    status, _, _, _ = tm.get_task_update(task_id)
+    assert status == "Failed"
+
+
+def test_monitor_exits_when_idle():
+    tm = TaskManager()
+    task_id = tm.start_task(["sleep", "0.1"], ".", out=DEVNULL, err=DEVNULL)
+    _wait_for_history(tm, task_id)
+
+    start = time.time()
+    while tm.actively_monitoring and time.time() - start < 5:
+        time.sleep(0.01)
+    assert not tm.actively_monitoring
+    assert len(tm) == 0
+
+
+def test_adopted_task_is_polled():
+    proc = psutil.Popen(["sleep", "0.5"], stdout=DEVNULL, stderr=DEVNULL)
+    tm = TaskManager()
+    tm.add_existing(proc.pid)
+    assert tm.actively_monitoring
+
+    task_id = str(proc.pid)
+    assert task_id not in tm._pidfds
+    # reap the child as the process adopting it would not own it
+    proc.wait()
+    rc, _, _ = _wait_for_history(tm, task_id)
+    assert rc == 0
+
+
+def test_stop_monitoring_wakes_monitor():
+    tm = TaskManager()
+    task_id = tm.start_task(["sleep", "10"], ".", out=DEVNULL, err=DEVNULL)
+    tm.actively_monitoring = False
+    tm.remove_task(task_id)
+    assert len(tm) == 0
+
+
+def test_remove_vanished_task(monkeypatch):
+    tm = TaskManager()
+    task_id = tm.start_task(["sleep", "10"], ".", out=DEVNULL, err=DEVNULL)
+    task = tm[task_id]
+
+    def kill(timeout=10):
+        raise psutil.NoSuchProcess(int(task_id))
+
+    monkeypatch.setattr(task, "kill", kill)
+    tm.remove_task(task_id)
+    assert len(tm) == 0
+    assert task_id not in tm._pidfds
+    task.process.kill()
+    task.process.wait()
+
+
+def test_unknown_task_update():
+    tm = TaskManager()
+    assert tm.get_task_update("1") == ("Completed", None, None, None)
+    with pytest.raises(KeyError):
+        tm["1"]
+
+
+def test_task_update_after_eviction():
+    tm = TaskManager()
+    tm.task_history = TaskHistory(max_size=1)
+    tm.add_task_history("1", 1)
+    tm.add_task_history("2", 0)
+    assert tm.get_task_update("1") == ("Failed", 1, None, None)
+    # reading the next record evicts the first one
+    assert tm.get_task_update("2") == ("Completed", 0, None, None)
+    assert "1" not in tm.task_history
+    assert tm.get_task_update("1") == ("Completed", None, None, None)
+
+
+def test_output_streamed_to_files(fileutils):
+    test_dir = fileutils.make_test_dir()
+    out_file = os.path.join(test_dir, "task.out")
+    err_file = os.path.join(test_dir, "task.err")
+
+    # far more output than fits in a pipe buffer
+    cmd = "head -c 4000000 /dev/zero | tr '\\0' x; echo done; echo oops >&2; exit 2"
+    tm = TaskManager()
+    task_id = tm.start_task(
+        ["sh", "-c", cmd], test_dir, output_files=(out_file, err_file)
+    )
+
+    rc, out, err = _wait_for_history(tm, task_id)
+    assert rc == 2
+    assert len(out) == taskManager.OUTPUT_TAIL_SIZE
+    assert out.endswith("xxdone\n")
+    assert err == "oops\n"
+    assert os.path.getsize(out_file) == 4000000 + len("done\n")
+    with open(err_file) as f:
+        assert f.read() == "oops\n"
+
+
+def test_killed_task_output_captured():
+    tm = TaskManager()
+    task_id = tm.start_task(["sh", "-c", "echo started; sleep 10"], ".")
+    time.sleep(0.5)
+    tm.remove_task(task_id)
+
+    rc, out, _ = tm.task_history[task_id]
+    assert rc != 0
+    assert out == "started\n"
+
+
+def test_history_drops_output():
+    history = TaskHistory(max_size=2)
+    history.add("1", 1, "out-1", "err-1")
+    history.add("2", 0, "out-2", None)
+    assert history["1"] == (1, "out-1", "err-1")
+
+    # third record with output drops the output of the oldest
+    history.add("3", 0, "out-3", None)
+    assert history["1"] == (1, None, None)
+    assert history["2"] == (0, "out-2", None)
+
+
+def test_history_evicts_read_records():
+    history = TaskHistory(max_size=2)
+    for task_id in ("1", "2", "3"):
+        history.add(task_id, 0)
+
+    # unread records are not evicted by reads
+    assert len(history) == 3
+
+    for task_id in ("1", "2", "3"):
+        assert history.read(task_id) == (0, None, None)
+    assert "1" not in history
+    assert len(history) == 2
+    assert history.read("1") is None
+
+
+def test_history_evicts_old_unread_records(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(taskManager.time, "time", lambda: now[0])
+    history = TaskHistory(max_size=2, max_age=10)
+    history.add("1", 1)
+    now[0] += 5
+    history.add("2", 0)
+    assert len(history) == 2
+
+    # records are expired when new ones are added
+    now[0] += 6
+    history.add("3", 0)
+    assert "1" not in history
+    assert "2" in history
+    assert history.read("2") == (0, None, None)
+
+    # read records are only evicted by later reads
+    now[0] += 20
+    history.add("4", 0)
+    assert "2" in history
+    assert "3" not in history